@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Compare draw times of the divider and static layout paths of fixed_size_subplots."""
+
+import time
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import matplotlib.pyplot as plt
+
+import ctleelab_plothelper.plothelpers as ph
+
+GRIDS = [(1, 1), (5, 5), (10, 10), (20, 20), (40, 10), (50, 50)]
+REPEATS = 3
+
+
+def time_draws(nrows, ncols, static_layout):
+    """Return the first draw time and the mean repeated draw time in seconds."""
+    fig, _ = ph.fixed_size_subplots(
+        nrows,
+        ncols,
+        subwidth=0.5,
+        subheight=0.5,
+        wmargin=0.1,
+        hmargin=0.1,
+        static_layout=static_layout,
+        dpi=50,
+    )
+    # Ticks and labels are not what is being measured here
+    for ax in fig.axes:
+        ax.set_axis_off()
+
+    start = time.perf_counter()
+    fig.canvas.draw()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fig.canvas.draw()
+    repeat = (time.perf_counter() - start) / REPEATS
+
+    plt.close(fig)
+    return first, repeat
+
+
+def main():
+    print(
+        f"{'grid':>8} {'divider first':>14} {'static first':>13} "
+        f"{'divider draw':>13} {'static draw':>12} {'speedup':>8}"
+    )
+    for nrows, ncols in GRIDS:
+        div_first, div_draw = time_draws(nrows, ncols, static_layout=False)
+        st_first, st_draw = time_draws(nrows, ncols, static_layout=True)
+        print(
+            f"{nrows:>3}x{ncols:<4} {div_first:>14.4f} {st_first:>13.4f} "
+            f"{div_draw:>13.4f} {st_draw:>12.4f} {div_draw / st_draw:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
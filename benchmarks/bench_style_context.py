@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Compare entering plt.style.context with the compiled style_context."""
+
+import timeit
+
+import matplotlib.pyplot as plt
+
+from ctleelab_plothelper.styles import style_context
+
+STACK = [
+    "ctleelab_plothelper.base",
+    "ctleelab_plothelper.light",
+    "ctleelab_plothelper.transparent",
+]
+NUMBER = 2000
+
+
+def enter_pyplot():
+    with plt.style.context(STACK):
+        pass
+
+
+def enter_compiled():
+    with style_context(STACK):
+        pass
+
+
+def main():
+    for name, func in (
+        ("plt.style.context", enter_pyplot),
+        ("style_context", enter_compiled),
+    ):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:>18}: {seconds * 1e6:10.1f} us per context")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Benchmark suite of the layout, colorbar and export paths with stored baselines.
+
+Run with a baseline file to compare against it, or with ``--update`` to (re)write it::
+
+    python benchmarks/suite.py --baseline benchmarks/baselines/local.json --update
+    python benchmarks/suite.py --baseline benchmarks/baselines/local.json
+
+The comparison exits with status 1 if any case is slower than its baseline by more than
+the tolerance. Timings are machine specific, so baselines should be recorded on the
+machine that runs the comparison.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.styles import style_context
+
+GRIDS = [(1, 1), (5, 5), (10, 10), (20, 20)]
+COLORBAR_PANELS = (4, 4)
+DRAW_GRID = (10, 10)
+FORMATS = ["png", "svg", "pdf"]
+STYLES = {
+    "light": ["ctleelab_plothelper.base", "ctleelab_plothelper.light"],
+    "dark": ["ctleelab_plothelper.base", "ctleelab_plothelper.dark"],
+    "transparent": [
+        "ctleelab_plothelper.base",
+        "ctleelab_plothelper.light",
+        "ctleelab_plothelper.transparent",
+    ],
+}
+
+
+def timed(func, *args):
+    """Run func and return the elapsed time in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def bench_layout(nrows, ncols):
+    """Create a fixed size grid and resolve its layout."""
+
+    def run():
+        fig, _ = ph.fixed_size_subplots(
+            nrows, ncols, subwidth=0.5, subheight=0.5, wmargin=0.2, hmargin=0.2
+        )
+        # Ticks and labels are covered by the draw cases
+        for ax in fig.axes:
+            ax.set_axis_off()
+        fig.draw_without_rendering()
+        plt.close(fig)
+
+    return timed(run)
+
+
+def bench_colorbars(fixed):
+    """Add a colorbar next to every panel of a grid and resolve the layout."""
+    nrows, ncols = COLORBAR_PANELS
+    fig, axs = ph.fixed_size_subplots(nrows, ncols, subwidth=1, subheight=1, dpi=50)
+    data = np.arange(100.0).reshape(10, 10)
+    images = [ax.imshow(data) for ax in axs.flat]
+
+    def run():
+        for ax, im in zip(axs.flat, images):
+            if fixed:
+                ph.add_fixed_colorbar(im, ax, aspect=20)
+            else:
+                ph.add_colorbar(im, ax)
+        fig.draw_without_rendering()
+
+    seconds = timed(run)
+    plt.close(fig)
+    return seconds
+
+
+def draw_figure():
+    nrows, ncols = DRAW_GRID
+    fig, axs = ph.fixed_size_subplots(
+        nrows, ncols, subwidth=0.5, subheight=0.5, wmargin=0.2, hmargin=0.2, dpi=50
+    )
+    x = np.linspace(0, 10, 200)
+    for ax in axs.flat:
+        ax.plot(x, np.sin(x))
+    return fig
+
+
+def bench_first_draw():
+    """Draw a fresh figure once."""
+    fig = draw_figure()
+    seconds = timed(fig.canvas.draw)
+    plt.close(fig)
+    return seconds
+
+
+def bench_repeat_draw():
+    """Draw an already drawn figure again."""
+    fig = draw_figure()
+    fig.canvas.draw()
+    seconds = timed(fig.canvas.draw)
+    plt.close(fig)
+    return seconds
+
+
+def bench_savefig(style, fmt):
+    """Save a small two panel figure under a style stack."""
+    with style_context(STYLES[style]):
+        fig, axs = ph.fixed_size_subplots(1, 2, subwidth=1.5, subheight=1.5)
+        x = np.linspace(0, 10, 500)
+        axs[0].plot(x, np.sin(x), label="sin")
+        axs[0].legend()
+        axs[1].imshow(np.outer(np.sin(x[:100]), np.cos(x[:100])))
+        axs[1].set_title("Image")
+        fig.canvas.draw()
+        seconds = timed(lambda: fig.savefig(io.BytesIO(), format=fmt))
+        plt.close(fig)
+    return seconds
+
+
+def cases():
+    """All benchmark cases as (name, function) pairs."""
+    yield from (
+        (f"layout/{nrows}x{ncols}", lambda n=nrows, m=ncols: bench_layout(n, m))
+        for nrows, ncols in GRIDS
+    )
+    yield "colorbar/fixed", lambda: bench_colorbars(True)
+    yield "colorbar/divider", lambda: bench_colorbars(False)
+    yield "draw/first", bench_first_draw
+    yield "draw/repeat", bench_repeat_draw
+    yield from (
+        (f"savefig/{style}/{fmt}", lambda s=style, f=fmt: bench_savefig(s, f))
+        for style in STYLES
+        for fmt in FORMATS
+    )
+
+
+def run_cases(repeat, pattern=None):
+    """Run each case *repeat* times and collect the median and minimum in seconds."""
+    results = {}
+    for name, func in cases():
+        if pattern and pattern not in name:
+            continue
+        func()  # warm up imports, fonts and caches
+        samples = [func() for _ in range(repeat)]
+        results[name] = {
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "repeat": repeat,
+        }
+    return results
+
+
+def metadata():
+    return {
+        "python": platform.python_version(),
+        "matplotlib": matplotlib.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print a table of the results against a baseline and return the regressed cases."""
+    regressed = []
+    print(f"{'case':<26}{'median ms':>11}{'baseline ms':>13}{'ratio':>8}  status")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<26}{result['median'] * 1e3:>11.2f}{'-':>13}{'-':>8}  new")
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + tolerance:
+            status = "REGRESSED"
+            regressed.append(name)
+        elif ratio < 1 - tolerance:
+            status = "faster"
+        else:
+            status = "ok"
+        print(
+            f"{name:<26}{result['median'] * 1e3:>11.2f}{base['median'] * 1e3:>13.2f}"
+            f"{ratio:>8.2f}  {status}"
+        )
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="JSON file of baseline timings")
+    parser.add_argument(
+        "--update", action="store_true", help="write the results to the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline (default: 0.25)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    parser.add_argument("--filter", help="only run cases containing this string")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.repeat, args.filter)
+
+    if args.baseline and (args.update or not os.path.exists(args.baseline)):
+        stored = {}
+        if os.path.exists(args.baseline):
+            # Keep the cases which were filtered out of this run
+            with open(args.baseline) as f:
+                stored = json.load(f)["results"]
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {"meta": metadata(), "results": {**stored, **results}}, f, indent=2
+            )
+        compare(results, {}, args.tolerance)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        baseline = stored["results"]
+        if stored.get("meta") != metadata():
+            print(f"Note: baseline recorded with {stored.get('meta')}")
+    regressed = compare(results, baseline, args.tolerance)
+    if regressed:
+        print(f"{len(regressed)} case(s) regressed by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
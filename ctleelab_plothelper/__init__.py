@@ -0,0 +1,137 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Plotting utilities for matplotlib.
+
+Submodules and the public helpers below are loaded lazily on first access, so importing the
+package does not import matplotlib, pyplot or a GUI backend.
+
+Concurrency: independent figures may be built and saved in parallel threads when they are
+created with ``fixed_size_subplots(..., pyplot=False)`` and every helper is given its axes
+explicitly. The helpers then only touch the figure and axes they are given. pyplot, style
+contexts, `draft_mode` and `profiling` change global state and must not be used while
+other threads are rendering; select the style once before starting the threads. A figure must
+only be used by one thread at a time. Matplotlib still draws one figure at a time per
+process, so use processes, e.g. `farm.RenderFarm`, to render in parallel.
+"""
+
+import importlib
+
+from typing import Any, List
+
+_submodules = [
+    "aio",
+    "cache",
+    "categorical",
+    "decimate",
+    "dividers",
+    "draft",
+    "export",
+    "farm",
+    "imaging",
+    "layout",
+    "live",
+    "plothelpers",
+    "pool",
+    "profiling",
+    "rasterize",
+    "styles",
+    "svgopt",
+    "util",
+]
+
+_attributes = {
+    "AsyncSaver": "aio",
+    "save_async": "aio",
+    "save_many_async": "aio",
+    "CacheStats": "cache",
+    "FigureCache": "cache",
+    "hash_inputs": "cache",
+    "CategoricalColorbar": "categorical",
+    "CategoryLocator": "categorical",
+    "categorical_colorbar": "categorical",
+    "DecimatedLine": "decimate",
+    "plot_decimated": "decimate",
+    "FixedSizeDivider": "dividers",
+    "fixed_size_divider": "dividers",
+    "draft_mode": "draft",
+    "publish": "draft",
+    "ExportResult": "export",
+    "format_results": "export",
+    "frozen_layout": "export",
+    "save_all": "export",
+    "RenderFarm": "farm",
+    "RenderJob": "farm",
+    "RenderResult": "farm",
+    "render_batch": "farm",
+    "block_reduce": "imaging",
+    "decimated_imshow": "imaging",
+    "FixedLayoutEngine": "layout",
+    "fixed_size_geometry": "layout",
+    "fixed_size_mosaic_geometry": "layout",
+    "get_panel_bounds": "layout",
+    "get_panel_size_inches": "layout",
+    "FrameSink": "live",
+    "LiveFigure": "live",
+    "add_colorbar": "plothelpers",
+    "add_fixed_colorbar": "plothelpers",
+    "add_shared_colorbar": "plothelpers",
+    "custom_cmap": "plothelpers",
+    "discrete_cmap": "plothelpers",
+    "fixed_colorbar_axes": "plothelpers",
+    "fixed_size_mosaic": "plothelpers",
+    "fixed_size_subplots": "plothelpers",
+    "get_aspect": "plothelpers",
+    "get_renderer": "plothelpers",
+    "uses_pyplot": "plothelpers",
+    "FigurePool": "pool",
+    "PoolStats": "pool",
+    "RenderProfile": "profiling",
+    "disable_profiling": "profiling",
+    "enable_profiling": "profiling",
+    "profile_render": "profiling",
+    "measure_rasterization": "rasterize",
+    "rasterize_heavy": "rasterize",
+    "compile_style": "styles",
+    "style_context": "styles",
+    "SvgStats": "svgopt",
+    "optimize_svg": "svgopt",
+    "equalize_aspect": "util",
+    "get_aspects": "util",
+    "get_data_scales": "util",
+    "get_limits": "util",
+    "get_panel_rects": "util",
+    "get_panel_sizes": "util",
+}
+
+__all__ = sorted(_attributes)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _attributes:
+        module = importlib.import_module(f"{__name__}.{_attributes[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name == "__version__":
+        try:
+            from ._version import version
+        except ImportError:
+            version = "unknown"
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_submodules) | set(_attributes))
@@ -0,0 +1,390 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Saving figures from asyncio code without blocking the event loop.
+
+Figures are rendered in a thread or process executor. A semaphore per event loop bounds the
+number of saves in flight, so callers awaiting a save are held back while the executor is
+busy. In a thread executor the figure is used by the worker thread until the save finishes,
+see the concurrency notes of the package; figures built with
+``fixed_size_subplots(..., pyplot=False)`` are recommended.
+
+Matplotlib draws one figure at a time per process, so threads keep the event loop responsive
+but do not render in parallel. A process executor renders in parallel at the cost of
+pickling the figure, which pays off for expensive renders such as high DPI rasters. The
+figure is pickled in a thread, and the worker saves it with the rcParams active when the
+save was started.
+"""
+
+import asyncio
+import io
+import os
+import pickle
+import tempfile
+import threading
+import weakref
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+
+from .export import _init_worker, _rc_snapshot
+from .plothelpers import uses_pyplot
+
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+PathLike = Union[str, os.PathLike]
+
+
+class AsyncSaver:
+    """
+    Save figures from coroutines in an executor with a bounded number of saves in flight.
+
+    Use as an async context manager, or call `shutdown` when done.
+
+    Example:
+        >>> async with AsyncSaver(max_concurrency=4) as saver:
+        ...     png = await saver.save(fig, format="png", dpi=600)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        kind: str = "thread",
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            max_concurrency (int, optional): Maximum number of saves in flight; further
+                saves wait for a free slot. Defaults to 4.
+            kind (str, optional): "thread" or "process" executor created by the saver.
+                Defaults to "thread".
+            executor (Executor, optional): Use this executor instead, which is then not shut
+                down by the saver. Its kind is given by *kind*. Defaults to None.
+
+        Raises:
+            ValueError: If *kind* is unknown or *max_concurrency* is not positive.
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(
+                f"Unknown executor kind {kind!r}, expected 'thread' or 'process'."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.max_concurrency = max_concurrency
+        self.kind = kind
+        self._owned = executor is None
+        if executor is None:
+            if kind == "thread":
+                executor = ThreadPoolExecutor(max_concurrency, "ctleelab-save")
+            else:
+                executor = ProcessPoolExecutor(
+                    max_concurrency, initializer=_init_worker
+                )
+        self.executor = executor
+        # Semaphores are bound to the event loop they are used in
+        self._semaphores = weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ]()
+
+    async def __aenter__(self) -> "AsyncSaver":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the executor if it was created by the saver.
+
+        Args:
+            wait (bool, optional): Wait for running saves to finish. Defaults to True.
+        """
+        if self._owned:
+            self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def save(
+        self,
+        fig: Figure,
+        path: Optional[PathLike] = None,
+        format: Optional[str] = None,
+        close: bool = True,
+        **savefig_kw: Any,
+    ) -> Union[bytes, str]:
+        """Save a figure in the executor.
+
+        A file is written to a temporary name next to *path* and only renamed once the save
+        succeeded, so a failed or cancelled save leaves no partial file. If the coroutine is
+        cancelled, the figure is closed once the executor no longer uses it.
+
+        Args:
+            fig (Figure): Figure to save, not to be modified until the save finished
+            path (PathLike, optional): Output file. Defaults to None, returning the bytes.
+            format (str, optional): Output format. Defaults to the extension of *path*, or
+                ``savefig.format``.
+            close (bool, optional): Close the figure after saving. Defaults to True.
+            **savefig_kw: Additional keyword arguments passed to savefig().
+
+        Returns:
+            bytes | str: The file contents, or the path written
+        """
+        fmt = _format_of(path, format)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        try:
+            await semaphore.acquire()
+        except asyncio.CancelledError:
+            if close:
+                _close(fig)
+            raise
+
+        tmp = None
+        try:
+            if path is not None:
+                tmp = _temporary_path(path, fmt)
+            future = await self._submit(fig, tmp, fmt, savefig_kw)
+        except BaseException:
+            semaphore.release()
+            if close:
+                _close(fig)
+            _remove(tmp)
+            raise
+        if close and self.kind == "process":
+            # The worker renders its own copy
+            _close(fig)
+            close = False
+
+        cancelled = threading.Event()
+
+        def finish():
+            semaphore.release()
+            if close:
+                _close(fig)
+            if cancelled.is_set():
+                _remove(tmp)
+
+        def done(_: Future):
+            # The figure is only released once the executor is done with it
+            try:
+                loop.call_soon_threadsafe(finish)
+            except RuntimeError:
+                # The event loop is closed
+                if close:
+                    _close(fig)
+                if cancelled.is_set():
+                    _remove(tmp)
+
+        future.add_done_callback(done)
+        try:
+            data = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            if future.done():
+                _remove(tmp)
+            raise
+        except BaseException:
+            _remove(tmp)
+            raise
+        if path is None:
+            return data
+        os.replace(tmp, path)
+        return os.fspath(path)
+
+    async def _submit(
+        self, fig: Figure, tmp: Optional[str], fmt: str, savefig_kw: Dict[str, Any]
+    ) -> Future:
+        if self.kind == "process":
+            rc = _rc_snapshot()
+            # Pickling a large figure would block the event loop
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, pickle.dumps, fig)
+            return self.executor.submit(_save_pickled, data, rc, tmp, fmt, savefig_kw)
+        return self.executor.submit(_save, fig, tmp, fmt, savefig_kw)
+
+    async def save_many(
+        self,
+        figs: Iterable[Figure],
+        paths: Optional[Iterable[Optional[PathLike]]] = None,
+        format: Optional[str] = None,
+        close: bool = True,
+        return_exceptions: bool = False,
+        **savefig_kw: Any,
+    ) -> List[Union[bytes, str, BaseException]]:
+        """Save several figures, at most *max_concurrency* at a time.
+
+        Cancelling the batch cancels every save and closes every figure.
+
+        Args:
+            figs (Iterable[Figure]): Figures to save
+            paths (Iterable[PathLike], optional): Output file of each figure. Defaults to
+                None, returning the bytes.
+            format (str, optional): Output format, see `save`. Defaults to None.
+            close (bool, optional): Close the figures after saving. Defaults to True.
+            return_exceptions (bool, optional): Return exceptions of failed saves in place of
+                their results instead of raising the first. Defaults to False.
+            **savefig_kw: Additional keyword arguments passed to savefig().
+
+        Returns:
+            List[bytes | str | BaseException]: Result of each figure, in order
+        """
+        figs = list(figs)
+        paths = [None] * len(figs) if paths is None else list(paths)
+        if len(paths) != len(figs):
+            raise ValueError("paths must have one entry per figure.")
+        tasks = [
+            asyncio.ensure_future(self.save(fig, path, format, close, **savefig_kw))
+            for fig, path in zip(figs, paths)
+        ]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # gather leaves the other saves running if one failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+def _format_of(path: Optional[PathLike], format: Optional[str]) -> str:
+    if format is not None:
+        return format
+    if path is not None:
+        ext = os.path.splitext(os.fspath(path))[1]
+        if ext:
+            return ext[1:].lower()
+    return mpl.rcParams["savefig.format"]
+
+
+def _temporary_path(path: PathLike, fmt: str) -> str:
+    directory, name = os.path.split(os.path.abspath(os.fspath(path)))
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=f".{fmt}", dir=directory)
+    os.close(fd)
+    return tmp
+
+
+def _remove(path: Optional[str]):
+    if path is not None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _close(fig: Figure):
+    if uses_pyplot(fig):
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
+
+
+def _save(
+    fig: Figure, path: Optional[str], fmt: str, savefig_kw: Dict[str, Any]
+) -> Optional[bytes]:
+    """Save a figure to a file, or return its bytes."""
+    if path is not None:
+        fig.savefig(path, format=fmt, **savefig_kw)
+        return None
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, **savefig_kw)
+    return buf.getvalue()
+
+
+def _save_pickled(
+    data: bytes,
+    rc: Dict[str, Any],
+    path: Optional[str],
+    fmt: str,
+    savefig_kw: Dict[str, Any],
+) -> Optional[bytes]:
+    """Save a pickled figure in a worker process with rcParams *rc*."""
+    with mpl.rc_context(rc):
+        fig = pickle.loads(data)
+        try:
+            return _save(fig, path, fmt, savefig_kw)
+        finally:
+            _close(fig)
+
+
+_default_lock = threading.Lock()
+_default: Optional[AsyncSaver] = None
+
+
+def _default_saver() -> AsyncSaver:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = AsyncSaver(max_concurrency=min(4, os.cpu_count() or 1))
+        return _default
+
+
+async def save_async(
+    fig: Figure,
+    path: Optional[PathLike] = None,
+    format: Optional[str] = None,
+    close: bool = True,
+    saver: Optional[AsyncSaver] = None,
+    **savefig_kw: Any,
+) -> Union[bytes, str]:
+    """Save a figure without blocking the event loop, see `AsyncSaver.save`.
+
+    Args:
+        fig (Figure): Figure to save, not to be modified until the save finished
+        path (PathLike, optional): Output file. Defaults to None, returning the bytes.
+        format (str, optional): Output format. Defaults to the extension of *path*, or
+            ``savefig.format``.
+        close (bool, optional): Close the figure after saving. Defaults to True.
+        saver (AsyncSaver, optional): Saver to use. Defaults to a shared thread saver with up
+            to 4 saves in flight.
+        **savefig_kw: Additional keyword arguments passed to savefig().
+
+    Returns:
+        bytes | str: The file contents, or the path written
+    """
+    saver = saver or _default_saver()
+    return await saver.save(fig, path, format, close, **savefig_kw)
+
+
+async def save_many_async(
+    figs: Iterable[Figure],
+    paths: Optional[Iterable[Optional[PathLike]]] = None,
+    format: Optional[str] = None,
+    close: bool = True,
+    saver: Optional[AsyncSaver] = None,
+    return_exceptions: bool = False,
+    **savefig_kw: Any,
+) -> List[Union[bytes, str, BaseException]]:
+    """Save several figures without blocking the event loop, see `AsyncSaver.save_many`.
+
+    Args:
+        figs (Iterable[Figure]): Figures to save
+        paths (Iterable[PathLike], optional): Output file of each figure. Defaults to None,
+            returning the bytes.
+        format (str, optional): Output format. Defaults to None.
+        close (bool, optional): Close the figures after saving. Defaults to True.
+        saver (AsyncSaver, optional): Saver to use. Defaults to the shared thread saver.
+        return_exceptions (bool, optional): Return exceptions of failed saves in place of
+            their results. Defaults to False.
+        **savefig_kw: Additional keyword arguments passed to savefig().
+
+    Returns:
+        List[bytes | str | BaseException]: Result of each figure, in order
+    """
+    saver = saver or _default_saver()
+    return await saver.save_many(
+        figs, paths, format, close, return_exceptions, **savefig_kw
+    )
@@ -0,0 +1,333 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+
+from .export import save_all
+from .styles import StyleSpec, compile_style, style_context
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counts of a `FigureCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CachedFigure:
+    """Output files of a figure rendered through a `FigureCache`."""
+
+    key: str
+    hit: bool
+    paths: Dict[str, str] = field(default_factory=dict)
+
+
+def hash_inputs(*objs: Any) -> str:
+    """Content hash of plotting inputs.
+
+    Arrays are hashed from their buffers together with their dtype and shape, functions
+    from their source code together with their default arguments and closure variables,
+    `functools.partial` objects from their function and arguments, and containers
+    recursively. Other objects are pickled.
+
+    Args:
+        *objs: Objects to hash
+
+    Returns:
+        str: Hex digest
+    """
+    h = hashlib.sha256()
+    for obj in objs:
+        _update(h, obj)
+    return h.hexdigest()
+
+
+def _update(h: "hashlib._Hash", obj: Any, active: Optional[set] = None):
+    """Feed an object into a hash.
+
+    *active* holds the ids of the functions being hashed, so that a function referring to
+    itself through its closure is only hashed once.
+    """
+    if isinstance(obj, np.ndarray):
+        h.update(f"nd:{obj.dtype.str}:{obj.shape}:".encode())
+        if obj.dtype.hasobject:
+            h.update(pickle.dumps(obj.tolist()))
+        else:
+            h.update(memoryview(np.ascontiguousarray(obj)).cast("B"))
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"b:")
+        h.update(obj)
+    elif obj is None or isinstance(obj, (str, int, float, complex, bool)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)}[".encode())
+        for item in obj:
+            _update(h, item, active)
+        h.update(b"]")
+    elif isinstance(obj, Mapping):
+        h.update(f"map:{len(obj)}{{".encode())
+        for key in sorted(obj, key=repr):
+            _update(h, key, active)
+            _update(h, obj[key], active)
+        h.update(b"}")
+    elif isinstance(obj, functools.partial):
+        h.update(b"partial:")
+        _update(h, obj.func, active)
+        _update(h, obj.args, active)
+        _update(h, obj.keywords, active)
+    elif callable(obj) and hasattr(obj, "__code__"):
+        h.update(f"fn:{obj.__module__}.{obj.__qualname__}:".encode())
+        active = set() if active is None else active
+        if id(obj) in active:
+            h.update(b"recursive;")
+            return
+        try:
+            h.update(inspect.getsource(obj).encode())
+        except (OSError, TypeError):
+            h.update(obj.__code__.co_code)
+            h.update(repr(obj.__code__.co_consts).encode())
+        # The data a function was defined with, besides its code
+        active.add(id(obj))
+        _update(h, getattr(obj, "__defaults__", None), active)
+        _update(h, getattr(obj, "__kwdefaults__", None), active)
+        for cell in getattr(obj, "__closure__", None) or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                # The variable is not assigned yet
+                h.update(b"cell:empty;")
+            else:
+                _update(h, contents, active)
+        active.discard(id(obj))
+    else:
+        h.update(f"pickle:{type(obj).__qualname__}:".encode())
+        h.update(pickle.dumps(obj))
+
+
+def _style_items(style: Union[StyleSpec, Sequence[StyleSpec], None]) -> List[Any]:
+    """Hashable view of the rcParams a figure is rendered with."""
+    params = dict(dict.items(mpl.rcParams))
+    if style is not None:
+        params.update(compile_style(style))
+    return sorted((k, repr(v)) for k, v in params.items() if k != "backend")
+
+
+class FigureCache:
+    """
+    A content-addressed cache of saved figures.
+
+    A figure is identified by its plotting function's source, its arguments, the compiled
+    style stack and the layout parameters. Figures are saved deterministically so a cache hit
+    copies exactly the bytes a fresh render would write. Each entry is a directory below
+    *directory* whose modification time records the last use.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        """
+        Args:
+            directory (str | os.PathLike): Directory holding the cache entries
+            max_bytes (int, optional): Evict least recently used entries above this total
+                size. Defaults to None.
+            max_age (float, optional): Evict entries unused for this many seconds.
+                Defaults to None.
+        """
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = CacheStats()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+        self,
+        func: Callable[..., Figure],
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+        style: Union[StyleSpec, Sequence[StyleSpec], None] = None,
+        layout: Optional[Mapping[str, Any]] = None,
+        formats: Sequence[str] = ("png", "svg", "pdf"),
+        savefig_kw: Optional[Mapping[str, Any]] = None,
+    ) -> str:
+        """Cache key of a figure, see `render`.
+
+        Returns:
+            str: Hex digest identifying the output files
+        """
+        return hash_inputs(
+            mpl.__version__,
+            func,
+            tuple(args),
+            dict(kwargs or {}),
+            _style_items(style),
+            dict(layout or {}),
+            tuple(formats),
+            dict(savefig_kw or {}),
+        )
+
+    def render(
+        self,
+        func: Callable[..., Figure],
+        basename: str,
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+        formats: Sequence[str] = ("png", "svg", "pdf"),
+        style: Union[StyleSpec, Sequence[StyleSpec], None] = None,
+        layout: Optional[Mapping[str, Any]] = None,
+        **savefig_kw: Any,
+    ) -> CachedFigure:
+        """Save the figure built by ``func(*args, **kwargs)``, reusing cached files if unchanged.
+
+        Args:
+            func (Callable[..., Figure]): Function building the figure
+            basename (str): Output path without extension
+            args (Sequence[Any], optional): Positional arguments of *func*. Defaults to ().
+            kwargs (Mapping[str, Any], optional): Keyword arguments of *func*. Defaults to None.
+            formats (Sequence[str], optional): Output formats. Defaults to ("png", "svg", "pdf").
+            style (StyleSpec | Sequence[StyleSpec], optional): Style stack to render under with
+                `styles.style_context`. Defaults to the current rcParams.
+            layout (Mapping[str, Any], optional): Layout parameters used by *func*, e.g. the
+                arguments of `fixed_size_subplots`, if they are not among its arguments.
+                Defaults to None.
+            **savefig_kw: Additional keyword arguments passed to `export.save_all`.
+
+        Returns:
+            CachedFigure: The key, whether it was a hit, and the output paths
+        """
+        kwargs = dict(kwargs or {})
+        key = self.key(func, args, kwargs, style, layout, formats, savefig_kw)
+        entry = self._entry(key)
+        paths = {fmt: f"{basename}.{fmt}" for fmt in formats}
+
+        if all(os.path.isfile(self._file(entry, fmt)) for fmt in formats):
+            for fmt, path in paths.items():
+                shutil.copyfile(self._file(entry, fmt), path)
+            os.utime(entry)
+            self.stats.hits += 1
+            return CachedFigure(key, True, paths)
+
+        self.stats.misses += 1
+        fig = None
+        try:
+            if style is None:
+                fig = func(*args, **kwargs)
+                save_all(fig, basename, formats, deterministic=True, **savefig_kw)
+            else:
+                with style_context(style):
+                    fig = func(*args, **kwargs)
+                    save_all(fig, basename, formats, deterministic=True, **savefig_kw)
+        finally:
+            if fig is not None and fig.canvas.manager is not None:
+                import matplotlib.pyplot as plt
+
+                plt.close(fig)
+
+        self._store(entry, paths)
+        self.evict()
+        return CachedFigure(key, False, paths)
+
+    def evict(
+        self, max_bytes: Optional[int] = None, max_age: Optional[float] = None
+    ) -> int:
+        """Remove entries older than *max_age* and the least recently used above *max_bytes*.
+
+        Args:
+            max_bytes (int, optional): Size limit. Defaults to the limit of the cache.
+            max_age (float, optional): Age limit in seconds. Defaults to the limit of the cache.
+
+        Returns:
+            int: Number of entries removed
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age = self.max_age if max_age is None else max_age
+        if max_bytes is None and max_age is None:
+            return 0
+
+        now = time.time()
+        entries = sorted(self._entries(), key=lambda e: e[1], reverse=True)
+        total = 0
+        removed = 0
+        for path, mtime, nbytes in entries:
+            expired = max_age is not None and now - mtime > max_age
+            if expired or (max_bytes is not None and total + nbytes > max_bytes):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+            else:
+                total += nbytes
+        self.stats.evictions += removed
+        return removed
+
+    def size(self) -> int:
+        """Total size of the cached files in bytes."""
+        return sum(nbytes for _, _, nbytes in self._entries())
+
+    def clear(self):
+        """Remove every entry."""
+        for path, _, _ in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    @staticmethod
+    def _file(entry: str, fmt: str) -> str:
+        return os.path.join(entry, f"figure.{fmt}")
+
+    def _store(self, entry: str, paths: Dict[str, str]):
+        """Copy saved files into an entry, replacing it atomically."""
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".staging-")
+        try:
+            for fmt, path in paths.items():
+                shutil.copyfile(path, self._file(staging, fmt))
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _entries(self) -> List[tuple]:
+        """(path, last use, bytes) of every entry."""
+        entries = []
+        for item in os.scandir(self.directory):
+            if not item.is_dir() or item.name.startswith("."):
+                continue
+            nbytes = sum(f.stat().st_size for f in os.scandir(item.path))
+            entries.append((item.path, item.stat().st_mtime, nbytes))
+        return entries
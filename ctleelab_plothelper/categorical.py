@@ -0,0 +1,150 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import math
+
+from dataclasses import dataclass
+
+import numpy as np
+
+import matplotlib as mpl
+import matplotlib.ticker as mticker
+from matplotlib.axes import Axes
+from matplotlib.colors import BoundaryNorm, Colormap, ListedColormap, NoNorm
+from matplotlib.font_manager import FontProperties
+from matplotlib.image import AxesImage
+
+from .plothelpers import discrete_cmap, fixed_colorbar_axes
+
+import numpy.typing as npt
+from typing import Optional, Sequence, Union
+
+
+class CategoryLocator(mticker.Locator):
+    """
+    Locate as many category ticks as fit the pixel height of the axis at draw time.
+
+    Categories are the integers 0 to n - 1. When not every label fits, every k-th
+    category is labelled, with k chosen from the height of the axes in pixels and the
+    size of the tick labels.
+    """
+
+    def __init__(self, n: int, fontsize: Optional[float] = None, spacing: float = 1.5):
+        """
+        Args:
+            n (int): Number of categories
+            fontsize (float, optional): Label size in points. Defaults to ``ytick.labelsize``.
+            spacing (float, optional): Label pitch relative to the font size. Defaults to 1.5.
+        """
+        self.n = n
+        self.fontsize = fontsize
+        self.spacing = spacing
+
+    def __call__(self) -> npt.NDArray:
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin: float, vmax: float) -> npt.NDArray:
+        lo = max(0, math.ceil(min(vmin, vmax)))
+        hi = min(self.n - 1, math.floor(max(vmin, vmax)))
+        if hi < lo:
+            return np.array([], dtype=int)
+        step = max(1, math.ceil((hi - lo + 1) / self.max_labels()))
+        return np.arange(lo, hi + 1, step)
+
+    def max_labels(self) -> int:
+        """Number of labels which fit the current height of the axis."""
+        axes = getattr(self.axis, "axes", None)
+        if axes is None:
+            return self.n
+        fontsize = self.fontsize
+        if fontsize is None:
+            fontsize = FontProperties(
+                size=mpl.rcParams["ytick.labelsize"]
+            ).get_size_in_points()
+        dpi = axes.get_figure(root=True).dpi
+        label_px = fontsize * dpi / 72 * self.spacing
+        return max(1, int(axes.bbox.height // label_px))
+
+
+@dataclass
+class CategoricalColorbar:
+    """A colorbar of discrete categories drawn as a single image."""
+
+    ax: Axes
+    image: AxesImage
+    cmap: ListedColormap
+    norm: BoundaryNorm
+    labels: Sequence[str]
+    locator: CategoryLocator
+
+
+def categorical_colorbar(
+    ax: Axes,
+    ticklabels: Sequence[str],
+    cmap: Union[str, Colormap] = "RdPu",
+    label: Optional[str] = None,
+    aspect: float = 20,
+    pad: float = 0.05,
+    fontsize: Optional[float] = None,
+) -> CategoricalColorbar:
+    """Add a colorbar for many categories next to an axes with fixed non-floating subplots.
+
+    The colors are drawn as one image rather than one patch per category, and only the
+    labels which fit the height of the colorbar are created, when it is drawn. The cost of
+    a draw therefore does not grow with the number of categories. Categories are the
+    integers 0 to n - 1, as in `plothelpers.discrete_cmap`.
+
+    Args:
+        ax (mpl.axes.Axes): The axes to draw the colorbar by.
+        ticklabels (Sequence[str]): Label of each category
+        cmap (str | Colormap, optional): Colormap to sample. Defaults to "RdPu".
+        label (str, optional): Label of the colorbar. Defaults to None.
+        aspect (float, optional): Width of the strip relative to the axes width, as a
+            divisor: the strip is the axes width divided by *aspect*. Defaults to 20.
+        pad (float, optional): Padding spacing in inches. Defaults to 0.05.
+        fontsize (float, optional): Label size in points. Defaults to ``ytick.labelsize``.
+
+    Returns:
+        CategoricalColorbar: The colorbar
+    """
+    n = len(ticklabels)
+    cmap, norm = discrete_cmap(n, cmap)
+
+    cax = fixed_colorbar_axes(ax, aspect, pad)
+    # Index the colors directly, BoundaryNorm is limited to 2**15 colors
+    image = cax.imshow(
+        np.arange(n).reshape(n, 1),
+        cmap=cmap,
+        norm=NoNorm(),
+        aspect="auto",
+        origin="lower",
+        interpolation="nearest",
+        extent=(0, 1, -0.5, n - 0.5),
+    )
+    cax.set_xticks([])
+    cax.yaxis.tick_right()
+    cax.yaxis.set_label_position("right")
+
+    locator = CategoryLocator(n, fontsize)
+    cax.yaxis.set_major_locator(locator)
+    cax.yaxis.set_major_formatter(
+        mticker.FuncFormatter(
+            lambda value, pos: ticklabels[int(value)] if 0 <= value < n else ""
+        )
+    )
+    cax.yaxis.set_minor_locator(mticker.NullLocator())
+    if fontsize is not None:
+        cax.tick_params(axis="y", labelsize=fontsize)
+    if label is not None:
+        cax.set_ylabel(label)
+    return CategoricalColorbar(cax, image, cmap, norm, ticklabels, locator)
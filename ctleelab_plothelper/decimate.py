@@ -0,0 +1,150 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import numpy as np
+
+from matplotlib.axes import Axes
+
+from .imaging import get_panel_pixels
+
+import numpy.typing as npt
+from typing import Optional, Tuple
+
+
+def m4_indices(
+    x: npt.NDArray, y: npt.NDArray, xmin: float, xmax: float, n_bins: int
+) -> npt.NDArray[np.intp]:
+    """Indices of the M4 envelope of a series over pixel columns.
+
+    For each of *n_bins* equal columns between *xmin* and *xmax*, the first, last,
+    minimum and maximum samples are kept. Drawn as a line at a width of *n_bins*
+    pixels, the result rasterizes the same as the full series. The nearest sample
+    outside of the range on either side is kept so the line leaves the view correctly.
+
+    Args:
+        x (npt.NDArray): Sample positions, sorted in ascending order
+        y (npt.NDArray): Sample values
+        xmin (float): Left edge of the view
+        xmax (float): Right edge of the view
+        n_bins (int): Number of pixel columns
+
+    Returns:
+        npt.NDArray[np.intp]: Sorted indices of the samples to keep
+    """
+    n = len(x)
+    lo = max(int(np.searchsorted(x, xmin, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, xmax, side="right")) + 1, n)
+    if hi - lo <= 4 * n_bins:
+        return np.arange(lo, hi)
+
+    xs = x[lo:hi]
+    ys = y[lo:hi]
+    edges = np.linspace(xmin, xmax, n_bins + 1)
+    starts = np.searchsorted(xs, edges[:-1], side="left")
+    starts[0] = 0
+    starts = np.unique(starts[starts < len(xs)])
+    counts = np.diff(starts, append=len(xs))
+
+    firsts = starts
+    lasts = starts + counts - 1
+
+    # Positions of the extrema are found by matching against the per-bin extremum
+    mins = np.fmin.reduceat(ys, starts)
+    maxs = np.fmax.reduceat(ys, starts)
+    argmins = _first_match(ys, np.repeat(mins, counts), starts)
+    argmaxs = _first_match(ys, np.repeat(maxs, counts), starts)
+
+    keep = np.unique(np.concatenate((firsts, lasts, argmins, argmaxs)))
+    return keep + lo
+
+
+def _first_match(
+    values: npt.NDArray, targets: npt.NDArray, starts: npt.NDArray[np.intp]
+) -> npt.NDArray[np.intp]:
+    """Index of the first element equal to its target at or after each start."""
+    matches = np.flatnonzero(values == targets)
+    if len(matches) == 0:
+        return starts
+    return matches[np.minimum(np.searchsorted(matches, starts), len(matches) - 1)]
+
+
+class DecimatedLine:
+    """
+    A line showing the M4 envelope of a long series at the resolution of its panel.
+
+    The envelope is recomputed from the full series whenever the x limits change. An
+    empty series is drawn as an empty line.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        x: npt.ArrayLike,
+        y: npt.ArrayLike,
+        dpi: Optional[float] = None,
+        **kwargs,
+    ):
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x and y must be 1D arrays of the same length.")
+        self.ax = ax
+        self.dpi = dpi
+        if len(self.x):
+            data = self._decimate((self.x[0], self.x[-1]))
+        else:
+            data = (self.x, self.y)
+        (self.line,) = ax.plot(*data, **kwargs)
+        # The registry only keeps weak references to bound methods, so the callback
+        # holds on to this handle instead
+        self._cid = ax.callbacks.connect("xlim_changed", lambda ax: self.update())
+
+    def update(self):
+        """Recompute the envelope for the current x limits."""
+        self.line.set_data(*self._decimate(self.ax.get_xlim()))
+
+    def disconnect(self):
+        """Stop following changes of the x limits."""
+        self.ax.callbacks.disconnect(self._cid)
+
+    def _decimate(self, xlim: Tuple[float, float]) -> Tuple[npt.NDArray, npt.NDArray]:
+        if not len(self.x):
+            return self.x, self.y
+        xmin, xmax = sorted(xlim)
+        n_bins, _ = get_panel_pixels(self.ax, self.dpi)
+        keep = m4_indices(self.x, self.y, xmin, xmax, n_bins)
+        return self.x[keep], self.y[keep]
+
+
+def plot_decimated(
+    ax: Axes,
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    dpi: Optional[float] = None,
+    **kwargs,
+) -> DecimatedLine:
+    """Plot a long series reduced to its per-pixel-column min/max (M4) envelope.
+
+    The number of pixel columns is the panel width in inches, known up front for
+    `fixed_size_subplots` layouts, times the output DPI.
+
+    Args:
+        ax (Axes): Axes to draw into
+        x (npt.ArrayLike): Sample positions, sorted in ascending order
+        y (npt.ArrayLike): Sample values
+        dpi (float, optional): Output DPI. Defaults to `imaging.get_output_dpi`.
+        **kwargs: Additional keyword arguments passed to plot().
+
+    Returns:
+        DecimatedLine: Handle of the decimated line, with the artist as ``.line``
+    """
+    return DecimatedLine(ax, x, y, dpi, **kwargs)
@@ -14,20 +14,45 @@ import matplotlib as mpl
 import matplotlib.transforms as mtransforms
 from mpl_toolkits.axes_grid1.axes_divider import AxesDivider
 
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Optional, Tuple
 
 import functools
 
+SIDES = ("left", "right", "bottom", "top")
+
 
 class FixedSizeDivider(AxesDivider):
     """
     A custom AxesDivider that allows fixed size axes.
 
     This class extends the AxesDivider to support fixed size axes in inches.
+    Side panels registered with `new_side_locator` or `append_fixed_axes` are
+    resolved together in a single pass: the parent is located once per draw
+    of the figure, or when the figure size or DPI changes, and the boxes are
+    cached in between. Call `invalidate` after moving the parent outside of a
+    draw. Panels added with `append_fixed_axes` free their place for panels
+    added after their axes was removed.
     """
 
     def __init__(self, axes, xref=None, yref=None):
         super().__init__(axes, xref=xref, yref=yref)
+        # Panel id -> (position, size, pad, axes added by append_fixed_axes)
+        self._side_panels = dict[
+            int, Tuple[str, float, float, Optional[mpl.axes.Axes]]
+        ]()
+        self._side_next = 0
+        self._side_key = None
+        self._side_boxes = dict[int, mtransforms.Bbox]()
+        # Number of completed figure draws, counted once the first panel is located
+        self._draws = 0
+        self._draw_cid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Canvas callbacks are not pickled, so reconnect on the next locate
+        state["_draw_cid"] = None
+        state["_side_key"] = None
+        return state
 
     def new_right_locator(self, pad: float, aspect: float) -> Callable:
         """Locate a new axes to the RHS of current axes with explicit padding and width given in aspect to main figure.
@@ -59,3 +84,121 @@ class FixedSizeDivider(AxesDivider):
         y1, h1 = y0, h
 
         return mtransforms.Bbox.from_bounds(x1, y1, w1, h1)
+
+    def new_side_locator(self, position: str, size: float, pad: float) -> Callable:
+        """Locate a new side panel of fixed size next to the current axes.
+
+        Panels on the same side are stacked outwards in the order they are
+        registered.
+
+        Args:
+            position (str): side of the axes, one of "left", "right", "bottom" or "top"
+            size (float): width (left/right) or height (bottom/top) of the panel in inches
+            pad (float): padding in inches between the panel and its inner neighbour
+
+        Raises:
+            ValueError: If *position* is not a valid side.
+
+        Returns:
+            Callable: locator functor
+        """
+        if position not in SIDES:
+            raise ValueError(f"position must be one of {SIDES}, not {position!r}.")
+        # Forget the panels whose axes were removed, e.g. by a FigurePool reset
+        for panel_id, (*_, panel) in list(self._side_panels.items()):
+            if panel is not None and panel.get_figure() is None:
+                del self._side_panels[panel_id]
+        panel_id = self._side_next
+        self._side_next += 1
+        self._side_panels[panel_id] = (position, size, pad, None)
+        self._side_key = None
+        locator = functools.partial(self._locate_side, panel_id)
+        locator.get_subplotspec = self.get_subplotspec
+        return locator
+
+    def append_fixed_axes(
+        self, position: str, size: float, pad: float = 0.05, **kwargs
+    ) -> mpl.axes.Axes:
+        """Add a fixed size side panel axes next to the current axes.
+
+        Args:
+            position (str): side of the axes, one of "left", "right", "bottom" or "top"
+            size (float): width (left/right) or height (bottom/top) of the panel in inches
+            pad (float, optional): padding in inches to the inner neighbour. Defaults to 0.05.
+            **kwargs: Additional keyword arguments passed to add_axes().
+
+        Returns:
+            mpl.axes.Axes: The new side panel axes
+        """
+        locator = self.new_side_locator(position, size, pad)
+        panel = self._fig.add_axes(self.get_position(), axes_locator=locator, **kwargs)
+        self._side_panels[locator.args[0]] = (position, size, pad, panel)
+        return panel
+
+    def invalidate(self):
+        """Discard cached side panel boxes, e.g. after moving the parent axes."""
+        self._side_key = None
+
+    def _count_draw(self, event: Any):
+        self._draws += 1
+
+    def _locate_side(self, panel_id: int, axes: mpl.axes.Axes, renderer: Any):
+        """
+        Implementation of ``divider.new_side_locator().__call__``.
+
+        The parent is located and all side panels are resolved on the first
+        call of a draw, or after the figure size, the DPI or the panels
+        changed; later calls return the cached box.
+        """
+        fig = self._fig
+        if self._draw_cid is None:
+            self._draw_cid = fig.canvas.mpl_connect("draw_event", self._count_draw)
+        key = (tuple(fig.bbox.size), fig.dpi, self._draws)
+        if key != self._side_key:
+            bounds = tuple(self.get_position_runtime(axes, renderer))
+            self._side_boxes = self._resolve_sides(bounds)
+            self._side_key = key
+        return self._side_boxes[panel_id]
+
+    def _resolve_sides(
+        self, bounds: Tuple[float, float, float, float]
+    ) -> Dict[int, mtransforms.Bbox]:
+        """Compute the boxes of all side panels around the located parent bounds."""
+        fig_w, fig_h = self._fig.bbox.size / self._fig.dpi
+        x0, y0, w, h = bounds
+
+        offsets = dict.fromkeys(SIDES, 0.0)
+        boxes = dict[int, mtransforms.Bbox]()
+        for panel_id, (position, size, pad, _) in self._side_panels.items():
+            offset = offsets[position] + pad
+            offsets[position] = offset + size
+            if position == "right":
+                bounds = (x0 + w + offset / fig_w, y0, size / fig_w, h)
+            elif position == "left":
+                bounds = (x0 - (offset + size) / fig_w, y0, size / fig_w, h)
+            elif position == "top":
+                bounds = (x0, y0 + h + offset / fig_h, w, size / fig_h)
+            else:  # 'bottom'
+                bounds = (x0, y0 - (offset + size) / fig_h, w, size / fig_h)
+            boxes[panel_id] = mtransforms.Bbox.from_bounds(*bounds)
+        return boxes
+
+
+def fixed_size_divider(ax: mpl.axes.Axes) -> FixedSizeDivider:
+    """Get the divider shared by all fixed size side panels of an axes.
+
+    The divider is created on first use and follows the axes locator of *ax*, so
+    colorbars and other side panels added through it are stacked outwards.
+
+    Args:
+        ax (mpl.axes.Axes): The parent axes
+
+    Returns:
+        FixedSizeDivider: The divider of *ax*
+    """
+    divider = getattr(ax, "_fixed_size_divider", None)
+    if divider is None:
+        divider = FixedSizeDivider(ax)
+        divider.set_locator(ax.get_axes_locator())
+        ax._fixed_size_divider = divider
+    return divider
@@ -0,0 +1,92 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+from contextlib import contextmanager
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from .export import ExportResult, save_all
+from .styles import compile_style, style_context
+
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+DRAFT_STYLE = "ctleelab_plothelper.draft"
+PUBLISH_STYLE = "ctleelab_plothelper.base"
+
+
+@contextmanager
+def draft(dpi: Optional[float] = None) -> Iterator[None]:
+    """Render previews at a low DPI with path simplification and chunking.
+
+    Figures created within the context use the draft overlay on top of the current
+    style. Sizes in inches, such as those of `fixed_size_subplots`, are unaffected.
+
+    Args:
+        dpi (float, optional): Draft DPI. Defaults to the DPI of the draft style.
+
+    Yields:
+        None
+    """
+    overlay = [DRAFT_STYLE]
+    if dpi is not None:
+        overlay.append({"figure.dpi": dpi})
+    with style_context(overlay):
+        yield
+
+
+# Package level name of `draft`, since ``ctleelab_plothelper.draft`` is this module
+draft_mode = draft
+
+
+def publish(
+    fig: Figure,
+    basename: str,
+    formats: Sequence[str] = ("png", "svg", "pdf"),
+    dpi: Optional[float] = None,
+    **savefig_kw: Any,
+) -> Dict[str, ExportResult]:
+    """Re-render a (draft) figure at full publication resolution.
+
+    The rcParams changed by the draft overlay are reset to the publication style while
+    saving, line paths are rebuilt without the draft simplification, and the figure is
+    written at the publication DPI using `save_all`.
+
+    Args:
+        fig (Figure): Figure to save
+        basename (str): Output path without extension
+        formats (Sequence[str], optional): Output formats. Defaults to ("png", "svg", "pdf").
+        dpi (float, optional): Output DPI. Defaults to figure.dpi of the publication style.
+        **savefig_kw: Additional keyword arguments passed to savefig().
+
+    Returns:
+        Dict[str, ExportResult]: time and bytes written per format
+    """
+    publication = compile_style(PUBLISH_STYLE)
+    rc = {
+        key: publication.get(key, mpl.rcParamsDefault[key])
+        for key in compile_style(DRAFT_STYLE)
+    }
+    if dpi is None:
+        dpi = rc["figure.dpi"]
+
+    original_dpi = fig.get_dpi()
+    with style_context(rc):
+        fig.set_dpi(dpi)
+        try:
+            # Path simplification is fixed when a line's path is built
+            for line in fig.findobj(Line2D):
+                line.recache_always()
+            return save_all(fig, basename, formats, dpi=dpi, **savefig_kw)
+        finally:
+            fig.set_dpi(original_dpi)
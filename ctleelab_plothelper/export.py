@@ -0,0 +1,266 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import os
+import pickle
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+
+from . import svgopt
+from .rasterize import RasterizedArtist, rasterize_heavy
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+VECTOR_FORMATS = ("svg", "svgz", "pdf", "eps", "ps")
+
+# Metadata removing the timestamps each format writes by default
+_DETERMINISTIC_METADATA = {
+    "svg": {"Date": None},
+    "svgz": {"Date": None},
+    "pdf": {"CreationDate": None},
+    "eps": {"CreationDate": None},
+    "ps": {"CreationDate": None},
+}
+_DETERMINISTIC_RC = {"svg.hashsalt": "ctleelab_plothelper"}
+# Saves in several threads share one application of _DETERMINISTIC_RC
+_rc_lock = threading.Lock()
+_rc_users = 0
+_rc_saved = dict[str, Any]()
+
+
+@dataclass
+class ExportResult:
+    """Timing and size of a single exported file."""
+
+    format: str
+    path: str
+    seconds: float
+    nbytes: int
+    rasterized: List[RasterizedArtist] = field(default_factory=list)
+
+
+@contextmanager
+def frozen_layout(fig: Figure) -> Iterator[Figure]:
+    """Resolve the layout of a figure once and freeze the axes positions.
+
+    The figure is drawn once without rendering so that every ``axes_locator`` is
+    evaluated. The computed positions are pinned as both the original and active
+    positions and the locators detached, so that subsequent draws reuse them. The
+    positions and locators are restored when the context exits.
+
+    Args:
+        fig (Figure): Figure of interest
+
+    Yields:
+        Figure: The figure with frozen axes positions
+    """
+    fig.draw_without_rendering()
+    detached = []
+    for ax in fig.axes:
+        locator = ax.get_axes_locator()
+        if locator is not None:
+            original = ax.get_position(original=True).frozen()
+            detached.append((ax, locator, original))
+            # Without a locator a draw falls back to the original position
+            ax._set_position(ax.get_position().frozen())
+            ax.set_axes_locator(None)
+    try:
+        yield fig
+    finally:
+        for ax, locator, original in detached:
+            ax._set_position(original, which="original")
+            ax.set_axes_locator(locator)
+
+
+def save_all(
+    fig: Figure,
+    basename: str,
+    formats: Sequence[str] = ("png", "svg", "pdf"),
+    max_workers: int = 1,
+    rasterize_threshold: Optional[int] = None,
+    optimize_svg: bool = False,
+    deterministic: bool = False,
+    **savefig_kw: Any,
+) -> Dict[str, ExportResult]:
+    """Save a figure in several formats while resolving the layout only once.
+
+    Each format is written to ``f"{basename}.{format}"``. With ``max_workers > 1`` the
+    frozen figure is pickled once and the formats are written concurrently in separate
+    processes, since the matplotlib backends are not safe to run concurrently on one
+    figure. This pays off for figures which are expensive to draw. The workers save with
+    the rcParams active in the calling process, e.g. those of a style context.
+
+    Args:
+        fig (Figure): Figure to save
+        basename (str): Output path without extension
+        formats (Sequence[str], optional): Output formats. Defaults to ("png", "svg", "pdf").
+        max_workers (int, optional): Number of processes writing formats concurrently. Defaults to 1.
+        rasterize_threshold (int, optional): Rasterize data artists above this complexity in
+            vector formats, see `rasterize.rasterize_heavy`. Defaults to None.
+        optimize_svg (bool, optional): Post-process SVG output with `svgopt.optimize_svg`.
+            Defaults to False.
+        deterministic (bool, optional): Write byte-stable files, without timestamps and with a
+            fixed SVG hash salt. Defaults to False.
+        **savefig_kw: Additional keyword arguments passed to savefig().
+
+    Returns:
+        Dict[str, ExportResult]: time and bytes written per format
+    """
+    results = dict[str, ExportResult]()
+    with ExitStack() as stack:
+        stack.enter_context(frozen_layout(fig))
+        rasterized = list[RasterizedArtist]()
+        if rasterize_threshold is not None:
+            rasterized = stack.enter_context(
+                rasterize_heavy(fig, threshold=rasterize_threshold)
+            )
+        if max_workers > 1 and len(formats) > 1:
+            data = pickle.dumps(fig)
+            rc = _rc_snapshot()
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(formats)),
+                initializer=_init_worker,
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _save_pickled,
+                        data,
+                        rc,
+                        basename,
+                        fmt,
+                        optimize_svg,
+                        deterministic,
+                        savefig_kw,
+                    )
+                    for fmt in formats
+                ]
+                for future in futures:
+                    result = future.result()
+                    results[result.format] = result
+        else:
+            for fmt in formats:
+                results[fmt] = _save(
+                    fig, basename, fmt, optimize_svg, deterministic, savefig_kw
+                )
+    for result in results.values():
+        if result.format in VECTOR_FORMATS:
+            result.rasterized = rasterized
+    return results
+
+
+def format_results(results: Dict[str, ExportResult]) -> str:
+    """Format export results as a small table.
+
+    Args:
+        results (Dict[str, ExportResult]): Results from `save_all`
+
+    Returns:
+        str: One line per exported format
+    """
+    lines = [f"{'format':<8}{'seconds':>10}{'bytes':>12}  path"]
+    for result in results.values():
+        lines.append(
+            f"{result.format:<8}{result.seconds:>10.3f}{result.nbytes:>12d}  {result.path}"
+        )
+    return "\n".join(lines)
+
+
+def _save(
+    fig: Figure,
+    basename: str,
+    fmt: str,
+    optimize_svg: bool,
+    deterministic: bool,
+    savefig_kw: Dict[str, Any],
+) -> ExportResult:
+    """Save a single format and measure it."""
+    path = f"{basename}.{fmt}"
+    start = time.perf_counter()
+    if deterministic:
+        if fmt in _DETERMINISTIC_METADATA:
+            savefig_kw = dict(savefig_kw)
+            savefig_kw["metadata"] = {
+                **_DETERMINISTIC_METADATA[fmt],
+                **(savefig_kw.get("metadata") or {}),
+            }
+        with _deterministic_rc():
+            fig.savefig(path, format=fmt, **savefig_kw)
+    else:
+        fig.savefig(path, format=fmt, **savefig_kw)
+    if optimize_svg and fmt == "svg":
+        svgopt.optimize_svg(path)
+    seconds = time.perf_counter() - start
+    return ExportResult(fmt, path, seconds, os.path.getsize(path))
+
+
+@contextmanager
+def _deterministic_rc() -> Iterator[None]:
+    """Apply `_DETERMINISTIC_RC` until the last concurrent deterministic save finishes.
+
+    Unlike `matplotlib.rc_context`, a thread leaving the context does not restore the
+    rcParams while saves in other threads still rely on them.
+    """
+    global _rc_users
+    with _rc_lock:
+        if _rc_users == 0:
+            _rc_saved.update({k: mpl.rcParams[k] for k in _DETERMINISTIC_RC})
+            mpl.rcParams.update(_DETERMINISTIC_RC)
+        _rc_users += 1
+    try:
+        yield
+    finally:
+        with _rc_lock:
+            _rc_users -= 1
+            if _rc_users == 0:
+                mpl.rcParams.update(_rc_saved)
+                _rc_saved.clear()
+
+
+def _init_worker():
+    """Initialize an export worker process with a non-interactive backend."""
+    mpl.use("agg")
+
+
+def _rc_snapshot() -> Dict[str, Any]:
+    """The active rcParams of this process, to save with in a worker process."""
+    rc = dict(mpl.rcParams.copy())
+    # Workers keep their non-interactive backend
+    rc.pop("backend", None)
+    return rc
+
+
+def _save_pickled(
+    data: bytes,
+    rc: Dict[str, Any],
+    basename: str,
+    fmt: str,
+    optimize_svg: bool,
+    deterministic: bool,
+    savefig_kw: Dict[str, Any],
+) -> ExportResult:
+    """Save a single format of a pickled figure in a worker process with rcParams *rc*."""
+    with mpl.rc_context(rc):
+        fig = pickle.loads(data)
+        try:
+            return _save(fig, basename, fmt, optimize_svg, deterministic, savefig_kw)
+        finally:
+            if fig.canvas.manager is not None:
+                import matplotlib.pyplot as plt
+
+                plt.close(fig)
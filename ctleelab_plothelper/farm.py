@@ -0,0 +1,176 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+
+from .export import ExportResult, save_all
+from .plothelpers import uses_pyplot
+from .styles import style_context
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+StyleVariant = Tuple[List[str], str]
+
+DEFAULT_STYLES: Sequence[StyleVariant] = (
+    (["ctleelab_plothelper.base", "ctleelab_plothelper.light"], ""),
+    (["ctleelab_plothelper.base", "ctleelab_plothelper.dark"], "_dark"),
+)
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """A picklable description of a figure to render.
+
+    *func* must be importable by the worker processes (e.g. a module level function)
+    and return the figure it built.
+    """
+
+    func: Callable[..., Figure]
+    basename: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    formats: Sequence[str] = ("png",)
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering a job under one style variant."""
+
+    job: RenderJob
+    suffix: str
+    exports: Dict[str, ExportResult]
+    seconds: float
+
+
+class RenderFarm:
+    """
+    A pool of warm worker processes for rendering many figures.
+
+    Workers import matplotlib with the Agg backend and load the fonts and style
+    sheets once at startup, and stay alive for every batch rendered by the farm.
+    Use as a context manager, or call `close` when done.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        styles: Sequence[StyleVariant] = DEFAULT_STYLES,
+    ):
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=([stack for stack, _ in styles],),
+        )
+        self._styles = styles
+
+    def __enter__(self) -> "RenderFarm":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(cancel_futures=True)
+
+    def render(
+        self,
+        jobs: Iterable[RenderJob],
+        styles: Optional[Sequence[StyleVariant]] = None,
+    ) -> Iterator[RenderResult]:
+        """Render every job under every style variant.
+
+        Results are yielded as soon as they finish, not in submission order.
+
+        Args:
+            jobs (Iterable[RenderJob]): Figures to render
+            styles (Sequence[StyleVariant], optional): (style stack, file suffix) pairs.
+                Defaults to the styles the farm was created with.
+
+        Yields:
+            RenderResult: Result of each job and style variant
+        """
+        if styles is None:
+            styles = self._styles
+        futures = [
+            self._executor.submit(_render, job, stack, suffix)
+            for job in jobs
+            for stack, suffix in styles
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def render_batch(
+    jobs: Iterable[RenderJob],
+    styles: Sequence[StyleVariant] = DEFAULT_STYLES,
+    max_workers: Optional[int] = None,
+) -> Iterator[RenderResult]:
+    """Render every job under every style variant in a temporary `RenderFarm`.
+
+    Args:
+        jobs (Iterable[RenderJob]): Figures to render
+        styles (Sequence[StyleVariant], optional): (style stack, file suffix) pairs.
+            Defaults to the light and dark styles.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Yields:
+        RenderResult: Result of each job and style variant, as they finish
+    """
+    with RenderFarm(max_workers, styles) as farm:
+        yield from farm.render(jobs)
+
+
+def _init_worker(stacks: Sequence[List[str]]):
+    """Warm up a worker: select Agg, import pyplot and load fonts and styles."""
+    mpl.use("agg")
+    import matplotlib.pyplot  # noqa: F401
+    from matplotlib import font_manager
+
+    for stack in stacks:
+        with style_context(stack):
+            font_manager.findfont(font_manager.FontProperties())
+
+
+def _render(job: RenderJob, stack: List[str], suffix: str) -> RenderResult:
+    """Build, export and close a single figure in a worker process."""
+    start = time.perf_counter()
+    with style_context(stack):
+        fig = job.func(*job.args, **job.kwargs)
+        try:
+            exports = save_all(fig, f"{job.basename}{suffix}", job.formats)
+        finally:
+            if uses_pyplot(fig):
+                import matplotlib.pyplot as plt
+
+                plt.close(fig)
+    return RenderResult(job, suffix, exports, time.perf_counter() - start)
@@ -0,0 +1,171 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import math
+
+import numpy as np
+
+import matplotlib as mpl
+from matplotlib.axes import Axes
+from matplotlib.image import AxesImage
+
+from .layout import get_panel_size_inches
+
+import numpy.typing as npt
+from typing import Optional, Tuple
+
+# NaN-aware, so a missing pixel does not blank its whole block
+_REDUCERS = {"mean": np.add, "max": np.fmax, "min": np.fmin}
+# Number of input elements pooled at once by mean pooling
+_BAND_ELEMENTS = 1 << 20
+
+
+def get_output_dpi(ax: Axes) -> float:
+    """DPI the figure of an axes will be saved at.
+
+    Args:
+        ax (Axes): Axes of interest
+
+    Returns:
+        float: ``savefig.dpi``, or the figure DPI if it is set to "figure"
+    """
+    dpi = mpl.rcParams["savefig.dpi"]
+    if dpi == "figure":
+        dpi = ax.get_figure(root=True).dpi
+    return float(dpi)
+
+
+def get_panel_pixels(ax: Axes, dpi: Optional[float] = None) -> Tuple[int, int]:
+    """Pixel budget of an axes at a given DPI.
+
+    Args:
+        ax (Axes): Axes of interest
+        dpi (float, optional): Output DPI. Defaults to `get_output_dpi`.
+
+    Returns:
+        Tuple[int, int]: (width, height) in device pixels
+    """
+    if dpi is None:
+        dpi = get_output_dpi(ax)
+    width, height = get_panel_size_inches(ax)
+    return max(1, math.ceil(width * dpi)), max(1, math.ceil(height * dpi))
+
+
+def block_reduce(
+    data: npt.ArrayLike, shape: Tuple[int, int], reducer: str = "mean"
+) -> np.ndarray:
+    """Downsample an image by pooling blocks of pixels.
+
+    Block sizes are chosen so that the result is at least *shape* (rows, columns).
+    The last block along each axis may be smaller when the image size is not a
+    multiple of the block size. Mean pooling acts as a box anti-aliasing filter.
+    NaN pixels are ignored, so a block is only NaN if all of its pixels are.
+
+    Args:
+        data (npt.ArrayLike): (M, N) scalar or (M, N, 3|4) RGB(A) image
+        shape (Tuple[int, int]): Minimum (rows, columns) of the result
+        reducer (str, optional): "mean", "max" or "min". Defaults to "mean".
+
+    Raises:
+        ValueError: If the reducer is unknown.
+
+    Returns:
+        np.ndarray: The pooled image, or *data* if no pooling is needed
+    """
+    if reducer not in _REDUCERS:
+        raise ValueError(f"reducer must be one of {list(_REDUCERS)}, not {reducer!r}.")
+    data = np.asanyarray(data)
+    rows, cols = data.shape[:2]
+    fy = max(1, rows // max(1, shape[0]))
+    fx = max(1, cols // max(1, shape[1]))
+    if fy == 1 and fx == 1:
+        return data
+
+    iy = np.arange(0, rows, fy)
+    ix = np.arange(0, cols, fx)
+    ufunc = _REDUCERS[reducer]
+    if reducer != "mean":
+        return ufunc.reduceat(ufunc.reduceat(data, ix, axis=1), iy, axis=0)
+
+    # Sum in bands of whole block rows, so the float64 and NaN mask temporaries are
+    # bounded by one band instead of the full image
+    channels = int(np.prod(data.shape[2:], dtype=np.intp))
+    band_rows = fy * max(1, _BAND_ELEMENTS // (fy * cols * channels))
+    widths = np.diff(ix, append=cols)
+    out = np.empty((len(iy), len(ix)) + data.shape[2:])
+    inexact = np.issubdtype(data.dtype, np.inexact)
+    for start in range(0, rows, band_rows):
+        band = data[start : start + band_rows]
+        band_iy = np.arange(0, len(band), fy)
+        if inexact and np.isnan(band).any():
+            # Average over the valid pixels of each block
+            valid = ~np.isnan(band)
+            band = np.where(valid, band, 0)
+            counts = np.add.reduceat(valid, ix, axis=1, dtype=np.intp)
+            counts = np.add.reduceat(counts, band_iy, axis=0)
+        else:
+            counts = np.outer(np.diff(band_iy, append=len(band)), widths)
+            counts = counts.reshape(counts.shape + (1,) * (data.ndim - 2))
+        sums = np.add.reduceat(band, ix, axis=1, dtype=np.float64)
+        sums = np.add.reduceat(sums, band_iy, axis=0)
+        with np.errstate(invalid="ignore"):
+            np.divide(sums, counts, out=out[start // fy : start // fy + len(band_iy)])
+    if np.issubdtype(data.dtype, np.integer):
+        out = np.rint(out).astype(data.dtype)
+    return out
+
+
+def decimated_imshow(
+    ax: Axes,
+    data: npt.ArrayLike,
+    dpi: Optional[float] = None,
+    reducer: str = "mean",
+    oversample: float = 1.0,
+    **kwargs,
+) -> AxesImage:
+    """Show a large image downsampled to the device resolution of its panel.
+
+    The pixel budget is derived from the size of the axes in inches, which is known up front
+    for `fixed_size_subplots` layouts, and the output DPI. The color limits are computed from
+    the full resolution data so that colorbars, e.g. from `add_fixed_colorbar`, stay correct.
+    The image keeps the data coordinates of the full resolution image.
+
+    Args:
+        ax (Axes): Axes to draw into
+        data (npt.ArrayLike): (M, N) scalar or (M, N, 3|4) RGB(A) image
+        dpi (float, optional): Output DPI. Defaults to `get_output_dpi`.
+        reducer (str, optional): "mean", "max" or "min" pooling. Defaults to "mean".
+        oversample (float, optional): Factor of the pixel budget to keep. Defaults to 1.0.
+        **kwargs: Additional keyword arguments passed to imshow().
+
+    Returns:
+        AxesImage: The image artist
+    """
+    data = np.asanyarray(data)
+    rows, cols = data.shape[:2]
+
+    if data.ndim == 2 and kwargs.get("norm") is None:
+        if kwargs.get("vmin") is None:
+            kwargs["vmin"] = np.nanmin(data)
+        if kwargs.get("vmax") is None:
+            kwargs["vmax"] = np.nanmax(data)
+
+    if kwargs.get("extent") is None:
+        origin = kwargs.get("origin") or mpl.rcParams["image.origin"]
+        if origin == "upper":
+            kwargs["extent"] = (-0.5, cols - 0.5, rows - 0.5, -0.5)
+        else:
+            kwargs["extent"] = (-0.5, cols - 0.5, -0.5, rows - 0.5)
+
+    width, height = get_panel_pixels(ax, dpi)
+    shape = (math.ceil(height * oversample), math.ceil(width * oversample))
+    return ax.imshow(block_reduce(data, shape, reducer), **kwargs)
@@ -0,0 +1,446 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import numpy as np
+
+import matplotlib.transforms as mtransforms
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.layout_engine import LayoutEngine
+
+import numpy.typing as npt
+from typing import Any, Hashable, List, Sequence, Tuple, Union
+
+
+class FixedLayoutEngine(LayoutEngine):
+    """
+    A layout engine which places axes at fixed positions given in inches.
+
+    All axes rectangles are measured in inches from the lower left corner of the
+    figure. Figure-fraction positions are computed once and only recomputed when
+    the figure size or DPI changes, so drawing does not go through any per-axes
+    ``axes_locator`` callbacks.
+    """
+
+    _adjust_compatible = False
+    _colorbar_gridspec = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._axes = list[Axes]()
+        self._rects = list[Tuple[float, float, float, float]]()
+        self._index = dict[int, int]()
+        self._key = None
+        self.geometry = None
+
+    def set(self):
+        """The fixed layout engine has no settable parameters."""
+        pass
+
+    def add_axes(self, ax: Axes, rect: Sequence[float]):
+        """Register an axes to be placed at a fixed rectangle.
+
+        Args:
+            ax (Axes): Axes to place
+            rect (Sequence[float]): (left, bottom, width, height) in inches
+        """
+        self._index[id(ax)] = len(self._axes)
+        self._axes.append(ax)
+        self._rects.append(tuple(rect))
+        self._key = None
+
+    def remove_axes(self, ax: Axes):
+        """Stop placing an axes.
+
+        Args:
+            ax (Axes): Axes to forget
+
+        Raises:
+            KeyError: If the axes is not managed by this engine.
+        """
+        i = self._index.get(id(ax))
+        if i is None or self._axes[i] is not ax:
+            raise KeyError("Axes is not managed by this layout engine.")
+        del self._axes[i]
+        del self._rects[i]
+        self._index = {id(a): j for j, a in enumerate(self._axes)}
+        self._key = None
+
+    def get_rect(self, ax: Axes) -> npt.NDArray[np.float64]:
+        """Get the rectangle in inches of a registered axes.
+
+        Args:
+            ax (Axes): Axes of interest
+
+        Raises:
+            KeyError: If the axes is not managed by this engine.
+
+        Returns:
+            npt.NDArray[np.float64]: (left, bottom, width, height) in inches
+        """
+        i = self._index.get(id(ax))
+        if i is None or self._axes[i] is not ax:
+            raise KeyError("Axes is not managed by this layout engine.")
+        return np.array(self._rects[i], dtype=float)
+
+    def execute(self, fig: Figure):
+        """Place all registered axes if the figure size or DPI has changed.
+
+        Args:
+            fig (Figure): Figure to lay out
+        """
+        fig_w, fig_h = fig.get_size_inches()
+        key = (fig_w, fig_h, fig.dpi)
+        if key == self._key:
+            return
+        scale = np.array([fig_w, fig_h, fig_w, fig_h])
+        fractions = np.asarray(self._rects, dtype=float).reshape(-1, 4) / scale
+        for ax, bounds in zip(self._axes, fractions):
+            ax._set_position(mtransforms.Bbox.from_bounds(*bounds))
+        self._key = key
+
+
+def fixed_size_geometry(
+    nrows: int = 1,
+    ncols: int = 1,
+    wmargin: float = 0.7,
+    hmargin: float = 0.7,
+    colsep: Union[float, npt.ArrayLike] = 0,
+    rowsep: Union[float, npt.ArrayLike] = 0,
+    subheight: Union[float, npt.ArrayLike] = 2,
+    subwidth: Union[float, npt.ArrayLike] = 2,
+    rmargin_scale: float = 0.6,
+    tmargin_scale: float = 0.6,
+) -> Tuple[float, float, npt.NDArray[np.float64]]:
+    """Compute the figure size and panel rectangles of a fixed size subplot grid.
+
+    All sizes are in inches and follow the conventions of `fixed_size_subplots`. Row 0 is the
+    bottom row. `subwidth` and `colsep` may be given per column and `subheight` and `rowsep` per
+    row; `colsep` and `rowsep` then hold the ``ncols - 1`` and ``nrows - 1`` separators between
+    neighbouring columns and rows. Scalar separators keep the legacy behaviour of also reserving
+    one separator on the right and top of the figure.
+
+    Args:
+        nrows (int, optional): number of rows for subplot grid. Defaults to 1.
+        ncols (int, optional): number of columns for subplot grid. Defaults to 1.
+        wmargin (float, optional): size of width margins. Defaults to 0.7.
+        hmargin (float, optional): size of height margins. Defaults to 0.7.
+        colsep (float | npt.ArrayLike, optional): padding for column separation. Defaults to 0.
+        rowsep (float | npt.ArrayLike, optional): padding for row separation. Defaults to 0.
+        subheight (float | npt.ArrayLike, optional): subaxes heights. Defaults to 2.
+        subwidth (float | npt.ArrayLike, optional): subaxes widths. Defaults to 2.
+        rmargin_scale (float, optional): right margin scale factor. Defaults to 0.6.
+        tmargin_scale (float, optional): top margin scale factor. Defaults to 0.6.
+
+    Raises:
+        ValueError: If a per-row or per-column array has the wrong length.
+
+    Returns:
+        width, height, geometry (Tuple[float, float, npt.NDArray[np.float64]]): figure size and an
+        ``(nrows, ncols, 4)`` array of (left, bottom, width, height) panel rectangles.
+    """
+    left, widths, width = _fixed_size_axis(
+        ncols, wmargin, colsep, subwidth, rmargin_scale, "colsep", "subwidth"
+    )
+    bottom, heights, height = _fixed_size_axis(
+        nrows, hmargin, rowsep, subheight, tmargin_scale, "rowsep", "subheight"
+    )
+
+    geometry = np.empty((nrows, ncols, 4))
+    geometry[..., 0] = left[np.newaxis, :]
+    geometry[..., 1] = bottom[:, np.newaxis]
+    geometry[..., 2] = widths[np.newaxis, :]
+    geometry[..., 3] = heights[:, np.newaxis]
+    return width, height, geometry
+
+
+def fixed_size_mosaic_geometry(
+    mosaic: Union[str, Sequence[Sequence[Any]]],
+    wmargin: float = 0.7,
+    hmargin: float = 0.7,
+    colsep: Union[float, npt.ArrayLike] = 0,
+    rowsep: Union[float, npt.ArrayLike] = 0,
+    subheight: Union[float, npt.ArrayLike] = 2,
+    subwidth: Union[float, npt.ArrayLike] = 2,
+    rmargin_scale: float = 0.6,
+    tmargin_scale: float = 0.6,
+    empty_sentinel: Any = ".",
+) -> Tuple[float, float, List[Hashable], npt.NDArray[np.float64]]:
+    """Compute the figure size and panel rectangles of a fixed size mosaic.
+
+    The mosaic is given like `matplotlib.figure.Figure.subplot_mosaic`, either as a string such
+    as ``"AAB;CD."`` or as a list of rows listed from top to bottom. A label repeated over a
+    rectangular block of cells makes a panel spanning the block, and cells holding
+    *empty_sentinel* are left empty. A cell holding a nested list of rows is split evenly into
+    a nested mosaic, separated by *wmargin* and *hmargin*.
+
+    The grid of cells follows `fixed_size_geometry`, except that `subheight` and `rowsep` are
+    listed from the top row down like the mosaic. The spans of all panels are computed at once
+    for each level of nesting.
+
+    Args:
+        mosaic (str | Sequence[Sequence[Any]]): Panel labels of the cells
+        wmargin (float, optional): size of width margins. Defaults to 0.7.
+        hmargin (float, optional): size of height margins. Defaults to 0.7.
+        colsep (float | npt.ArrayLike, optional): padding for column separation. Defaults to 0.
+        rowsep (float | npt.ArrayLike, optional): padding for row separation. Defaults to 0.
+        subheight (float | npt.ArrayLike, optional): row heights. Defaults to 2.
+        subwidth (float | npt.ArrayLike, optional): column widths. Defaults to 2.
+        rmargin_scale (float, optional): right margin scale factor. Defaults to 0.6.
+        tmargin_scale (float, optional): top margin scale factor. Defaults to 0.6.
+        empty_sentinel (Any, optional): Label of empty cells. Defaults to ".".
+
+    Raises:
+        ValueError: If the mosaic is malformed, a label does not cover a rectangle or is used
+            twice, or a nested mosaic does not fit its cell.
+
+    Returns:
+        width, height, labels, rects (Tuple[float, float, List[Hashable], npt.NDArray[np.float64]]):
+        figure size, the panel labels in reading order and an ``(n, 4)`` array of their
+        (left, bottom, width, height) rectangles.
+    """
+    grid = _parse_mosaic(mosaic)
+    nrows, ncols = grid.shape
+    if np.ndim(rowsep) != 0:
+        rowsep = np.asarray(rowsep, dtype=float)[::-1]
+    if np.ndim(subheight) != 0:
+        subheight = np.asarray(subheight, dtype=float)[::-1]
+    width, height, geometry = fixed_size_geometry(
+        nrows,
+        ncols,
+        wmargin=wmargin,
+        hmargin=hmargin,
+        colsep=colsep,
+        rowsep=rowsep,
+        subheight=subheight,
+        subwidth=subwidth,
+        rmargin_scale=rmargin_scale,
+        tmargin_scale=tmargin_scale,
+    )
+    # Rows of the mosaic run from the top down
+    geometry = geometry[::-1]
+    labels, rects = _mosaic_rects(
+        grid,
+        geometry[0, :, 0],
+        geometry[0, :, 2],
+        geometry[:, 0, 1],
+        geometry[:, 0, 3],
+        (wmargin, hmargin),
+        empty_sentinel,
+    )
+    if len(set(labels)) != len(labels):
+        seen = set()
+        duplicate = next(x for x in labels if x in seen or seen.add(x))
+        raise ValueError(f"Panel {duplicate!r} is used in more than one place.")
+    return width, height, labels, rects
+
+
+def _parse_mosaic(
+    mosaic: Union[str, Sequence[Sequence[Any]]],
+) -> npt.NDArray[np.object_]:
+    """Cells of a mosaic specification as a 2D object array."""
+    if isinstance(mosaic, str):
+        rows = [list(row.strip()) for row in mosaic.replace(";", "\n").splitlines()]
+        rows = [row for row in rows if row]
+    else:
+        rows = [list(row) for row in mosaic]
+    if not rows or not rows[0]:
+        raise ValueError("A mosaic needs at least one cell.")
+    ncols = len(rows[0])
+    if any(len(row) != ncols for row in rows):
+        raise ValueError("All rows of a mosaic must have the same length.")
+    grid = np.empty((len(rows), ncols), dtype=object)
+    for i, row in enumerate(rows):
+        for j, cell in enumerate(row):
+            grid[i, j] = _parse_mosaic(cell) if isinstance(cell, list) else cell
+    return grid
+
+
+def _mosaic_rects(
+    grid: npt.NDArray[np.object_],
+    lefts: npt.NDArray[np.float64],
+    widths: npt.NDArray[np.float64],
+    bottoms: npt.NDArray[np.float64],
+    heights: npt.NDArray[np.float64],
+    gaps: Tuple[float, float],
+    empty_sentinel: Any,
+) -> Tuple[List[Hashable], npt.NDArray[np.float64]]:
+    """Rectangles of the panels of a mosaic grid with rows listed from the top down."""
+    nrows, ncols = grid.shape
+    cells = grid.ravel()
+    ids = np.empty(cells.size, dtype=np.intp)
+    labels = list[Any]()
+    index = dict[Any, int]()
+    for k, cell in enumerate(cells):
+        if isinstance(cell, np.ndarray):
+            # Every nested mosaic is a panel of its own cell
+            ids[k] = len(labels)
+            labels.append(cell)
+        elif cell == empty_sentinel:
+            ids[k] = -1
+        else:
+            ids[k] = index.setdefault(cell, len(labels))
+            if ids[k] == len(labels):
+                labels.append(cell)
+
+    used = ids >= 0
+    ids, (rows, cols) = ids[used], np.divmod(np.flatnonzero(used), ncols)
+    n = len(labels)
+    first_row, last_row = np.full(n, nrows), np.full(n, -1)
+    first_col, last_col = np.full(n, ncols), np.full(n, -1)
+    np.minimum.at(first_row, ids, rows)
+    np.maximum.at(last_row, ids, rows)
+    np.minimum.at(first_col, ids, cols)
+    np.maximum.at(last_col, ids, cols)
+    # A label covers a rectangle if it fills its bounding box
+    area = (last_row - first_row + 1) * (last_col - first_col + 1)
+    broken = np.flatnonzero(np.bincount(ids, minlength=n) != area)
+    if broken.size:
+        raise ValueError(
+            f"Panel {labels[broken[0]]!r} does not cover a rectangle of the mosaic."
+        )
+
+    rects = np.empty((n, 4))
+    rects[:, 0] = lefts[first_col]
+    rects[:, 1] = bottoms[last_row]
+    rects[:, 2] = lefts[last_col] + widths[last_col] - rects[:, 0]
+    rects[:, 3] = bottoms[first_row] + heights[first_row] - rects[:, 1]
+
+    nested = [i for i, label in enumerate(labels) if isinstance(label, np.ndarray)]
+    if not nested:
+        return labels, rects
+    out_labels = list[Hashable]()
+    out_rects = list[npt.NDArray[np.float64]]()
+    for i, label in enumerate(labels):
+        if isinstance(label, np.ndarray):
+            inner_labels, inner_rects = _nested_rects(
+                label, rects[i], gaps, empty_sentinel
+            )
+            out_labels.extend(inner_labels)
+            out_rects.append(inner_rects)
+        else:
+            out_labels.append(label)
+            out_rects.append(rects[i : i + 1])
+    return out_labels, np.concatenate(out_rects)
+
+
+def _nested_rects(
+    grid: npt.NDArray[np.object_],
+    rect: npt.NDArray[np.float64],
+    gaps: Tuple[float, float],
+    empty_sentinel: Any,
+) -> Tuple[List[Hashable], npt.NDArray[np.float64]]:
+    """Rectangles of a nested mosaic splitting a cell evenly."""
+    nrows, ncols = grid.shape
+    wgap, hgap = gaps
+    width = (rect[2] - (ncols - 1) * wgap) / ncols
+    height = (rect[3] - (nrows - 1) * hgap) / nrows
+    if width <= 0 or height <= 0:
+        raise ValueError(
+            f"A nested {nrows}x{ncols} mosaic does not fit a {rect[2]:g}x{rect[3]:g} "
+            "inch cell."
+        )
+    lefts = rect[0] + np.arange(ncols) * (width + wgap)
+    bottoms = rect[1] + np.arange(nrows)[::-1] * (height + hgap)
+    return _mosaic_rects(
+        grid,
+        lefts,
+        np.full(ncols, width),
+        bottoms,
+        np.full(nrows, height),
+        gaps,
+        empty_sentinel,
+    )
+
+
+def _fixed_size_axis(
+    n: int,
+    margin: float,
+    sep: Union[float, npt.ArrayLike],
+    size: Union[float, npt.ArrayLike],
+    margin_scale: float,
+    sep_name: str,
+    size_name: str,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], float]:
+    """Offsets, sizes and total length along one direction of a fixed size grid."""
+    sizes = np.asarray(size, dtype=float)
+    if sizes.ndim == 0:
+        sizes = np.full(n, sizes)
+    elif sizes.shape != (n,):
+        raise ValueError(f"{size_name} must be a scalar or have length {n}.")
+
+    trailing = 0.0
+    if np.ndim(sep) == 0:
+        seps = np.full(max(n - 1, 0), float(sep))
+        trailing = float(sep)
+    else:
+        seps = np.asarray(sep, dtype=float)
+        if seps.shape != (max(n - 1, 0),):
+            raise ValueError(f"{sep_name} must be a scalar or have length {n - 1}.")
+
+    gaps = np.full(n, float(margin))
+    gaps[1:] += seps
+
+    # Interleave gaps and panels, | gap | size | gap | size | ..., and accumulate once
+    steps = np.empty(2 * n)
+    steps[0::2] = gaps
+    steps[1::2] = sizes
+    offsets = np.cumsum(steps)
+
+    total = offsets[-1] + trailing + margin * margin_scale if n else 0.0
+    return offsets[0::2], sizes, float(total)
+
+
+def get_panel_bounds(ax: Axes) -> Tuple[float, float, float, float]:
+    """Get the final position of an axes in figure fractions without drawing.
+
+    Axes placed by a `FixedLayoutEngine` are looked up directly, and axes with an
+    ``axes_locator`` from a fixed size layout are located without a renderer.
+
+    Args:
+        ax (Axes): Axes of interest
+
+    Returns:
+        Tuple[float, float, float, float]: (left, bottom, width, height) in figure fractions
+    """
+    fig = ax.get_figure(root=True)
+    engine = fig.get_layout_engine()
+    if isinstance(engine, FixedLayoutEngine):
+        try:
+            rect = engine.get_rect(ax)
+        except KeyError:
+            pass
+        else:
+            fig_w, fig_h = fig.get_size_inches()
+            return tuple(rect / (fig_w, fig_h, fig_w, fig_h))
+    locator = ax.get_axes_locator()
+    if locator is not None:
+        try:
+            return locator(ax, None).bounds
+        except (AttributeError, TypeError):
+            # The locator needs a renderer
+            pass
+    return ax.get_position().bounds
+
+
+def get_panel_size_inches(ax: Axes) -> Tuple[float, float]:
+    """Get the size of an axes in inches without drawing.
+
+    Args:
+        ax (Axes): Axes of interest
+
+    Returns:
+        Tuple[float, float]: (width, height) in inches
+    """
+    fig_w, fig_h = ax.get_figure(root=True).get_size_inches()
+    _, _, w, h = get_panel_bounds(ax)
+    return w * fig_w, h * fig_h
@@ -0,0 +1,156 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import os
+
+import numpy as np
+
+import matplotlib.image as mimage
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from typing import Any, Iterable, List, Optional
+
+
+def data_artists(ax: Axes) -> List[Artist]:
+    """The lines, collections and images of an axes.
+
+    Args:
+        ax (Axes): Axes of interest
+
+    Returns:
+        List[Artist]: Data artists in drawing order
+    """
+    return [*ax.images, *ax.collections, *ax.lines]
+
+
+class LiveFigure:
+    """
+    Redraw only the data artists of a figure with fixed panel geometry.
+
+    The static parts of the figure (frames, ticks, labels and colorbars) are rendered once,
+    and the background of each panel holding live artists is captured. The live artists are
+    marked as animated, so full draws skip them, and `update` restores each panel's background
+    and draws only its artists on top. Any full draw, e.g. after a resize or after changing
+    the limits with `refresh`, captures the backgrounds again.
+
+    On canvases without blitting support `update` falls back to a full draw.
+    """
+
+    def __init__(self, fig: Figure, artists: Optional[Iterable[Artist]] = None):
+        """
+        Args:
+            fig (Figure): Figure to update
+            artists (Iterable[Artist], optional): Artists to redraw on each update.
+                Defaults to the `data_artists` of every axes.
+        """
+        self.figure = fig
+        if artists is None:
+            artists = [a for ax in fig.axes for a in data_artists(ax)]
+        self._by_axes = dict[Axes, List[Artist]]()
+        for artist in artists:
+            artist.set_animated(True)
+            self._by_axes.setdefault(artist.axes, []).append(artist)
+        self._backgrounds = dict[Axes, Any]()
+        # The registry only keeps weak references to bound methods
+        self._cid = fig.canvas.mpl_connect("draw_event", lambda event: self._on_draw())
+        self.refresh()
+
+    @property
+    def artists(self) -> List[Artist]:
+        """The live artists."""
+        return [a for artists in self._by_axes.values() for a in artists]
+
+    def refresh(self):
+        """Draw the whole figure and capture the static backgrounds again."""
+        self.figure.canvas.draw()
+
+    def update(self):
+        """Redraw the live artists over the captured backgrounds."""
+        canvas = self.figure.canvas
+        if not canvas.supports_blit:
+            canvas.draw()
+            return
+        if not self._backgrounds:
+            self.refresh()
+        self._draw_artists()
+        for ax in self._by_axes:
+            canvas.blit(ax.bbox)
+        canvas.flush_events()
+
+    def disconnect(self):
+        """Stop capturing backgrounds and draw the artists normally again."""
+        self.figure.canvas.mpl_disconnect(self._cid)
+        for artist in self.artists:
+            artist.set_animated(False)
+        self._backgrounds.clear()
+
+    def _on_draw(self):
+        canvas = self.figure.canvas
+        if not canvas.supports_blit:
+            return
+        self._backgrounds = {ax: canvas.copy_from_bbox(ax.bbox) for ax in self._by_axes}
+        self._draw_artists()
+
+    def _draw_artists(self):
+        canvas = self.figure.canvas
+        for ax, artists in self._by_axes.items():
+            canvas.restore_region(self._backgrounds[ax])
+            for artist in artists:
+                ax.draw_artist(artist)
+
+
+class FrameSink:
+    """
+    Write the frames of a `LiveFigure` on an Agg canvas as a PNG sequence.
+
+    Each frame is blitted into the canvas buffer and encoded directly, without rebuilding
+    or fully redrawing the figure.
+    """
+
+    def __init__(
+        self,
+        live: LiveFigure,
+        pattern: str = "frame_{:05d}.png",
+        directory: str = ".",
+    ):
+        """
+        Args:
+            live (LiveFigure): Figure to record
+            pattern (str, optional): File name format of the frame number.
+                Defaults to "frame_{:05d}.png".
+            directory (str, optional): Output directory. Defaults to ".".
+        """
+        self.live = live
+        self.pattern = pattern
+        self.directory = directory
+        self.frames = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self) -> str:
+        """Update the figure and write the next frame.
+
+        Returns:
+            str: Path of the frame
+        """
+        self.live.update()
+        path = os.path.join(self.directory, self.pattern.format(self.frames))
+        canvas = self.live.figure.canvas
+        mimage.imsave(
+            path,
+            np.asarray(canvas.buffer_rgba()),
+            format="png",
+            dpi=self.live.figure.dpi,
+        )
+        self.frames += 1
+        return path
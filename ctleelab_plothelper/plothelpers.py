@@ -13,32 +13,49 @@
 import numpy as np
 
 import matplotlib as mpl
+import matplotlib.transforms as mtransforms
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from matplotlib.colorbar import Colorbar, ColorbarBase
-from matplotlib.colors import BoundaryNorm, LinearSegmentedColormap, Colormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import (
+    BoundaryNorm,
+    LinearSegmentedColormap,
+    ListedColormap,
+    Colormap,
+)
 from matplotlib.image import AxesImage
 from matplotlib.backend_bases import RendererBase
 
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-
-
 from mpl_toolkits import axes_grid1
 from mpl_toolkits.axes_grid1 import Divider, Size
 
-from .dividers import FixedSizeDivider
+from .dividers import FixedSizeDivider, fixed_size_divider
+from .layout import (
+    FixedLayoutEngine,
+    fixed_size_geometry,
+    fixed_size_mosaic_geometry,
+    get_panel_bounds,
+    get_panel_size_inches,
+)
 
 from operator import sub
 
+import functools
+
 import datetime
 
 import numpy.typing as npt
-from typing import Tuple, Union
+from typing import Any, Dict, Hashable, Sequence, Tuple, Union
 
 
-now = datetime.datetime.now()
-date = now.strftime("%Y%m%d")
+def __getattr__(name: str) -> Any:
+    # ``now`` and ``date`` were previously evaluated once at import time
+    if name == "now":
+        return datetime.datetime.now()
+    if name == "date":
+        return datetime.datetime.now().strftime("%Y%m%d")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def fixed_size_subplots(
@@ -46,12 +63,15 @@ def fixed_size_subplots(
     ncols: int = 1,
     wmargin: float = 0.7,
     hmargin: float = 0.7,
-    colsep: float = 0,
-    rowsep: float = 0,
-    subheight: float = 2,
-    subwidth: float = 2,
+    colsep: Union[float, npt.ArrayLike] = 0,
+    rowsep: Union[float, npt.ArrayLike] = 0,
+    subheight: Union[float, npt.ArrayLike] = 2,
+    subwidth: Union[float, npt.ArrayLike] = 2,
     rmargin_scale: float = 0.6,
     tmargin_scale: float = 0.6,
+    static_layout: bool = False,
+    pyplot: bool = True,
+    canvas: Union[str, type] = "agg",
     **fig_kw: ...,
 ) -> Tuple[
     Figure,
@@ -62,65 +82,226 @@ def fixed_size_subplots(
     All sizes are in inches. wmargin and hmargin are the width and height margins on the left and bottom sides.
     The right and top margins are `wmargin` and `hmargin` scaled by `rmargin_scale` and `tmargin_scale`, respectively.
     The spacing between subplots is given by `wmargin` and `hmargin` plus `rowsep` and `colsep`. For example, "| wmargin | subwidth | wmargin + colsep | subwidth | wmargin*rmargin_scale |"
+    Widths and column separators may also be given per column, and heights and row separators per row,
+    see `layout.fixed_size_geometry`. Row 0 is the bottom row of the grid.
 
+    A scalar `colsep` or `rowsep` also reserves one separator on the right or top of the
+    figure, to keep the legacy figure size, whereas a per-column or per-row sequence holds
+    only the separators between panels. The panels of ``colsep=0.5`` and ``colsep=[0.5]``
+    are at the same positions, but the former figure is 0.5 inches wider.
+
+    The ``(nrows, ncols, 4)`` array of (left, bottom, width, height) panel rectangles in inches
+    is stored as ``fig.fixed_size_geometry`` for both layouts.
 
     Args:
         nrows (int, optional): number of rows for subplot grid. Defaults to 1.
         ncols (int, optional): number of columns for subplot grid. Defaults to 1.
         wmargin (float, optional): size of width margins. Defaults to 0.7.
         hmargin (float, optional): size of height margins. Defaults to 0.7.
-        colsep (float, optional): padding for column separation (width). Defaults to 0.
-        rowsep (float, optional): padding for row separation (height). Defaults to 0.
-        subheight (float, optional): subaxes height. Defaults to 2.
-        subwidth (float, optional): subaxes width. Defaults to 2.
+        colsep (float | npt.ArrayLike, optional): padding for column separation (width). Defaults to 0.
+        rowsep (float | npt.ArrayLike, optional): padding for row separation (height). Defaults to 0.
+        subheight (float | npt.ArrayLike, optional): subaxes height(s). Defaults to 2.
+        subwidth (float | npt.ArrayLike, optional): subaxes width(s). Defaults to 2.
         rmargin_scale (float, optional): right margin scale factor. Defaults to 0.6.
         tmargin_scale (float, optional): top margin scale factor. Defaults to 0.6.
-        **fig_kw: Additional keyword arguments passed to plt.figure()
+        static_layout (bool, optional): place axes once with a `FixedLayoutEngine` instead of
+            attaching a divider locator to every axes. Positions are only recomputed when the
+            figure size or DPI changes. The panel geometry is also available as
+            ``fig.get_layout_engine().geometry``. Defaults to False.
+        pyplot (bool, optional): create the figure with plt.figure(). If False, a
+            `matplotlib.figure.Figure` is created with its own canvas and never registered with
+            pyplot, so it does not need to be closed and is freed once unreferenced. Use False
+            to build figures in threads, pyplot is not thread-safe. Defaults to True.
+        canvas (str | type, optional): canvas of a figure created without pyplot, "agg", "pdf",
+            "svg" or a FigureCanvas class. Any canvas can save to all formats. Defaults to "agg".
+        **fig_kw: Additional keyword arguments passed to plt.figure() or Figure()
 
     Returns:
         fig, axs (Tuple[matplotlib.figure.Figure, Tuple[matplotlib.axes.Axes, npt.NDArray[matplotlib.axes.Axes]]]):
         *axs* can be either a single `matplotlib.axes.Axes` object, or an array of Axes
         objects if more than one subplot was created.
     """
-    width = ncols * (wmargin + colsep + subwidth) + wmargin * rmargin_scale
-    height = nrows * (hmargin + rowsep + subheight) + hmargin * tmargin_scale
+    width, height, geometry = fixed_size_geometry(
+        nrows,
+        ncols,
+        wmargin=wmargin,
+        hmargin=hmargin,
+        colsep=colsep,
+        rowsep=rowsep,
+        subheight=subheight,
+        subwidth=subwidth,
+        rmargin_scale=rmargin_scale,
+        tmargin_scale=tmargin_scale,
+    )
 
     axs = np.empty((nrows, ncols), dtype=object)
 
-    fig = plt.figure(figsize=(width, height), **fig_kw)
+    fig = _new_figure(width, height, pyplot, canvas, fig_kw)
+    fig.fixed_size_geometry = geometry
     # renderer = get_renderer(fig)
 
-    # Initialize vertical divider locations
-    v = list[Size.Fixed]()
-    for i in range(1, nrows + 1):
-        if i == 1:
-            v.append(Size.Fixed(hmargin))
-        else:
-            v.append(Size.Fixed(hmargin + rowsep))
-        v.append(Size.Fixed(subheight))
-
-    # Initialize horizontal divider locations
-    h = list[Size.Fixed]()
-    for i in range(1, ncols + 1):
-        if i == 1:
-            h.append(Size.Fixed(wmargin))
-        else:
-            h.append(Size.Fixed(wmargin + colsep))
-        h.append(Size.Fixed(subwidth))
-
-    divider = Divider(fig, (0, 0, 1, 1), h, v, aspect=False)
-
-    for row in range(nrows):
-        for col in range(ncols):
-            axs[row, col] = fig.add_axes(
-                divider.get_position(),
-                axes_locator=divider.new_locator(nx=2 * col + 1, ny=2 * row + 1),
-            )
+    if static_layout:
+        engine = FixedLayoutEngine()
+        engine.geometry = geometry
+        fractions = geometry / (width, height, width, height)
+        for row in range(nrows):
+            for col in range(ncols):
+                axs[row, col] = fig.add_axes(fractions[row, col])
+                engine.add_axes(axs[row, col], geometry[row, col])
+        fig.set_layout_engine(engine)
+    else:
+        # Divider sizes alternate between the gap before a panel and the panel itself
+        lefts, widths = geometry[0, :, 0], geometry[0, :, 2]
+        bottoms, heights = geometry[:, 0, 1], geometry[:, 0, 3]
+        h_gaps = lefts - np.r_[0, lefts[:-1] + widths[:-1]]
+        v_gaps = bottoms - np.r_[0, bottoms[:-1] + heights[:-1]]
+        h = [Size.Fixed(size) for pair in zip(h_gaps, widths) for size in pair]
+        v = [Size.Fixed(size) for pair in zip(v_gaps, heights) for size in pair]
+
+        divider = Divider(fig, (0, 0, 1, 1), h, v, aspect=False)
+
+        for row in range(nrows):
+            for col in range(ncols):
+                axs[row, col] = fig.add_axes(
+                    divider.get_position(),
+                    axes_locator=divider.new_locator(nx=2 * col + 1, ny=2 * row + 1),
+                )
     if axs.size == 1:
         return fig, axs[0, 0]
     return fig, np.squeeze(axs)
 
 
+def fixed_size_mosaic(
+    mosaic: Union[str, Sequence[Sequence[Any]]],
+    wmargin: float = 0.7,
+    hmargin: float = 0.7,
+    colsep: Union[float, npt.ArrayLike] = 0,
+    rowsep: Union[float, npt.ArrayLike] = 0,
+    subheight: Union[float, npt.ArrayLike] = 2,
+    subwidth: Union[float, npt.ArrayLike] = 2,
+    rmargin_scale: float = 0.6,
+    tmargin_scale: float = 0.6,
+    empty_sentinel: Any = ".",
+    subplot_kw: Dict[str, Any] | None = None,
+    pyplot: bool = True,
+    canvas: Union[str, type] = "agg",
+    **fig_kw: ...,
+) -> Tuple[Figure, Dict[Hashable, Axes]]:
+    """Create a figure with panels of specific sizes laid out like `Figure.subplot_mosaic`.
+
+    Panels may span several rows or columns of the mosaic, cells may be left empty and a cell
+    may hold a nested mosaic, see `layout.fixed_size_mosaic_geometry`. Column widths and row
+    heights are in inches with the margins and separators of `fixed_size_subplots`; rows are
+    listed from the top down as in the mosaic. For example::
+
+        fig, axd = fixed_size_mosaic("AAB;CD.", subwidth=[2, 1, 1], subheight=[1.5, 1])
+
+    The rectangles of all panels are computed at once and placed by a `FixedLayoutEngine`,
+    so panels need no divider or axes locator.
+
+    Args:
+        mosaic (str | Sequence[Sequence[Any]]): Panel labels of the cells
+        wmargin (float, optional): size of width margins. Defaults to 0.7.
+        hmargin (float, optional): size of height margins. Defaults to 0.7.
+        colsep (float | npt.ArrayLike, optional): padding for column separation (width). Defaults to 0.
+        rowsep (float | npt.ArrayLike, optional): padding for row separation (height). Defaults to 0.
+        subheight (float | npt.ArrayLike, optional): row height(s). Defaults to 2.
+        subwidth (float | npt.ArrayLike, optional): column width(s). Defaults to 2.
+        rmargin_scale (float, optional): right margin scale factor. Defaults to 0.6.
+        tmargin_scale (float, optional): top margin scale factor. Defaults to 0.6.
+        empty_sentinel (Any, optional): Label of empty cells. Defaults to ".".
+        subplot_kw (Dict[str, Any], optional): Keyword arguments passed to add_axes() for
+            every panel. Defaults to None.
+        pyplot (bool, optional): create the figure with plt.figure(), see
+            `fixed_size_subplots`. Defaults to True.
+        canvas (str | type, optional): canvas of a figure created without pyplot. Defaults
+            to "agg".
+        **fig_kw: Additional keyword arguments passed to plt.figure() or Figure()
+
+    Returns:
+        fig, axd (Tuple[matplotlib.figure.Figure, Dict[Hashable, matplotlib.axes.Axes]]):
+        the figure and its axes by label, in reading order of the mosaic
+    """
+    width, height, labels, rects = fixed_size_mosaic_geometry(
+        mosaic,
+        wmargin=wmargin,
+        hmargin=hmargin,
+        colsep=colsep,
+        rowsep=rowsep,
+        subheight=subheight,
+        subwidth=subwidth,
+        rmargin_scale=rmargin_scale,
+        tmargin_scale=tmargin_scale,
+        empty_sentinel=empty_sentinel,
+    )
+    fig = _new_figure(width, height, pyplot, canvas, fig_kw)
+    engine = FixedLayoutEngine()
+    fractions = rects / (width, height, width, height)
+    axd = dict[Hashable, Axes]()
+    for label, rect, fraction in zip(labels, rects, fractions):
+        ax = fig.add_axes(fraction, label=str(label), **(subplot_kw or {}))
+        engine.add_axes(ax, rect)
+        axd[label] = ax
+    fig.set_layout_engine(engine)
+    return fig, axd
+
+
+def _new_figure(
+    width: float, height: float, pyplot: bool, canvas: Union[str, type], fig_kw: Any
+) -> Figure:
+    """A figure of a fixed size, managed by pyplot or with its own canvas."""
+    if pyplot:
+        import matplotlib.pyplot as plt
+
+        return plt.figure(figsize=(width, height), **fig_kw)
+    fig = Figure(figsize=(width, height), **fig_kw)
+    _canvas_class(canvas)(fig)
+    return fig
+
+
+def _canvas_class(canvas: Union[str, type]) -> type:
+    """FigureCanvas class of a canvas name."""
+    if not isinstance(canvas, str):
+        return canvas
+    name = canvas.lower()
+    if name == "agg":
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        return FigureCanvasAgg
+    if name == "pdf":
+        from matplotlib.backends.backend_pdf import FigureCanvasPdf
+
+        return FigureCanvasPdf
+    if name == "svg":
+        from matplotlib.backends.backend_svg import FigureCanvasSVG
+
+        return FigureCanvasSVG
+    raise ValueError(f"Unknown canvas {canvas!r}, expected 'agg', 'pdf' or 'svg'.")
+
+
+def uses_pyplot(fig: Figure) -> bool:
+    """Whether a figure is managed by pyplot.
+
+    Args:
+        fig (Figure): Figure of interest
+
+    Returns:
+        bool: True if the figure was created through pyplot and has not been closed
+    """
+    return fig.canvas.manager is not None
+
+
+def _sca(ax: Axes):
+    """Make an axes current in its figure, leaving the current pyplot figure unchanged."""
+    ax.get_figure(root=False).sca(ax)
+
+
+def _gca() -> Axes:
+    import matplotlib.pyplot as plt
+
+    return plt.gca()
+
+
 def get_renderer(fig: Figure) -> RendererBase:
     """Helper function to get the renderer depending on the context.
 
@@ -152,23 +333,47 @@ def add_colorbar(
 
     Args:
         im (mpl.image.AxesImage): The image to which the colorbar applies.
-        ax (mpl.axes.Axes, optional): The axes to draw the colorbar by. Defaults to None.
+        ax (mpl.axes.Axes, optional): The axes to draw the colorbar by. Defaults to None,
+            the current pyplot axes.
         aspect (float, optional): Aspect width scaled to current axis. Defaults to 20.
         pad_fraction (float, optional): Padding spacing. Defaults to 0.5.
 
     Returns:
         -> mpl.colorbar.Colorbar: Colorbar instance
+
+    Note:
+        *ax* remains the current axes of its figure. The current pyplot figure is not
+        changed, so figures can be built in parallel threads.
     """
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     divider = axes_grid1.make_axes_locatable(ax)
     width = axes_grid1.axes_size.AxesY(ax, aspect=1.0 / aspect)
     pad = axes_grid1.axes_size.Fraction(pad_fraction, width)
     cax = divider.append_axes("right", size=width, pad=pad)
-    plt.sca(ax)
+    _sca(ax)
     return im.axes.figure.colorbar(im, cax=cax, **kwargs)
 
 
+def fixed_colorbar_axes(ax: Axes, aspect: float = 20, pad: float = 0.05) -> Axes:
+    """Add an empty axes for a vertical color bar with fixed non-floating subplots.
+
+    The colorbar axes is a side panel of the divider shared by all side panels of *ax*,
+    see `dividers.fixed_size_divider`, so further colorbars are stacked to the right.
+
+    Args:
+        ax (mpl.axes.Axes): The axes to draw the colorbar by.
+        aspect (float, optional): Ratio of the axes width to the colorbar width.
+            Defaults to 20.
+        pad (float, optional): Padding spacing in inches. Defaults to 0.05.
+
+    Returns:
+        mpl.axes.Axes: The colorbar axes
+    """
+    width, _ = get_panel_size_inches(ax)
+    return fixed_size_divider(ax).append_fixed_axes("right", width / aspect, pad)
+
+
 def add_fixed_colorbar(
     im: AxesImage,
     ax: Axes | None,
@@ -180,26 +385,25 @@ def add_fixed_colorbar(
 
     Args:
         im (mpl.image.AxesImage): The image to which the colorbar applies.
-        ax (mpl.axes.Axes, optional): The axes to draw the colorbar by. Defaults to None.
-        aspect (float, optional): Aspect width in inches. Defaults to 20.
+        ax (mpl.axes.Axes, optional): The axes to draw the colorbar by. Defaults to None,
+            the current pyplot axes.
+        aspect (float, optional): Ratio of the axes width to the colorbar width.
+            Defaults to 20.
         pad (float, optional): Padding spacing in inches. Defaults to 0.05.
         **kwargs: Additional keyword arguments passed to colorbar().
 
     Returns:
         mpl.colorbar.Colorbar: Colorbar instance
 
+    Note:
+        The colorbar axes becomes the current axes of its figure. The current pyplot figure
+        is not changed, so figures can be built in parallel threads.
     """
     if ax is None:
-        ax = plt.gca()
-
-    divider = FixedSizeDivider(ax)
-    divider.set_locator(ax.get_axes_locator())
+        ax = _gca()
 
-    cax = ax.figure.add_axes(
-        divider.get_position(),
-        axes_locator=divider.new_right_locator(pad, aspect),
-    )
-    plt.sca(cax)
+    cax = fixed_colorbar_axes(ax, aspect, pad)
+    _sca(cax)
 
     # Hard-coded alternative which does not defer final placement until draw time.
     # renderer = get_renderer(fig)
@@ -220,6 +424,89 @@ def add_fixed_colorbar(
     return im.axes.figure.colorbar(im, cax=cax, **kwargs)
 
 
+def add_shared_colorbar(
+    mappable: ScalarMappable,
+    axs: Union[Axes, npt.ArrayLike],
+    row: int | None = None,
+    col: int | None = None,
+    width: float = 0.1,
+    pad: float = 0.1,
+    margin: float = 0.6,
+    **kwargs,
+) -> Colorbar:
+    """Add a single vertical color bar spanning several fixed size panels.
+
+    The color bar is placed *pad* inches right of the combined extent of the selected panels
+    and spans their full height. The figure is widened if the color bar and *margin* inches
+    for its labels do not fit; fixed size layouts keep the panels in place. Panels right of
+    the selection are not moved, so the selection should usually end in the last column.
+
+    Args:
+        mappable (ScalarMappable): The image or collection the colorbar applies to.
+        axs (mpl.axes.Axes | npt.ArrayLike): Axes from `fixed_size_subplots`.
+        row (int, optional): Only span this row of a 2D *axs*, row 0 being the bottom row.
+            Defaults to None.
+        col (int, optional): Only span this column of a 2D *axs*. Defaults to None.
+        width (float, optional): Width of the colorbar in inches. Defaults to 0.1.
+        pad (float, optional): Padding spacing in inches. Defaults to 0.1.
+        margin (float, optional): Space for the labels right of the colorbar in inches.
+            Defaults to 0.6.
+        **kwargs: Additional keyword arguments passed to colorbar().
+
+    Raises:
+        ValueError: If *row* or *col* is given for an axes array which is not 2D.
+
+    Returns:
+        mpl.colorbar.Colorbar: Colorbar instance
+    """
+    axs = np.asarray(axs, dtype=object)
+    if row is not None or col is not None:
+        if axs.ndim != 2:
+            raise ValueError("row and col select from a 2D array of axes.")
+        axs = axs[
+            slice(None) if row is None else row, slice(None) if col is None else col
+        ]
+    selected = list(np.ravel(axs))
+    fig = selected[0].get_figure(root=True)
+    fig_w, fig_h = fig.get_size_inches()
+
+    bounds = np.array([get_panel_bounds(ax) for ax in selected]) * (
+        fig_w,
+        fig_h,
+        fig_w,
+        fig_h,
+    )
+    x1 = np.max(bounds[:, 0] + bounds[:, 2])
+    y0 = np.min(bounds[:, 1])
+    y1 = np.max(bounds[:, 1] + bounds[:, 3])
+    rect = (x1 + pad, y0, width, y1 - y0)
+
+    required = rect[0] + width + margin
+    if required > fig_w:
+        fig.set_size_inches(required, fig_h)
+        fig_w = required
+
+    fractions = np.divide(rect, (fig_w, fig_h, fig_w, fig_h))
+    engine = fig.get_layout_engine()
+    if isinstance(engine, FixedLayoutEngine):
+        cax = fig.add_axes(fractions)
+        engine.add_axes(cax, rect)
+    else:
+        cax = fig.add_axes(
+            fractions, axes_locator=functools.partial(_locate_inches, rect)
+        )
+    return fig.colorbar(mappable, cax=cax, **kwargs)
+
+
+def _locate_inches(
+    rect: Tuple[float, float, float, float], ax: Axes, renderer: RendererBase
+) -> mtransforms.Bbox:
+    """Axes locator of a rectangle fixed in inches from the lower left of the figure."""
+    fig_w, fig_h = ax.get_figure(root=True).get_size_inches()
+    x, y, w, h = rect
+    return mtransforms.Bbox.from_bounds(x / fig_w, y / fig_h, w / fig_w, h / fig_h)
+
+
 def get_aspect(ax: Axes) -> float:
     """Get the aspect ratio of a particular axis.
 
@@ -244,28 +531,121 @@ def get_aspect(ax: Axes) -> float:
     return disp_ratio / data_ratio
 
 
-def custom_cmap(
-    label: str, ticklabels, size: int = 256, cmap: Colormap = mpl.colormaps["RdPu"]
-):
+class _CmapKey:
+    """Cache key of a colormap, equal to keys of colormaps with the same colors."""
+
+    __slots__ = ("cmap", "_hash")
+
+    def __init__(self, cmap: Colormap):
+        self.cmap = cmap
+        self._hash = hash((cmap.name, cmap.N))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _CmapKey) and self.cmap == other.cmap
+
+
+def discrete_cmap(
+    n: int,
+    cmap: Union[str, Colormap] = "RdPu",
+    bounds: npt.ArrayLike | None = None,
+) -> Tuple[ListedColormap, BoundaryNorm]:
+    """Get a colormap and norm for *n* discrete categories.
+
+    The colors are sampled evenly from *cmap* in a single call. Results are cached on
+    (cmap, n, bounds) and shared between callers, so they must not be modified.
+
+    Args:
+        n (int): Number of categories
+        cmap (str | Colormap, optional): Colormap to sample. Defaults to "RdPu".
+        bounds (npt.ArrayLike, optional): The n + 1 boundaries of the categories. Defaults to
+            integer categories 0 to n - 1, i.e. boundaries at -0.5, 0.5, ..., n - 0.5.
+
+    Raises:
+        ValueError: If the number of boundaries is not n + 1.
+
+    Returns:
+        Tuple[ListedColormap, BoundaryNorm]: Colormap and norm
     """
-    Function to define colormap
+    key = cmap if isinstance(cmap, str) else _CmapKey(cmap)
+    if bounds is not None:
+        bounds = tuple(np.asarray(bounds, dtype=float).tolist())
+        if len(bounds) != n + 1:
+            raise ValueError(f"Expected {n + 1} boundaries, got {len(bounds)}.")
+    return _discrete_cmap(key, n, bounds)
+
+
+@functools.lru_cache(maxsize=256)
+def _discrete_cmap(
+    key: Union[str, _CmapKey], n: int, bounds: Tuple[float, ...] | None
+) -> Tuple[ListedColormap, BoundaryNorm]:
+    base = mpl.colormaps[key] if isinstance(key, str) else key.cmap
+    colors = base(np.linspace(0, 1, n))
+    cmap = ListedColormap(colors, name=f"{base.name}_{n}")
+    if bounds is None:
+        bounds = np.arange(n + 1) - 0.5
+    return cmap, BoundaryNorm(bounds, n)
+
+
+def custom_cmap(
+    label: str,
+    ticklabels: Sequence[str],
+    size: int | None = None,
+    cmap: Union[str, Colormap] = "RdPu",
+    ax: Axes | None = None,
+    bounds: npt.ArrayLike | None = None,
+    aspect: float = 20,
+    pad: float = 0.05,
+    categorical: bool = False,
+) -> Tuple[ListedColormap, BoundaryNorm, Any]:
+    """Define a discrete colormap for categories and add its colorbar next to an axes.
+
+    The colormap and norm come from `discrete_cmap`, and the colorbar axes from
+    `fixed_colorbar_axes`. Each category is labelled at the center of its color.
+    For many categories use *categorical*, which labels only the categories that fit
+    the height of the colorbar, see `categorical.categorical_colorbar`.
+
+    Args:
+        label (str): Label of the colorbar
+        ticklabels (Sequence[str]): Label of each category
+        size (int, optional): Number of boundaries. Defaults to len(ticklabels) + 1.
+        cmap (str | Colormap, optional): Colormap to sample. Defaults to "RdPu".
+        ax (mpl.axes.Axes, optional): The axes to draw the colorbar by. Defaults to None,
+            the current pyplot axes.
+        bounds (npt.ArrayLike, optional): Boundaries of the categories. Defaults to integer
+            categories, see `discrete_cmap`.
+        aspect (float, optional): Width of the strip relative to the axes width, as a
+            divisor: the strip is the axes width divided by *aspect*. Defaults to 20.
+        pad (float, optional): Padding spacing in inches. Defaults to 0.05.
+        categorical (bool, optional): Draw a `categorical.CategoricalColorbar` with integer
+            categories, ignoring *size* and *bounds*. Defaults to False.
+
+    Returns:
+        Tuple[ListedColormap, BoundaryNorm, Colorbar | CategoricalColorbar]: Colormap, norm
+        and colorbar
     """
-    cmaplist = [cmap(i) for i in range(cmap.N)]
-    cmap = LinearSegmentedColormap.from_list("Custom cmap", cmaplist, cmap.N)
-    bounds = np.linspace(0, 1, size)
-    norm = BoundaryNorm(bounds, cmap.N)
-    val = (float(bounds[1]) - float(bounds[0])) / 2
-    ticks = np.linspace(val, 1 - val, size - 1)
-
-    cax = fig.add_axes([0.92, 0.25, 0.02, 0.5])
-    cb = Colorbar(
-        cax,
-        cmap=cmap,
-        norm=norm,
+    if ax is None:
+        ax = _gca()
+    if categorical:
+        from .categorical import categorical_colorbar
+
+        cb = categorical_colorbar(ax, ticklabels, cmap, label, aspect, pad)
+        return cb.cmap, cb.norm, cb
+
+    n = len(ticklabels) if size is None else size - 1
+    cmap, norm = discrete_cmap(n, cmap, bounds)
+    edges = norm.boundaries
+    ticks = (edges[:-1] + edges[1:]) / 2
+
+    cax = fixed_colorbar_axes(ax, aspect, pad)
+    cb = ax.figure.colorbar(
+        ScalarMappable(norm=norm, cmap=cmap),
+        cax=cax,
         spacing="proportional",
         ticks=ticks,
-        boundaries=bounds,
-        format="%1i",
         label=label,
     )
-    cb.ax.set_yticklabels(ticklabels)  # vertically oriented colorbar
+    cb.set_ticklabels(ticklabels)  # vertically oriented colorbar
+    return cmap, norm, cb
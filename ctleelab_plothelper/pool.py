@@ -0,0 +1,431 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""A pool of reusable fixed size figures.
+
+Building the axes of a figure (spines, axis, tickers and texts) dominates the cost of small
+plots. A `FigurePool` keeps released figures and hands them out again for the same layout
+parameters and style, after removing the artists that were added and restoring the axes
+state recorded when the figure was built. The axes objects and their layout are kept.
+
+The reset is targeted rather than a call of ``Axes.cla``, which rebuilds the tickers and
+texts and costs about as much as a new figure. Any state the reset does not restore, e.g. a
+categorical unit converter or changed tick parameters, is detected by comparing fingerprints
+of the figure before and after its use, and the figure is discarded instead of reused.
+"""
+
+import contextlib
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import matplotlib as mpl
+import matplotlib.transforms as mtransforms
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from .cache import CacheStats, _style_items, hash_inputs
+from .layout import FixedLayoutEngine
+from .plothelpers import fixed_size_subplots, uses_pyplot
+from .styles import StyleSpec, style_context
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, Iterator, Optional, Sequence, Tuple, Union
+
+
+@dataclass
+class PoolStats(CacheStats):
+    """Reuse counts of a `FigurePool`.
+
+    A hit is an acquired figure taken from the pool, a miss a newly built one, an eviction
+    an idle figure closed to respect the pool size and a leak a released figure whose state
+    could not be restored.
+    """
+
+    leaks: int = 0
+
+
+def _axis_state(axis) -> Tuple[Any, ...]:
+    return (
+        axis.get_major_locator(),
+        axis.get_major_formatter(),
+        axis.get_minor_locator(),
+        axis.get_minor_formatter(),
+        axis.isDefault_majloc,
+        axis.isDefault_majfmt,
+        axis.isDefault_minloc,
+        axis.isDefault_minfmt,
+    )
+
+
+def _axis_fingerprint(axis) -> Tuple[Any, ...]:
+    return (
+        *map(id, _axis_state(axis)[:4]),
+        *_axis_state(axis)[4:],
+        axis.get_scale(),
+        axis.get_converter() is None,
+        axis.get_units() is None,
+        sorted(axis.get_tick_params(which="major").items()),
+        sorted(axis.get_tick_params(which="minor").items()),
+        axis.get_label_position(),
+        axis.label.get_text(),
+        axis.label.get_fontsize(),
+        axis.get_visible(),
+    )
+
+
+def _axes_fingerprint(ax: Axes) -> Tuple[Any, ...]:
+    """State of an axes which a reset must leave as it was built."""
+    return (
+        ax.get_xlim(),
+        ax.get_ylim(),
+        ax.get_autoscalex_on(),
+        ax.get_autoscaley_on(),
+        ax.margins(),
+        ax.use_sticky_edges,
+        ax.get_aspect(),
+        ax.get_adjustable(),
+        ax.get_anchor(),
+        ax.axison,
+        ax.get_frame_on(),
+        ax.get_visible(),
+        ax.get_facecolor(),
+        ax.get_axes_locator(),
+        ax.get_position(original=True).bounds,
+        ax.get_navigate(),
+        ax.get_zorder(),
+        tuple((name, s.get_visible()) for name, s in ax.spines.items()),
+        tuple((t.get_text(), t.get_fontsize()) for t in _titles(ax)),
+        len(ax.get_children()),
+        _axis_fingerprint(ax.xaxis),
+        _axis_fingerprint(ax.yaxis),
+    )
+
+
+def _figure_fingerprint(fig: Figure, axes: Sequence[Axes]) -> Tuple[Any, ...]:
+    """State of a figure which a reset must leave as it was built."""
+    return (
+        tuple(fig.get_size_inches()),
+        fig.dpi,
+        fig.get_facecolor(),
+        fig.get_layout_engine(),
+        len(fig.subfigs),
+        len(fig.get_children()),
+        tuple(map(id, fig.axes)) == tuple(map(id, axes)),
+        tuple(_axes_fingerprint(ax) for ax in axes),
+    )
+
+
+def _titles(ax: Axes) -> Tuple[Any, ...]:
+    return ax.title, ax._left_title, ax._right_title
+
+
+class _AxesState:
+    """Restorable state of an axes as built."""
+
+    def __init__(self, ax: Axes):
+        self.xlim = ax.get_xlim()
+        self.ylim = ax.get_ylim()
+        self.autoscale = (ax.get_autoscalex_on(), ax.get_autoscaley_on())
+        self.margins = ax.margins()
+        self.scales = (ax.get_xscale(), ax.get_yscale())
+        self.aspect = (ax.get_aspect(), ax.get_adjustable(), ax.get_anchor())
+        self.facecolor = ax.get_facecolor()
+        self.axison = ax.axison
+        self.locator = ax.get_axes_locator()
+        self.spines = {name: s.get_visible() for name, s in ax.spines.items()}
+        self.tickers = (_axis_state(ax.xaxis), _axis_state(ax.yaxis))
+        # Axes read the property cycle from the rcParams when they are built
+        self.prop_cycle = mpl.rcParams["axes.prop_cycle"]
+
+    def restore(self, ax: Axes):
+        """Remove the artists added to an axes and restore its state."""
+        if ax.legend_ is not None:
+            ax.legend_.remove()
+        for container in list(ax.containers):
+            container.remove()
+        for artist in [
+            *ax.images,
+            *ax.collections,
+            *ax.lines,
+            *ax.patches,
+            *ax.texts,
+            *ax.tables,
+            *ax.artists,
+            *ax.child_axes,
+        ]:
+            artist.remove()
+        for text in (*_titles(ax), ax.xaxis.label, ax.yaxis.label):
+            text.set_text("")
+        ax.set_prop_cycle(self.prop_cycle)
+
+        if (ax.get_xscale(), ax.get_yscale()) != self.scales:
+            ax.set_xscale(self.scales[0])
+            ax.set_yscale(self.scales[1])
+        for axis, state in zip((ax.xaxis, ax.yaxis), self.tickers):
+            if _axis_state(axis) != state:
+                axis.set_major_locator(state[0])
+                axis.set_major_formatter(state[1])
+                axis.set_minor_locator(state[2])
+                axis.set_minor_formatter(state[3])
+                (
+                    axis.isDefault_majloc,
+                    axis.isDefault_majfmt,
+                    axis.isDefault_minloc,
+                    axis.isDefault_minfmt,
+                ) = state[4:]
+
+        # Forget the data limits of the removed artists, as Axes.cla does
+        ax.dataLim.set_points(mtransforms.Bbox.null().get_points())
+        ax.ignore_existing_data_limits = True
+        if ax.margins() != self.margins:
+            ax.margins(*self.margins)
+        # Set after the margins, which request autoscaling on the next draw
+        ax.set_xlim(self.xlim)
+        ax.set_ylim(self.ylim)
+        ax.set_autoscalex_on(self.autoscale[0])
+        ax.set_autoscaley_on(self.autoscale[1])
+
+        aspect, adjustable, anchor = self.aspect
+        if (ax.get_aspect(), ax.get_adjustable(), ax.get_anchor()) != self.aspect:
+            ax.set_aspect(aspect, adjustable=adjustable, anchor=anchor)
+        if ax.get_facecolor() != self.facecolor:
+            ax.set_facecolor(self.facecolor)
+        if ax.get_axes_locator() is not self.locator:
+            # e.g. replaced by make_axes_locatable
+            ax.set_axes_locator(self.locator)
+        if ax.axison != self.axison:
+            ax.set_axis_on() if self.axison else ax.set_axis_off()
+        for name, visible in self.spines.items():
+            ax.spines[name].set_visible(visible)
+
+
+class _Pooled:
+    """A pooled figure with the state to restore on release."""
+
+    def __init__(
+        self, key: str, fig: Figure, axs: Union[Axes, npt.NDArray[np.object_]]
+    ):
+        self.key = key
+        self.figure = fig
+        self.axs = axs
+        self.axes = list(fig.axes)
+        self.size = tuple(fig.get_size_inches())
+        self.dpi = fig.dpi
+        self.facecolor = fig.get_facecolor()
+        self.states = [_AxesState(ax) for ax in self.axes]
+        self.fingerprint = _figure_fingerprint(fig, self.axes)
+
+    def reset(self) -> bool:
+        """Restore the figure as built.
+
+        Returns:
+            bool: Whether the figure is clean and may be reused
+        """
+        fig = self.figure
+        engine = fig.get_layout_engine()
+        kept = set(map(id, self.axes))
+        for ax in fig.axes:
+            if id(ax) not in kept:
+                # Colorbars, twins and insets added during use
+                if isinstance(engine, FixedLayoutEngine):
+                    with contextlib.suppress(KeyError):
+                        engine.remove_axes(ax)
+                ax.remove()
+        for artist in [
+            *fig.legends,
+            *fig.texts,
+            *fig.lines,
+            *fig.patches,
+            *fig.images,
+            *fig.artists,
+        ]:
+            artist.remove()
+        for ax, state in zip(self.axes, self.states):
+            state.restore(ax)
+
+        if tuple(fig.get_size_inches()) != self.size or fig.dpi != self.dpi:
+            fig.set_size_inches(self.size, forward=False)
+            fig.set_dpi(self.dpi)
+            if isinstance(engine, FixedLayoutEngine):
+                engine.execute(fig)
+        if fig.get_facecolor() != self.facecolor:
+            fig.set_facecolor(self.facecolor)
+        return _figure_fingerprint(fig, self.axes) == self.fingerprint
+
+
+class FigurePool:
+    """
+    A bounded pool of `fixed_size_subplots` figures which are reset and reused.
+
+    Figures are keyed on their layout parameters and the effective rcParams of their style,
+    and handed out by `acquire` and returned by `release`. Released figures are reset to the
+    state in which they were built and kept idle for reuse, up to *maxsize* figures; the
+    least recently released figures are closed beyond that. Figures whose state leaked
+    through the reset are closed instead of being reused. A pool may be shared by threads,
+    each using its own figures.
+
+    Example:
+        >>> pool = FigurePool()
+        >>> for data in batches:
+        ...     with pool.figure(nrows=2, ncols=2, static_layout=True) as (fig, axs):
+        ...         axs[0, 0].plot(data)
+        ...         fig.savefig(...)
+    """
+
+    def __init__(self, maxsize: int = 8, strict: bool = False):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of idle figures. Defaults to 8.
+            strict (bool, optional): Raise instead of discarding a figure whose state
+                leaked. Defaults to False.
+        """
+        self.maxsize = maxsize
+        self.strict = strict
+        self.stats = PoolStats()
+        self._idle = OrderedDict[int, _Pooled]()
+        self._in_use = dict[int, _Pooled]()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of idle figures."""
+        return len(self._idle)
+
+    def key(
+        self,
+        style: Union[StyleSpec, Sequence[StyleSpec], None] = None,
+        **layout: Any,
+    ) -> str:
+        """Pool key of a layout and style.
+
+        Args:
+            style (StyleSpec | Sequence[StyleSpec], optional): Style stack. Defaults to None.
+            **layout: Keyword arguments of `fixed_size_subplots`
+
+        Returns:
+            str: Hex digest
+        """
+        return hash_inputs(layout, _style_items(style))
+
+    def acquire(
+        self,
+        style: Union[StyleSpec, Sequence[StyleSpec], None] = None,
+        **layout: Any,
+    ) -> Tuple[Figure, Union[Axes, npt.NDArray[np.object_]]]:
+        """Take a figure from the pool, or build one.
+
+        The style is applied while a new figure is built, and is part of the key. Artists
+        added to the figure afterwards use the rcParams active at that time, see `figure`.
+
+        Args:
+            style (StyleSpec | Sequence[StyleSpec], optional): Style stack. Defaults to None.
+            **layout: Keyword arguments of `fixed_size_subplots`
+
+        Returns:
+            fig, axs (Tuple[Figure, Axes | npt.NDArray[Axes]]): As returned by
+            `fixed_size_subplots`
+        """
+        key = self.key(style, **layout)
+        with self._lock:
+            pooled = self._take(key)
+        if pooled is None:
+            with (
+                style_context(style) if style is not None else contextlib.nullcontext()
+            ):
+                fig, axs = fixed_size_subplots(**layout)
+            pooled = _Pooled(key, fig, axs)
+        with self._lock:
+            self._in_use[id(pooled.figure)] = pooled
+        return pooled.figure, pooled.axs
+
+    def _take(self, key: str) -> Optional[_Pooled]:
+        """Remove the most recently released idle figure of a key from the pool."""
+        for fid in reversed(self._idle):
+            if self._idle[fid].key == key:
+                self.stats.hits += 1
+                return self._idle.pop(fid)
+        self.stats.misses += 1
+        return None
+
+    def release(self, fig: Figure):
+        """Reset a figure and return it to the pool.
+
+        Args:
+            fig (Figure): Figure from `acquire`
+
+        Raises:
+            KeyError: If the figure was not acquired from this pool.
+            RuntimeError: If the pool is strict and the figure state leaked.
+        """
+        with self._lock:
+            pooled = self._in_use.get(id(fig))
+            if pooled is None or pooled.figure is not fig:
+                raise KeyError("Figure was not acquired from this pool.")
+            del self._in_use[id(fig)]
+        try:
+            clean = pooled.reset()
+        except Exception:
+            clean = False
+        if not clean:
+            with self._lock:
+                self.stats.leaks += 1
+            _close(fig)
+            if self.strict:
+                raise RuntimeError("Figure state leaked through the pool reset.")
+            return
+        evicted = list[_Pooled]()
+        with self._lock:
+            self._idle[id(fig)] = pooled
+            while len(self._idle) > self.maxsize:
+                evicted.append(self._idle.popitem(last=False)[1])
+                self.stats.evictions += 1
+        for old in evicted:
+            _close(old.figure)
+
+    @contextlib.contextmanager
+    def figure(
+        self,
+        style: Union[StyleSpec, Sequence[StyleSpec], None] = None,
+        **layout: Any,
+    ) -> Iterator[Tuple[Figure, Union[Axes, npt.NDArray[np.object_]]]]:
+        """Use a pooled figure within a context, under its style.
+
+        Args:
+            style (StyleSpec | Sequence[StyleSpec], optional): Style stack. Defaults to None.
+            **layout: Keyword arguments of `fixed_size_subplots`
+
+        Yields:
+            fig, axs (Tuple[Figure, Axes | npt.NDArray[Axes]]): The pooled figure
+        """
+        with style_context(style) if style is not None else contextlib.nullcontext():
+            fig, axs = self.acquire(style, **layout)
+            try:
+                yield fig, axs
+            finally:
+                self.release(fig)
+
+    def clear(self):
+        """Close all idle figures."""
+        with self._lock:
+            idle = list(self._idle.values())
+            self._idle.clear()
+        for pooled in idle:
+            _close(pooled.figure)
+
+
+def _close(fig: Figure):
+    if uses_pyplot(fig):
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
@@ -0,0 +1,329 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Per-phase timing of figure draws and exports.
+
+The instrumentation is installed on the matplotlib classes only while a profile is active,
+so there is no overhead otherwise. Phases nest, e.g. ``axes`` within ``draw`` within
+``savefig``; each phase records its inclusive time and its self time excluding nested phases.
+The self time of ``savefig`` is therefore the time spent encoding the file.
+"""
+
+import functools
+import json
+import time
+
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+from matplotlib.axes import Axes
+from matplotlib.axis import Axis
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+from .layout import FixedLayoutEngine
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PHASES = ("savefig", "draw", "layout", "locate", "axes", "ticks", "text")
+
+
+@dataclass
+class PhaseStats:
+    """Call count and cumulative time of a phase."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    self_seconds: float = 0.0
+
+
+class RenderProfile:
+    """
+    Timings of draws and exports, per phase and per axes.
+
+    Phases are ``savefig`` (calls of `Figure.savefig`), ``draw`` (figure draws), ``layout``
+    (`layout.FixedLayoutEngine` solves), ``locate`` (axes locators, e.g. of
+    `fixed_size_subplots` and `dividers.FixedSizeDivider`), ``axes`` (axes draws), ``ticks``
+    (tick computation) and ``text`` (text layout).
+    """
+
+    def __init__(self, fig: Optional[Figure] = None):
+        """
+        Args:
+            fig (Figure, optional): Only record this figure. Defaults to None, recording all.
+        """
+        self.figure = fig
+        self.phases = defaultdict[str, PhaseStats](PhaseStats)
+        self.axes = dict[Axes, Dict[str, PhaseStats]]()
+        self._stack = list[float]()
+
+    def accepts(self, fig: Optional[Figure]) -> bool:
+        """Whether events of a figure are recorded."""
+        return self.figure is None or fig is self.figure
+
+    def _push(self):
+        self._stack.append(0.0)
+
+    def _pop(self, phase: str, ax: Optional[Axes], elapsed: float):
+        children = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+        stats = [self.phases[phase]]
+        if ax is not None:
+            stats.append(self.axes.setdefault(ax, {}).setdefault(phase, PhaseStats()))
+        for s in stats:
+            s.calls += 1
+            s.seconds += elapsed
+            s.self_seconds += elapsed - children
+
+    def report(self) -> Dict[str, Any]:
+        """Structured report of the timings.
+
+        Returns:
+            Dict[str, Any]: ``{"phases": {phase: stats}, "axes": {label: {phase: stats}}}``
+            where each stats is a dict of ``calls``, ``seconds`` and ``self_seconds``
+        """
+        phases = {p: asdict(self.phases[p]) for p in PHASES if p in self.phases}
+        axes = {
+            _axes_label(ax): {p: asdict(stats[p]) for p in PHASES if p in stats}
+            for ax, stats in self.axes.items()
+        }
+        return {"phases": phases, "axes": axes}
+
+    def to_json(self, **kwargs) -> str:
+        """The `report` as JSON.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to json.dumps().
+
+        Returns:
+            str: JSON document
+        """
+        return json.dumps(self.report(), **kwargs)
+
+    def summary(self, top: int = 5) -> str:
+        """Compact text summary of the phases and the slowest axes.
+
+        Args:
+            top (int, optional): Number of axes to list. Defaults to 5.
+
+        Returns:
+            str: Summary table
+        """
+        report = self.report()
+        lines = [f"{'phase':<10}{'calls':>8}{'total ms':>11}{'self ms':>11}"]
+        for phase, s in report["phases"].items():
+            lines.append(
+                f"{phase:<10}{s['calls']:>8d}{s['seconds'] * 1e3:>11.2f}"
+                f"{s['self_seconds'] * 1e3:>11.2f}"
+            )
+        slowest = sorted(
+            report["axes"].items(),
+            key=lambda item: item[1].get("axes", {}).get("seconds", 0.0),
+            reverse=True,
+        )[:top]
+        if slowest:
+            lines.append(f"{'axes':<20}" + "".join(f"{p:>9}" for p in PHASES[3:]))
+            for label, stats in slowest:
+                lines.append(
+                    f"{label:<20}"
+                    + "".join(
+                        (
+                            f"{stats[p]['seconds'] * 1e3:>9.2f}"
+                            if p in stats
+                            else f"{'-':>9}"
+                        )
+                        for p in PHASES[3:]
+                    )
+                )
+        return "\n".join(lines)
+
+
+def _axes_label(ax: Axes) -> str:
+    """Label of an axes in reports."""
+    fig = ax.get_figure(root=True)
+    index = fig.axes.index(ax) if fig is not None and ax in fig.axes else "?"
+    label = ax.get_label()
+    return f"axes[{index}]" + (f" {label}" if label else "")
+
+
+_active = list[RenderProfile]()
+_originals = dict[Tuple[type, str], Any]()
+
+
+def _record(
+    phase: str,
+    func: Callable,
+    figure_of: Callable[..., Optional[Figure]],
+    axes_of: Callable[..., Optional[Axes]],
+) -> Callable:
+    """Wrap a function to record its calls into the active profiles."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return func(*args, **kwargs)
+        fig = figure_of(*args)
+        profiles = [p for p in _active if p.accepts(fig)]
+        if not profiles:
+            return func(*args, **kwargs)
+        for p in profiles:
+            p._push()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            ax = axes_of(*args)
+            for p in profiles:
+                p._pop(phase, ax, elapsed)
+
+    return wrapper
+
+
+def _root(artist: Any) -> Optional[Figure]:
+    fig = artist.get_figure(root=True) if artist is not None else None
+    return fig if isinstance(fig, Figure) else None
+
+
+def _no_axes(*args) -> None:
+    return None
+
+
+@contextmanager
+def _located(fig: Figure) -> Iterator[None]:
+    """Wrap the axes locators of a figure for the duration of a draw."""
+    wrapped = []
+    for ax in fig.axes:
+        locator = ax._axes_locator
+        if locator is not None:
+            # Assign directly, set_axes_locator() would mark the axes stale mid-draw
+            ax._axes_locator = _record(
+                "locate", locator, lambda ax, renderer: _root(ax), lambda ax, r: ax
+            )
+            wrapped.append((ax, locator))
+    try:
+        yield
+    finally:
+        for ax, locator in wrapped:
+            ax._axes_locator = locator
+
+
+def _figure_draw(func: Callable) -> Callable:
+    """Figure.draw, also timing the axes locators."""
+    timed = _record("draw", func, lambda fig, *a: _root(fig), _no_axes)
+
+    @functools.wraps(func)
+    def draw(self, renderer):
+        if not _active:
+            return func(self, renderer)
+        with _located(self):
+            return timed(self, renderer)
+
+    return draw
+
+
+# (class, method) -> wrapper factory
+_TARGETS: List[Tuple[type, str, Callable[[Callable], Callable]]] = [
+    (
+        Figure,
+        "savefig",
+        lambda f: _record("savefig", f, lambda fig, *a, **k: _root(fig), _no_axes),
+    ),
+    (Figure, "draw", _figure_draw),
+    (
+        FixedLayoutEngine,
+        "execute",
+        lambda f: _record("layout", f, lambda engine, fig: _root(fig), _no_axes),
+    ),
+    (
+        Axes,
+        "draw",
+        lambda f: _record("axes", f, lambda ax, *a: _root(ax), lambda ax, *a: ax),
+    ),
+    (
+        Axis,
+        "_update_ticks",
+        lambda f: _record(
+            "ticks", f, lambda axis: _root(axis.axes), lambda axis: axis.axes
+        ),
+    ),
+    (
+        Text,
+        "_get_layout",
+        lambda f: _record("text", f, lambda t, r: _root(t), lambda t, r: t.axes),
+    ),
+]
+
+
+def _install():
+    for owner, name, factory in _TARGETS:
+        original = getattr(owner, name)
+        _originals[owner, name] = owner.__dict__.get(name)
+        setattr(owner, name, factory(original))
+
+
+def _uninstall():
+    for (owner, name), original in _originals.items():
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+    _originals.clear()
+
+
+def enable_profiling(fig: Optional[Figure] = None) -> RenderProfile:
+    """Start recording draws and exports until `disable_profiling` is called.
+
+    Args:
+        fig (Figure, optional): Only record this figure. Defaults to None, recording all.
+
+    Returns:
+        RenderProfile: The profile being recorded
+    """
+    if not _active:
+        _install()
+    profile = RenderProfile(fig)
+    _active.append(profile)
+    return profile
+
+
+def disable_profiling(profile: Optional[RenderProfile] = None):
+    """Stop recording a profile started by `enable_profiling`.
+
+    Args:
+        profile (RenderProfile, optional): Profile to stop. Defaults to all active profiles.
+    """
+    if profile is None:
+        _active.clear()
+    elif profile in _active:
+        _active.remove(profile)
+    if not _active and _originals:
+        _uninstall()
+
+
+@contextmanager
+def profile_render(fig: Optional[Figure] = None) -> Iterator[RenderProfile]:
+    """Record the phases of the draws and exports within the context.
+
+    Args:
+        fig (Figure, optional): Only record this figure. Defaults to None, recording all.
+
+    Yields:
+        RenderProfile: The profile, complete once the context exits
+    """
+    profile = enable_profiling(fig)
+    try:
+        yield profile
+    finally:
+        disable_profiling(profile)
@@ -0,0 +1,162 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import io
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection, QuadMesh
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.spines import Spine
+
+from typing import Iterator, List
+
+# Rough size of one vertex or marker in SVG/PDF output
+BYTES_PER_PRIMITIVE = 20
+
+
+@dataclass
+class RasterizedArtist:
+    """An artist rasterized by `rasterize_heavy`."""
+
+    artist: Artist
+    axes_index: int
+    complexity: int
+    est_vector_bytes: int
+
+    def __str__(self) -> str:
+        label = self.artist.get_label() or type(self.artist).__name__
+        return (
+            f"axes {self.axes_index}: {type(self.artist).__name__} {label!r} "
+            f"({self.complexity} primitives, ~{self.est_vector_bytes} bytes)"
+        )
+
+
+def artist_complexity(artist: Artist) -> int:
+    """Estimate the number of primitives an artist writes to a vector file.
+
+    Lines count their vertices and markers, collections their vertices or markers,
+    meshes their cells, images their pixels and patches their vertices. Other artists,
+    including text, count as zero.
+
+    Args:
+        artist (Artist): Artist of interest
+
+    Returns:
+        int: Number of vertices, markers, cells or pixels
+    """
+    if isinstance(artist, Line2D):
+        n = len(artist.get_xydata())
+        if artist.get_marker() not in (None, "None", "none", "", " "):
+            n *= 2
+        return n
+    if isinstance(artist, QuadMesh):
+        return int(np.prod(artist.get_coordinates().shape[:2]))
+    if isinstance(artist, Collection):
+        paths = artist.get_paths()
+        n_offsets = len(artist.get_offsets())
+        if n_offsets > 1 and len(paths) <= 1:
+            # Markers (e.g. scatter) share a single path
+            return n_offsets
+        return sum(len(path.vertices) for path in paths)
+    if isinstance(artist, AxesImage):
+        array = artist.get_array()
+        return 0 if array is None else int(np.prod(array.shape[:2]))
+    if isinstance(artist, Patch):
+        return len(artist.get_path().vertices)
+    return 0
+
+
+@contextmanager
+def rasterize_heavy(
+    fig: Figure,
+    threshold: int = 10_000,
+    image_threshold: int = 1_000_000,
+) -> Iterator[List[RasterizedArtist]]:
+    """Rasterize complex data artists while exporting vector formats.
+
+    Data artists (lines, collections, meshes, images and patches) above the complexity
+    threshold are rasterized at the DPI of the export. Text, spines, axis ticks and labels,
+    legends and the axes backgrounds are never considered, so they stay editable vectors.
+    The previous rasterization settings are restored on exit.
+
+    Args:
+        fig (Figure): Figure to export
+        threshold (int, optional): Complexity above which artists are rasterized. Defaults to 10_000.
+        image_threshold (int, optional): Pixel count above which images are rasterized.
+            Defaults to 1_000_000.
+
+    Yields:
+        List[RasterizedArtist]: The rasterized artists
+    """
+    report = list[RasterizedArtist]()
+    for i, ax in enumerate(fig.axes):
+        for artist in ax.get_children():
+            if artist is ax.patch or isinstance(artist, Spine):
+                continue
+            if artist.get_rasterized():
+                continue
+            if not isinstance(artist, (Line2D, Collection, AxesImage, Patch)):
+                continue
+            complexity = artist_complexity(artist)
+            limit = image_threshold if isinstance(artist, AxesImage) else threshold
+            if complexity > limit:
+                report.append(
+                    RasterizedArtist(
+                        artist, i, complexity, complexity * BYTES_PER_PRIMITIVE
+                    )
+                )
+    for entry in report:
+        entry.artist.set_rasterized(True)
+    try:
+        yield report
+    finally:
+        for entry in report:
+            entry.artist.set_rasterized(False)
+
+
+def measure_rasterization(
+    fig: Figure,
+    format: str = "svg",
+    threshold: int = 10_000,
+    image_threshold: int = 1_000_000,
+    **savefig_kw,
+) -> int:
+    """Measure the bytes saved by `rasterize_heavy` for a format.
+
+    The figure is written twice to memory, with and without rasterization.
+
+    Args:
+        fig (Figure): Figure of interest
+        format (str, optional): Vector format to measure. Defaults to "svg".
+        threshold (int, optional): See `rasterize_heavy`. Defaults to 10_000.
+        image_threshold (int, optional): See `rasterize_heavy`. Defaults to 1_000_000.
+        **savefig_kw: Additional keyword arguments passed to savefig().
+
+    Returns:
+        int: Bytes saved
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, **savefig_kw)
+    vector_bytes = buffer.tell()
+
+    buffer = io.BytesIO()
+    with rasterize_heavy(fig, threshold, image_threshold):
+        fig.savefig(buffer, format=format, **savefig_kw)
+    return vector_bytes - buffer.tell()
@@ -0,0 +1,186 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import hashlib
+import importlib.resources
+import os
+import threading
+
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+
+import matplotlib as mpl
+import matplotlib.style
+
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, Union
+
+StyleSpec = Union[str, Path, Mapping[str, Any]]
+
+_STYLE_BLACKLIST = getattr(matplotlib.style, "_STYLE_BLACKLIST", None)
+if _STYLE_BLACKLIST is None:
+    from matplotlib.style.core import _STYLE_BLACKLIST
+
+# Style names resolved like matplotlib.style.use
+_STYLE_ALIASES = {"mpl20": "default", "mpl15": "classic"}
+
+# style name -> resolved style file
+_paths = dict[str, Union[Path, None]]()
+# (path, mtime, size) -> content digest
+_digests = dict[Tuple[str, int, int], str]()
+# content digests of the stack -> merged and validated rcParams
+_compiled = dict[Tuple[Any, ...], Mapping[str, Any]]()
+# guards the caches above, so styles can be compiled from several threads
+_lock = threading.RLock()
+
+
+def compile_style(style: Union[StyleSpec, Sequence[StyleSpec]]) -> Mapping[str, Any]:
+    """Compile a style stack into a single validated rcParams mapping.
+
+    Style specifications are resolved like `matplotlib.style.use`: dotted package names such as
+    ``"ctleelab_plothelper.base"``, library style names, ``"default"`` for the default
+    rcParams, paths to style files and dicts. Entries to the right take precedence. The result is cached on the contents of the style files, so
+    editing a style file invalidates the cache.
+
+    Args:
+        style (StyleSpec | Sequence[StyleSpec]): Style or list of styles to combine
+
+    Returns:
+        Mapping[str, Any]: Read-only mapping of the merged rcParams
+    """
+    styles = _as_list(style)
+    with _lock:
+        key = tuple(_style_key(spec) for spec in styles)
+        compiled = _compiled.get(key)
+        if compiled is None:
+            merged = dict[str, Any]()
+            for spec in styles:
+                merged.update(_load_style(spec))
+            compiled = MappingProxyType(merged)
+            _compiled[key] = compiled
+    return compiled
+
+
+@contextmanager
+def style_context(style: Union[StyleSpec, Sequence[StyleSpec]]) -> Iterator[None]:
+    """Drop-in replacement of `matplotlib.pyplot.style.context` using compiled style stacks.
+
+    The compiled rcParams are applied without re-reading or re-validating the style files.
+    As with `matplotlib.style.context`, all rcParams changed within the context are restored
+    on exit. The rcParams are global, so the context must not be entered while other threads
+    are building figures.
+
+    Args:
+        style (StyleSpec | Sequence[StyleSpec]): Style or list of styles to combine
+
+    Yields:
+        None
+    """
+    compiled = compile_style(style)
+    rc = mpl.rcParams
+    orig = dict(dict.items(rc))
+    # The backend is not reset, see matplotlib.rc_context
+    del orig["backend"]
+    _update_raw(rc, compiled)
+    try:
+        yield
+    finally:
+        _update_raw(rc, orig)
+
+
+def clear_style_cache():
+    """Discard all compiled style stacks."""
+    with _lock:
+        _paths.clear()
+        _digests.clear()
+        _compiled.clear()
+
+
+def _as_list(style: Union[StyleSpec, Sequence[StyleSpec]]) -> List[StyleSpec]:
+    """Normalize a style specification to a list."""
+    if isinstance(style, (str, Path)) or hasattr(style, "keys"):
+        style = [style]
+    return [
+        _STYLE_ALIASES.get(spec, spec) if isinstance(spec, str) else spec
+        for spec in style
+    ]
+
+
+def _style_path(spec: Union[str, Path]) -> Union[Path, None]:
+    """Find the file of a style specification, or None for library styles."""
+    if isinstance(spec, str) and spec in _paths:
+        return _paths[spec]
+    path = _find_style_path(spec)
+    if isinstance(spec, str):
+        _paths[spec] = path
+    return path
+
+
+def _find_style_path(spec: Union[str, Path]) -> Union[Path, None]:
+    """Resolve a style specification like `matplotlib.style.use`."""
+    if isinstance(spec, str):
+        if spec == "default" or spec in matplotlib.style.library:
+            return None
+        if "." in spec:
+            pkg, _, name = spec.rpartition(".")
+            try:
+                path = importlib.resources.files(pkg) / f"{name}.mplstyle"
+                if path.is_file():
+                    return Path(str(path))
+            except (ModuleNotFoundError, TypeError):
+                pass
+    path = Path(spec)
+    if not path.is_file():
+        raise OSError(
+            f"{spec!r} is not a valid package style, path of style file, or library style name."
+        )
+    return path
+
+
+def _style_key(spec: StyleSpec) -> Any:
+    """Cache key of a style specification based on its contents."""
+    if hasattr(spec, "keys"):
+        return tuple(sorted((k, repr(v)) for k, v in spec.items()))
+    path = _style_path(spec)
+    if path is None:
+        return ("library", spec)
+    stat = os.stat(path)
+    stat_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(stat_key)
+    if digest is None:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        _digests[stat_key] = digest
+    return ("file", digest)
+
+
+def _load_style(spec: StyleSpec) -> Dict[str, Any]:
+    """Load and validate a single style, dropping parameters unrelated to style."""
+    if hasattr(spec, "keys"):
+        rc = mpl.RcParams(spec)
+    else:
+        path = _style_path(spec)
+        if spec == "default":
+            # Read without the warnings of deprecated parameters
+            rc = dict(dict.items(mpl.rcParamsDefault))
+        elif path is None:
+            rc = matplotlib.style.library[spec]
+        else:
+            rc = mpl.rc_params_from_file(path, use_default_template=False)
+    return {k: rc[k] for k in rc if k not in _STYLE_BLACKLIST}
+
+
+def _update_raw(rc: mpl.RcParams, params: Mapping[str, Any]):
+    """Update rcParams without validation."""
+    if hasattr(rc, "_update_raw"):
+        rc._update_raw(params)
+    else:
+        dict.update(rc, params)
@@ -0,0 +1,419 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+"""Streaming post-processing of SVG files written by matplotlib.
+
+The optimizer reads the file with an incremental SAX parser and writes the result as it goes,
+so memory use is bounded by the nesting depth and the size of the deduplication table rather
+than the size of the file. Text elements are passed through unchanged, so text written with
+``svg.fonttype: none`` stays editable.
+"""
+
+import math
+import os
+import re
+import tempfile
+import xml.sax
+
+from dataclasses import dataclass
+from xml.sax.saxutils import escape, quoteattr
+
+from typing import Any, Dict, IO, List, Optional, Tuple, Union
+
+_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" standalone="no"?>\n'
+    '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n'
+    '  "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n'
+)
+
+# Initial values of the inherited presentation properties which are stripped when redundant
+_INHERITED_INITIAL = {
+    "fill": "#000000",
+    "fill-opacity": "1",
+    "fill-rule": "nonzero",
+    "stroke": "none",
+    "stroke-width": "1",
+    "stroke-opacity": "1",
+    "stroke-linecap": "butt",
+    "stroke-linejoin": "miter",
+    "stroke-miterlimit": "4",
+    "stroke-dasharray": "none",
+    "stroke-dashoffset": "0",
+}
+_NON_INHERITED_INITIAL = {"opacity": "1"}
+
+# Elements whose content is not rendered in place
+_DEFINITIONS = {"defs", "clipPath", "marker", "mask", "pattern", "symbol"}
+_TEXT = {"text", "tspan", "textPath"}
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_STAR_RULE = re.compile(r"\*\s*\{([^}]*)\}")
+
+
+@dataclass
+class SvgStats:
+    """Summary of an SVG optimization."""
+
+    bytes_in: int
+    bytes_out: int
+    decimals: int
+    paths_deduplicated: int
+    declarations_removed: int
+
+    @property
+    def ratio(self) -> float:
+        """Compression ratio of the input to the output size."""
+        return self.bytes_in / self.bytes_out if self.bytes_out else math.inf
+
+
+def precision_for_size(width_pt: float, height_pt: float, rel_tol: float = 1e-4) -> int:
+    """Number of decimals needed for coordinates of a drawing of a given physical size.
+
+    Args:
+        width_pt (float): Width in points
+        height_pt (float): Height in points
+        rel_tol (float, optional): Tolerated error relative to the smaller side. Defaults to 1e-4.
+
+    Returns:
+        int: Number of decimals
+    """
+    tol = min(width_pt, height_pt) * rel_tol
+    if tol <= 0:
+        return 6
+    return max(0, math.ceil(-math.log10(tol)))
+
+
+def optimize_svg(
+    src: Union[str, os.PathLike, IO[bytes]],
+    dst: Union[str, os.PathLike, IO[str], None] = None,
+    decimals: Optional[int] = None,
+    rel_tol: float = 1e-4,
+    min_length: int = 40,
+    max_entries: int = 10_000,
+) -> SvgStats:
+    """Optimize an SVG file written by matplotlib.
+
+    - Coordinates of paths and ``<use>`` positions are rounded to *decimals*, by default
+      derived from the physical size of the drawing with `precision_for_size`.
+    - Paths with the same geometry up to a translation are written once and then referenced
+      with ``<use>``. Only unclipped, untransformed paths are considered.
+    - Style declarations which repeat the inherited or initial value are removed, as well as
+      ``<use>`` declarations which the referenced element overrides.
+
+    Args:
+        src (str | os.PathLike | IO[bytes]): Input file
+        dst (str | os.PathLike | IO[str], optional): Output file. Defaults to replacing *src*.
+        decimals (int, optional): Decimals of coordinates. Defaults to None.
+        rel_tol (float, optional): Relative tolerance for the default decimals. Defaults to 1e-4.
+        min_length (int, optional): Minimum length of path data to deduplicate. Defaults to 40.
+        max_entries (int, optional): Maximum size of the deduplication table. Defaults to 10_000.
+
+    Returns:
+        SvgStats: Sizes and counts of the optimization
+    """
+    if dst is None:
+        if not isinstance(src, (str, os.PathLike)):
+            raise ValueError("dst is required when src is a file object.")
+        directory = os.path.dirname(os.fspath(src)) or "."
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=directory, suffix=".svg", delete=False
+        ) as out:
+            try:
+                stats = _optimize(src, out, decimals, rel_tol, min_length, max_entries)
+            except BaseException:
+                out.close()
+                os.unlink(out.name)
+                raise
+        os.replace(out.name, src)
+        return stats
+    if isinstance(dst, (str, os.PathLike)):
+        with open(dst, "w", encoding="utf-8") as out:
+            return _optimize(src, out, decimals, rel_tol, min_length, max_entries)
+    return _optimize(src, dst, decimals, rel_tol, min_length, max_entries)
+
+
+def _optimize(
+    src: Union[str, os.PathLike, IO[bytes]],
+    out: IO[str],
+    decimals: Optional[int],
+    rel_tol: float,
+    min_length: int,
+    max_entries: int,
+) -> SvgStats:
+    handler = _SvgOptimizer(out, decimals, rel_tol, min_length, max_entries)
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setFeature(xml.sax.handler.feature_namespaces, False)
+    parser.setFeature(xml.sax.handler.feature_external_ges, False)
+    if isinstance(src, (str, os.PathLike)):
+        bytes_in = os.path.getsize(src)
+        parser.parse(os.fspath(src))
+    else:
+        start = src.tell()
+        parser.parse(src)
+        bytes_in = src.tell() - start
+    handler.flush()
+    return SvgStats(
+        bytes_in,
+        handler.bytes_out,
+        handler.decimals,
+        handler.paths_deduplicated,
+        handler.declarations_removed,
+    )
+
+
+def _parse_style(style: str) -> List[Tuple[str, str]]:
+    """Split a style attribute into (property, value) declarations."""
+    declarations = []
+    for item in style.split(";"):
+        prop, sep, value = item.partition(":")
+        if sep:
+            declarations.append((prop.strip(), value.strip()))
+    return declarations
+
+
+class _SvgOptimizer(xml.sax.handler.ContentHandler):
+    """SAX handler writing the optimized document."""
+
+    def __init__(
+        self,
+        out: IO[str],
+        decimals: Optional[int],
+        rel_tol: float,
+        min_length: int,
+        max_entries: int,
+    ):
+        super().__init__()
+        self._out = out
+        self.decimals = 6 if decimals is None else decimals
+        self._auto_decimals = decimals is None
+        self._rel_tol = rel_tol
+        self._min_length = min_length
+        self._max_entries = max_entries
+
+        self.bytes_out = 0
+        self.paths_deduplicated = 0
+        self.declarations_removed = 0
+
+        # Pending start tag, written once it is known whether the element is empty
+        self._pending: Optional[str] = None
+        # Stack of (name, inherited style, inside definitions, inside text)
+        self._stack = list[Tuple[str, Dict[str, str], bool, bool]]()
+        self._star = dict[str, str]()
+        self._in_style = False
+        self._id_styles = dict[str, set]()
+        self._shapes = dict[Tuple[Any, ...], Tuple[str, float, float]]()
+        self._next_id = 0
+
+    # Output
+
+    def _write(self, text: str):
+        self.bytes_out += len(text.encode("utf-8"))
+        self._out.write(text)
+
+    def _flush_pending(self, close: bool = False):
+        if self._pending is not None:
+            self._write(self._pending + ("/>" if close else ">"))
+            self._pending = None
+            return True
+        return False
+
+    def flush(self):
+        self._flush_pending()
+        self._write("\n")
+
+    def startDocument(self):
+        self._write(_HEADER)
+
+    # Elements
+
+    def startElement(self, name: str, attrs: xml.sax.xmlreader.AttributesImpl):
+        self._flush_pending()
+        attributes = dict(attrs.items())
+
+        if name == "svg" and not self._stack and self._auto_decimals:
+            self.decimals = self._decimals_from_root(attributes)
+
+        inherited = self._stack[-1][1] if self._stack else dict(_INHERITED_INITIAL)
+        in_defs = (self._stack[-1][2] if self._stack else False) or name in _DEFINITIONS
+        in_text = (self._stack[-1][3] if self._stack else False) or name in _TEXT
+
+        declared = dict[str, str]()
+        if not in_text:
+            declared = self._optimize_style(name, attributes, inherited)
+            self._round_geometry(name, attributes)
+
+        effective = dict(inherited)
+        for prop in _INHERITED_INITIAL:
+            if prop in declared:
+                effective[prop] = declared[prop]
+            elif prop in attributes:
+                effective[prop] = attributes[prop]
+            elif prop in self._star:
+                effective[prop] = self._star[prop]
+
+        replacement = None
+        if name == "path" and not in_defs:
+            replacement = self._deduplicate(attributes, inherited)
+
+        self._stack.append((name, effective, in_defs, in_text))
+        self._in_style = name == "style"
+        if replacement is not None:
+            self._pending = replacement
+        else:
+            self._pending = f"<{name}" + "".join(
+                f" {key}={quoteattr(value)}" for key, value in attributes.items()
+            )
+
+    def endElement(self, name: str):
+        self._stack.pop()
+        self._in_style = False
+        if not self._flush_pending(close=True):
+            self._write(f"</{name}>")
+
+    def characters(self, content: str):
+        if self._in_style:
+            for rule in _STAR_RULE.findall(content):
+                self._star.update(_parse_style(rule))
+        if not content.strip() and not (self._stack and self._stack[-1][3]):
+            # Drop indentation between tags, which is not rendered outside of text
+            return
+        self._flush_pending()
+        self._write(escape(content))
+
+    def ignorableWhitespace(self, whitespace: str):
+        pass
+
+    # Optimizations
+
+    def _decimals_from_root(self, attributes: Dict[str, str]) -> int:
+        """Derive the coordinate precision from the physical size of the drawing."""
+        viewbox = attributes.get("viewBox")
+        if viewbox is not None:
+            numbers = [float(v) for v in _NUMBER.findall(viewbox)]
+            if len(numbers) == 4:
+                return precision_for_size(numbers[2], numbers[3], self._rel_tol)
+        return self.decimals
+
+    def _format(self, value: float) -> str:
+        text = f"{value:.{self.decimals}f}"
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return "0" if text in ("-0", "") else text
+
+    def _round_numbers(self, text: str) -> str:
+        return _NUMBER.sub(lambda m: self._format(float(m.group())), text)
+
+    def _round_geometry(self, name: str, attributes: Dict[str, str]):
+        if name == "path" and "d" in attributes:
+            attributes["d"] = " ".join(self._round_numbers(attributes["d"]).split())
+        elif name == "use":
+            for key in ("x", "y"):
+                if key in attributes:
+                    attributes[key] = self._round_numbers(attributes[key])
+
+    def _optimize_style(
+        self, name: str, attributes: Dict[str, str], inherited: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Remove redundant style declarations and return the remaining ones."""
+        if "style" not in attributes:
+            return {}
+        overridden = set()
+        if name == "use":
+            href = attributes.get("xlink:href", attributes.get("href", ""))
+            overridden = self._id_styles.get(href.lstrip("#"), set())
+
+        kept = list[Tuple[str, str]]()
+        for prop, value in _parse_style(attributes["style"]):
+            if prop in attributes:
+                # Inline style beats a presentation attribute, keep it
+                kept.append((prop, value))
+                continue
+            if prop in overridden:
+                redundant = True
+            elif prop in self._star:
+                redundant = value == self._star[prop]
+            elif prop in _INHERITED_INITIAL:
+                redundant = value == inherited[prop]
+            else:
+                redundant = value == _NON_INHERITED_INITIAL.get(prop)
+            if redundant:
+                self.declarations_removed += 1
+            else:
+                kept.append((prop, value))
+
+        if kept:
+            attributes["style"] = "; ".join(f"{p}: {v}" for p, v in kept)
+        else:
+            del attributes["style"]
+        if "id" in attributes:
+            self._id_styles[attributes["id"]] = {p for p, _ in kept}
+        return dict(kept)
+
+    def _deduplicate(
+        self, attributes: Dict[str, str], inherited: Dict[str, str]
+    ) -> Optional[str]:
+        """Replace a repeated path by a translated <use>, or register it for reuse."""
+        d = attributes.get("d", "")
+        if (
+            len(d) < self._min_length
+            or not d.startswith("M")
+            or {"id", "transform", "clip-path", "mask", "filter"} & attributes.keys()
+        ):
+            return None
+
+        tokens = d.split()
+        try:
+            x0, y0 = float(tokens[1]), float(tokens[2])
+        except (IndexError, ValueError):
+            return None
+        shape = self._normalize(tokens, x0, y0)
+        if shape is None:
+            return None
+
+        others = tuple(sorted((k, v) for k, v in attributes.items() if k != "d"))
+        key = (shape, others, tuple(sorted(inherited.items())))
+        entry = self._shapes.get(key)
+        if entry is not None:
+            ref, rx, ry = entry
+            self.paths_deduplicated += 1
+            return (
+                f'<use xlink:href="#{ref}" x="{self._format(x0 - rx)}" '
+                f'y="{self._format(y0 - ry)}"'
+            )
+        if len(self._shapes) < self._max_entries:
+            ref = f"dp{self._next_id:x}"
+            self._next_id += 1
+            attributes["id"] = ref
+            self._shapes[key] = (ref, x0, y0)
+        return None
+
+    def _normalize(self, tokens: List[str], x0: float, y0: float) -> Optional[str]:
+        """Path data relative to its first point, or None if it is not absolute pairs."""
+        normalized = list[str]()
+        coords = list[float]()
+        for token in tokens:
+            if token.isalpha():
+                if coords:
+                    return None
+                if token not in ("M", "L", "Q", "C", "z", "Z"):
+                    return None
+                normalized.append(token)
+                continue
+            coords.append(float(token))
+            if len(coords) == 2:
+                normalized.append(self._format(coords[0] - x0))
+                normalized.append(self._format(coords[1] - y0))
+                coords.clear()
+        if coords:
+            return None
+        return " ".join(normalized)
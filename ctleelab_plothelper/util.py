@@ -20,14 +20,11 @@ from matplotlib.colors import BoundaryNorm, LinearSegmentedColormap, Colormap
 from matplotlib.image import AxesImage
 from matplotlib.backend_bases import RendererBase
 
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-
-
 from mpl_toolkits import axes_grid1
 from mpl_toolkits.axes_grid1 import Divider, Size
 
 from .dividers import FixedSizeDivider
+from .layout import get_panel_bounds
 
 from operator import sub
 
@@ -79,3 +76,133 @@ def get_aspect(ax: Axes) -> float:
     data_ratio = sub(*ax.get_ylim()) / sub(*ax.get_xlim())
 
     return disp_ratio / data_ratio
+
+
+def get_panel_rects(axs: Union[Axes, npt.ArrayLike]) -> npt.NDArray[np.float64]:
+    """Get the rectangles of an array of axes in inches without drawing.
+
+    Positions are read from the fixed size layout, see `layout.get_panel_bounds`.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest, e.g. from `fixed_size_subplots`
+
+    Returns:
+        npt.NDArray[np.float64]: (left, bottom, width, height) in inches, of shape
+        ``axs.shape + (4,)``
+    """
+    axs = np.asarray(axs, dtype=object)
+    rects = np.empty(axs.shape + (4,))
+    sizes = dict[int, npt.NDArray[np.float64]]()
+    for index, ax in np.ndenumerate(axs):
+        fig = ax.get_figure(root=True)
+        size = sizes.get(id(fig))
+        if size is None:
+            size = sizes[id(fig)] = np.tile(fig.get_size_inches(), 2)
+        rects[index] = get_panel_bounds(ax)
+        rects[index] *= size
+    return rects
+
+
+def get_panel_sizes(axs: Union[Axes, npt.ArrayLike]) -> npt.NDArray[np.float64]:
+    """Get the sizes of an array of axes in inches without drawing.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest, e.g. from `fixed_size_subplots`
+
+    Returns:
+        npt.NDArray[np.float64]: (width, height) in inches, of shape ``axs.shape + (2,)``
+    """
+    return get_panel_rects(axs)[..., 2:]
+
+
+def get_limits(axs: Union[Axes, npt.ArrayLike]) -> npt.NDArray[np.float64]:
+    """Get the data limits of an array of axes.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest
+
+    Returns:
+        npt.NDArray[np.float64]: (xmin, xmax, ymin, ymax) as shown, i.e. reversed for
+        inverted axes, of shape ``axs.shape + (4,)``
+    """
+    axs = np.asarray(axs, dtype=object)
+    limits = np.empty(axs.shape + (4,))
+    for index, ax in np.ndenumerate(axs):
+        limits[index] = (*ax.get_xlim(), *ax.get_ylim())
+    return limits
+
+
+def get_data_scales(axs: Union[Axes, npt.ArrayLike]) -> npt.NDArray[np.float64]:
+    """Get the length in inches of one data unit along x and y of an array of axes.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest
+
+    Returns:
+        npt.NDArray[np.float64]: (x scale, y scale) in inches per data unit, of shape
+        ``axs.shape + (2,)``
+    """
+    sizes = get_panel_sizes(axs)
+    limits = get_limits(axs)
+    spans = np.abs(limits[..., 1::2] - limits[..., 0::2])
+    return sizes / spans
+
+
+def get_aspects(axs: Union[Axes, npt.ArrayLike]) -> npt.NDArray[np.float64]:
+    """Get the aspect ratios of an array of axes, see `get_aspect`.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest
+
+    Returns:
+        npt.NDArray[np.float64]: Aspect ratio of each axes, of shape ``axs.shape``
+    """
+    sizes = get_panel_sizes(axs)
+    limits = get_limits(axs)
+    spans = limits[..., 1::2] - limits[..., 0::2]
+    # Negative for an inverted axis, as in `get_aspect`
+    return (sizes[..., 1] / sizes[..., 0]) / (spans[..., 1] / spans[..., 0])
+
+
+def equalize_aspect(
+    axs: Union[Axes, npt.ArrayLike], aspect: float = 1.0, common: bool = False
+) -> npt.NDArray[np.float64]:
+    """Set the aspect ratio of an array of axes by expanding their data limits.
+
+    The panels keep their fixed size; the limits are widened around their centers so
+    that one data unit along y is *aspect* times as long as along x. With *common*, all
+    panels also share the same data-to-inch scale, the largest that fits every panel's
+    current limits.
+
+    Args:
+        axs (Axes | npt.ArrayLike): Axes of interest
+        aspect (float, optional): Ratio of the y scale to the x scale. Defaults to 1.0.
+        common (bool, optional): Use the same scale for all panels. Defaults to False.
+
+    Returns:
+        npt.NDArray[np.float64]: The new (xmin, xmax, ymin, ymax) limits, of shape
+        ``axs.shape + (4,)``
+    """
+    axs = np.asarray(axs, dtype=object)
+    sizes = get_panel_sizes(axs)
+    limits = get_limits(axs)
+    spans = limits[..., 1::2] - limits[..., 0::2]
+
+    # Largest x scale at which the current limits still fit, in inches per x unit
+    scales = sizes / np.abs(spans)
+    scale_x = np.minimum(scales[..., 0], scales[..., 1] / aspect)
+    if common:
+        scale_x = np.full_like(scale_x, scale_x.min())
+    needed = sizes / np.stack((scale_x, scale_x * aspect), axis=-1)
+
+    centers = (limits[..., 1::2] + limits[..., 0::2]) / 2
+    half = np.copysign(needed, spans) / 2
+    new = np.empty_like(limits)
+    new[..., 0::2] = centers - half
+    new[..., 1::2] = centers + half
+
+    for index, ax in np.ndenumerate(axs):
+        if not np.allclose(new[index], limits[index]):
+            ax.set_xlim(new[index][:2])
+            ax.set_ylim(new[index][2:])
+    return new
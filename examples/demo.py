@@ -11,6 +11,7 @@
 # for more information.
 
 import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.export import format_results, save_all
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -69,9 +70,8 @@ for i, (style, style_ext) in enumerate(plot_styles):
         im = ax.imshow(r, cmap="viridis")
         ph.add_fixed_colorbar(im, ax=ax, aspect=20, pad=0.05)
 
-        fig.savefig(f"outputs/demo{style_ext}")
-        fig.savefig(f"outputs/demo{style_ext}.svg", format="svg")
-        fig.savefig(f"outputs/demo{style_ext}.pdf", format="pdf")
+        results = save_all(fig, f"outputs/demo{style_ext}", formats=["png", "svg", "pdf"])
+        print(format_results(results))
 
         # Uncomment to test font sizes
 
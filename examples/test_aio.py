@@ -0,0 +1,213 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import asyncio
+import io
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.artist import Artist
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.aio import AsyncSaver, save_async, save_many_async
+
+
+class SlowArtist(Artist):
+    def draw(self, renderer):
+        time.sleep(0.05)
+
+
+class SlowPickle(Artist):
+    def __getstate__(self):
+        time.sleep(0.3)
+        return super().__getstate__()
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Records how many tasks are in flight at the same time."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def submit(self, fn, *args, **kwargs):
+        def counted():
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.active -= 1
+
+        return super().submit(counted)
+
+
+def build(i, pyplot=False, slow=False):
+    fig, ax = ph.fixed_size_subplots(
+        1, 1, subwidth=1, subheight=1, dpi=50, pyplot=pyplot
+    )
+    ax.plot(np.arange(10) * i)
+    if slow:
+        fig.add_artist(SlowArtist())
+    return fig
+
+
+def test_save_async(tmp_path):
+    expected = io.BytesIO()
+    build(1).savefig(expected, format="png")
+
+    async def main():
+        data = await save_async(build(1), format="png")
+        path = await save_async(build(1), tmp_path / "figure.png")
+        results = await save_many_async(
+            [build(i) for i in range(4)], [tmp_path / f"{i}.svg" for i in range(4)]
+        )
+        return data, path, results
+
+    data, path, results = asyncio.run(main())
+    assert data == expected.getvalue()
+    with open(path, "rb") as f:
+        assert f.read() == expected.getvalue()
+    assert results == [str(tmp_path / f"{i}.svg") for i in range(4)]
+    assert sorted(os.listdir(tmp_path)) == [
+        "0.svg",
+        "1.svg",
+        "2.svg",
+        "3.svg",
+        "figure.png",
+    ]
+
+
+def test_save_async_backpressure():
+    async def main(saver):
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick = asyncio.ensure_future(ticker())
+        figs = [build(i, slow=True) for i in range(8)]
+        results = await saver.save_many(figs, format="png")
+        done.set()
+        await tick
+        return results, ticks
+
+    # More worker threads than the concurrency limit
+    with CountingExecutor(8) as executor:
+        saver = AsyncSaver(max_concurrency=2, executor=executor)
+        results, ticks = asyncio.run(main(saver))
+    assert all(r.startswith(b"\x89PNG") for r in results)
+    assert executor.peak == 2
+    # The event loop kept running during the saves, which take at least 0.2 s
+    assert ticks >= 10
+
+
+def test_save_async_cancel(tmp_path):
+    async def main(saver):
+        figs = [build(i, pyplot=True, slow=True) for i in range(6)]
+        task = asyncio.ensure_future(
+            saver.save_many(figs, [tmp_path / f"{i}.png" for i in range(6)])
+        )
+        await asyncio.sleep(0.02)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # Let the running save finish and its figure be closed
+        await asyncio.get_running_loop().run_in_executor(None, saver.shutdown)
+        await asyncio.sleep(0.01)
+        return figs
+
+    saver = AsyncSaver(max_concurrency=1)
+    figs = asyncio.run(main(saver))
+    assert not any(plt.fignum_exists(fig.number) for fig in figs)
+    assert os.listdir(tmp_path) == []
+
+
+def test_save_async_process():
+    async def main():
+        async with AsyncSaver(max_concurrency=2, kind="process") as saver:
+            fig = build(2, pyplot=True)
+            data = await saver.save(fig, format="pdf")
+            return fig, data
+
+    fig, data = asyncio.run(main())
+    assert data.startswith(b"%PDF")
+    assert not plt.fignum_exists(fig.number)
+
+
+def test_save_async_process_rc():
+    import multiprocessing
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ctleelab_plothelper.export import _init_worker
+
+    rc = {"svg.fonttype": "none", "svg.hashsalt": "ctleelab_plothelper"}
+    kw = dict(format="svg", metadata={"Date": None})
+
+    async def main():
+        # Spawned workers do not inherit the rcParams of this process
+        with ProcessPoolExecutor(
+            1, multiprocessing.get_context("spawn"), initializer=_init_worker
+        ) as executor:
+            saver = AsyncSaver(kind="process", executor=executor)
+            return await saver.save(build(3), **kw)
+
+    with plt.rc_context(rc):
+        data = asyncio.run(main())
+        buf = io.BytesIO()
+        build(3).savefig(buf, **kw)
+    assert b"<text" in data
+    assert data == buf.getvalue()
+
+
+def test_save_async_process_pickle():
+    async def heartbeat(stop, gaps):
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    async def main():
+        stop = asyncio.Event()
+        gaps = list[float]()
+        beat = asyncio.ensure_future(heartbeat(stop, gaps))
+        await asyncio.sleep(0.05)
+        async with AsyncSaver(kind="process") as saver:
+            fig = build(4)
+            fig.add_artist(SlowPickle())
+            data = await saver.save(fig, format="png")
+        stop.set()
+        await beat
+        return data, gaps
+
+    data, gaps = asyncio.run(main())
+    assert data.startswith(b"\x89PNG")
+    # The figure is pickled off the event loop
+    assert max(gaps) < 0.2
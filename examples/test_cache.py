@@ -0,0 +1,116 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.cache import FigureCache, hash_inputs
+from ctleelab_plothelper.styles import style_context
+
+styles = ["ctleelab_plothelper.base", "ctleelab_plothelper.light"]
+
+
+def build_series(y):
+    fig, ax = ph.fixed_size_subplots(1, 1, subwidth=1.5, subheight=1)
+    ax.plot(y)
+    ax.set_title("Cached")
+    return fig
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_figure_cache(tmp_path):
+    cache = FigureCache(tmp_path / "cache")
+    y = np.sin(np.linspace(0, 10, 100))
+
+    first = cache.render(build_series, "outputs/cached", (y,), style=styles)
+    assert not first.hit
+    fresh = {fmt: read(path) for fmt, path in first.paths.items()}
+
+    # The cached figure matches a direct render
+    with style_context(styles):
+        fig = build_series(y)
+        fig.savefig("outputs/cached-direct.png")
+    plt.close(fig)
+    np.testing.assert_array_equal(
+        plt.imread(first.paths["png"]), plt.imread("outputs/cached-direct.png")
+    )
+
+    # Byte-stable output, so a fresh render matches the cached files
+    for path in first.paths.values():
+        os.remove(path)
+    second = cache.render(build_series, "outputs/cached", (y.copy(),), style=styles)
+    assert second.hit and second.key == first.key
+    assert {fmt: read(path) for fmt, path in second.paths.items()} == fresh
+
+    cache.clear()
+    third = cache.render(build_series, "outputs/cached", (y,), style=styles)
+    assert not third.hit
+    assert {fmt: read(path) for fmt, path in third.paths.items()} == fresh
+
+    changed = cache.render(build_series, "outputs/cached", (y * 2,), style=styles)
+    assert not changed.hit and changed.key != first.key
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+    assert cache.stats.hit_rate == 0.25
+
+    assert cache.evict(max_bytes=cache.size() - 1) == 1
+    assert cache.evict(max_age=-1) == 1
+    assert cache.size() == 0
+
+
+def test_hash_inputs():
+    a = np.arange(10, dtype=float)
+    assert hash_inputs(a) == hash_inputs(a.copy())
+    assert hash_inputs(a) != hash_inputs(a.astype(np.float32))
+    assert hash_inputs(a) != hash_inputs(a.reshape(2, 5))
+    assert hash_inputs({"x": 1, "y": a}) == hash_inputs({"y": a, "x": 1})
+    assert hash_inputs(build_series) != hash_inputs(read)
+
+
+def test_hash_closures(tmp_path):
+    import functools
+
+    def closure(y):
+        def build():
+            return build_series(y)
+
+        return build
+
+    def defaulted(y):
+        def build(data=y):
+            return build_series(data)
+
+        return build
+
+    a = np.arange(10, dtype=float)
+    b = np.arange(10, dtype=float)[::-1]
+    assert hash_inputs(closure(a)) == hash_inputs(closure(a.copy()))
+    assert hash_inputs(closure(a)) != hash_inputs(closure(b))
+    assert hash_inputs(defaulted(a)) != hash_inputs(defaulted(b))
+    assert hash_inputs(functools.partial(build_series, a)) != hash_inputs(
+        functools.partial(build_series, b)
+    )
+    assert hash_inputs(functools.partial(build_series, y=a)) != hash_inputs(
+        functools.partial(build_series, y=b)
+    )
+
+    # Closures over different data miss the cache
+    cache = FigureCache(tmp_path / "cache")
+    first = cache.render(closure(a), str(tmp_path / "closure"), formats=["png"])
+    second = cache.render(closure(b), str(tmp_path / "closure"), formats=["png"])
+    assert not first.hit and not second.hit and first.key != second.key
@@ -0,0 +1,87 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import ctleelab_plothelper.plothelpers as ph
+
+
+def test_discrete_cmap():
+    cmap, norm = ph.discrete_cmap(5, "viridis")
+    assert cmap.N == 5
+    np.testing.assert_allclose(
+        cmap.colors, mpl.colormaps["viridis"](np.linspace(0, 1, 5))
+    )
+    np.testing.assert_array_equal(norm(np.arange(5)), np.arange(5))
+
+    # Cached on the colors of the base colormap rather than its identity
+    assert ph.discrete_cmap(5, "viridis")[0] is cmap
+    base = mpl.colormaps["viridis"]
+    assert ph.discrete_cmap(5, base)[0] is ph.discrete_cmap(5, base.copy())[0]
+    assert ph.discrete_cmap(5, "viridis", bounds=np.arange(6))[0] is not cmap
+    with pytest.raises(ValueError):
+        ph.discrete_cmap(5, bounds=[0, 1])
+
+
+def test_custom_cmap():
+    with plt.style.context(["ctleelab_plothelper.base", "ctleelab_plothelper.light"]):
+        fig, ax = ph.fixed_size_subplots(1, 1, subwidth=1.5, subheight=1.5)
+        labels = ["low", "mid", "high"]
+        data = np.random.default_rng(0).integers(0, 3, size=(10, 10))
+
+        cmap, norm, cb = ph.custom_cmap("Level", labels, ax=ax)
+        ax.imshow(data, cmap=cmap, norm=norm)
+        fig.savefig("outputs/custom-cmap.png")
+
+        assert [t.get_text() for t in cb.ax.get_yticklabels()] == labels
+        np.testing.assert_allclose(cb.get_ticks(), [0, 1, 2])
+        assert cb.ax.get_label() == "" and cb.ax.get_ylabel() == "Level"
+
+        # The colorbar is placed right of the panel with the fixed pad
+        fig.canvas.draw()
+        fig_w = fig.get_size_inches()[0]
+        gap = (cb.ax.get_position().x0 - ax.get_position().x1) * fig_w
+        assert gap == pytest.approx(0.05)
+        plt.close(fig)
+
+
+def test_categorical_colorbar():
+    from ctleelab_plothelper.categorical import (
+        CategoricalColorbar,
+        categorical_colorbar,
+    )
+
+    n = 5000
+    labels = [f"cell type {i}" for i in range(n)]
+    fig, ax = ph.fixed_size_subplots(1, 1, subwidth=1.5, subheight=2, dpi=100)
+    cmap, norm, cb = ph.custom_cmap("Cell type", labels, ax=ax, categorical=True)
+    assert isinstance(cb, CategoricalColorbar)
+    ax.imshow(np.arange(n).reshape(50, 100), cmap=cmap, norm=norm)
+    fig.savefig("outputs/categorical-colorbar.png")
+
+    # One image for the colors and only as many labels as fit 2 inches
+    assert len(cb.ax.images) == 1 and not cb.ax.collections
+    ticks = cb.ax.yaxis.get_major_ticks()
+    assert 5 < len(ticks) < 30
+    shown = [t.get_text() for t in cb.ax.get_yticklabels()]
+    assert shown[0] == "cell type 0" and all(text in labels for text in shown)
+
+    # Smaller labels are packed more densely, independent of the DPI
+    small = categorical_colorbar(ax, labels, fontsize=4, pad=1)
+    fig.set_dpi(200)
+    fig.canvas.draw()
+    assert len(cb.ax.get_yticklabels()) == len(shown)
+    assert len(small.ax.get_yticklabels()) > len(shown)
+    plt.close(fig)
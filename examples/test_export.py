@@ -0,0 +1,168 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import os
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.export import format_results, save_all
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+def test_save_all():
+    with plt.style.context(["ctleelab_plothelper.base", "ctleelab_plothelper.light"]):
+        fig, axs = ph.fixed_size_subplots(1, 2, subwidth=1.5, subheight=1.5)
+
+        x = np.arange(-10, 10, 0.1)
+        axs[0].plot(x, np.sin(x))
+        im = axs[1].imshow(np.random.random((20, 20)))
+        ph.add_fixed_colorbar(im, ax=axs[1], aspect=20, pad=0.05)
+        locators = [ax.get_axes_locator() for ax in fig.axes]
+
+        for max_workers, name in ((1, "serial"), (2, "parallel")):
+            results = save_all(
+                fig, f"outputs/save-all-{name}", ("png", "svg", "pdf"), max_workers
+            )
+            assert list(results) == ["png", "svg", "pdf"]
+            for fmt, result in results.items():
+                assert result.path == f"outputs/save-all-{name}.{fmt}"
+                assert result.nbytes == os.path.getsize(result.path) > 0
+                assert result.seconds > 0
+            print(format_results(results))
+
+        # Locators are restored after export
+        assert [ax.get_axes_locator() for ax in fig.axes] == locators
+
+        # The frozen layout renders exactly like a plain savefig
+        positions = [ax.get_position().bounds for ax in fig.axes]
+        fig.savefig("outputs/save-all-plain.png")
+        assert positions != [(0, 0, 1, 1)] * len(positions)
+        plain = plt.imread("outputs/save-all-plain.png")
+        for name in ("serial", "parallel"):
+            np.testing.assert_array_equal(
+                plt.imread(f"outputs/save-all-{name}.png"), plain
+            )
+        plt.close(fig)
+
+
+def test_save_all_spawn(tmp_path):
+    import multiprocessing
+
+    # Spawned workers do not inherit the rcParams of this process
+    method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method("spawn", force=True)
+    try:
+        with plt.rc_context({"svg.fonttype": "none"}):
+            fig = build_sine(1)
+            kw = dict(formats=("svg", "png"), deterministic=True)
+            serial = save_all(fig, str(tmp_path / "serial"), **kw)
+            parallel = save_all(fig, str(tmp_path / "parallel"), max_workers=2, **kw)
+        plt.close(fig)
+    finally:
+        multiprocessing.set_start_method(method, force=True)
+
+    svgs = list[bytes]()
+    for results in (serial, parallel):
+        with open(results["svg"].path, "rb") as f:
+            svgs.append(f.read())
+    assert b"<text" in svgs[0]
+    assert svgs[1] == svgs[0]
+
+
+def build_sine(frequency):
+    fig, ax = ph.fixed_size_subplots(1, 1, subwidth=1.5, subheight=1.5)
+    x = np.arange(-10, 10, 0.1)
+    ax.plot(x, np.sin(frequency * x))
+    ax.set_title(f"frequency {frequency}")
+    return fig
+
+
+def test_render_batch():
+    from ctleelab_plothelper.farm import RenderJob, render_batch
+
+    jobs = [
+        RenderJob(build_sine, f"outputs/farm-{i}", args=(i,), formats=("png", "svg"))
+        for i in range(1, 4)
+    ]
+    results = list(render_batch(jobs, max_workers=2))
+    assert len(results) == 2 * len(jobs)
+    assert {(r.job.basename, r.suffix) for r in results} == {
+        (job.basename, suffix) for job in jobs for suffix in ("", "_dark")
+    }
+    for result in results:
+        for fmt in ("png", "svg"):
+            assert os.path.getsize(result.exports[fmt].path) > 0
+
+    # The farm output matches a serial render under the same style
+    from ctleelab_plothelper.farm import DEFAULT_STYLES
+    from ctleelab_plothelper.styles import style_context
+
+    stack, suffix = DEFAULT_STYLES[1]
+    with style_context(stack):
+        fig = build_sine(2)
+        fig.savefig("outputs/farm-serial.png")
+        plt.close(fig)
+    np.testing.assert_array_equal(
+        plt.imread(f"outputs/farm-2{suffix}.png"), plt.imread("outputs/farm-serial.png")
+    )
+
+
+def test_rasterize_heavy():
+    from ctleelab_plothelper.rasterize import measure_rasterization
+
+    with plt.style.context(["ctleelab_plothelper.base", "ctleelab_plothelper.light"]):
+        fig, axs = ph.fixed_size_subplots(1, 2, subwidth=1.5, subheight=1.5)
+
+        rng = np.random.default_rng(0)
+        points = axs[0].scatter(*rng.normal(size=(2, 50_000)), s=1)
+        (line,) = axs[1].plot(np.arange(10), np.arange(10))
+        axs[0].set_title("Editable title")
+
+        results = save_all(
+            fig, "outputs/rasterized", ("png", "svg"), rasterize_threshold=10_000
+        )
+        assert [entry.artist for entry in results["svg"].rasterized] == [points]
+        assert results["png"].rasterized == []
+        assert not points.get_rasterized()
+
+        with open(results["svg"].path) as f:
+            svg = f.read()
+        assert "<image" in svg
+        assert "Editable title" in svg
+
+        assert measure_rasterization(fig, "svg") > 0
+        plt.close(fig)
+
+
+def test_optimize_svg():
+    import xml.etree.ElementTree as ET
+
+    with plt.style.context(["ctleelab_plothelper.base", "ctleelab_plothelper.light"]):
+        fig, axs = ph.fixed_size_subplots(3, 3, subwidth=1.5, subheight=1.5)
+        x = np.linspace(0, 10, 500)
+        for i, ax in enumerate(axs.flat):
+            ax.plot(x, np.sin(x + i), marker="o", markersize=1)
+            ax.set_title(f"Panel {i} & <more>")
+
+        plain = save_all(fig, "outputs/svgopt-plain", ("svg",))["svg"]
+        optimized = save_all(fig, "outputs/svgopt", ("svg",), optimize_svg=True)["svg"]
+        plt.close(fig)
+
+    assert optimized.nbytes < plain.nbytes
+    root = ET.parse(optimized.path).getroot()
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    titles = [t.text for t in root.iterfind(".//svg:text", ns)]
+    assert "Panel 8 & <more>" in titles
+    # The axes backgrounds share their geometry and are referenced after the first
+    uses = root.findall(".//svg:use", ns)
+    refs = {u.get("{http://www.w3.org/1999/xlink}href") for u in uses}
+    assert any(ref.startswith("#dp") for ref in refs)
@@ -0,0 +1,132 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.imaging import block_reduce, decimated_imshow
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+def test_block_reduce():
+    data = np.arange(30).reshape(5, 6)
+    np.testing.assert_allclose(
+        block_reduce(data.astype(float), (2, 3)),
+        [[3.5, 5.5, 7.5], [15.5, 17.5, 19.5], [24.5, 26.5, 28.5]],
+    )
+    np.testing.assert_array_equal(
+        block_reduce(data, (2, 3), "max"), [[7, 9, 11], [19, 21, 23], [25, 27, 29]]
+    )
+    rgb = np.zeros((8, 8, 3), dtype=np.uint8)
+    assert block_reduce(rgb, (4, 4)).shape == (4, 4, 3)
+    assert block_reduce(data, (10, 10)) is data
+
+    # NaN pixels are ignored, all-NaN blocks stay NaN
+    nans = data.astype(float)
+    nans[0, 0] = nans[4, 3:] = np.nan
+    expected = [[14 / 3, 5.5, 7.5], [15.5, 17.5, 19.5], [24.5, 26, np.nan]]
+    np.testing.assert_allclose(block_reduce(nans, (2, 3)), expected)
+    np.testing.assert_array_equal(
+        block_reduce(nans, (2, 3), "max"),
+        [[7, 9, 11], [19, 21, 23], [25, 26, np.nan]],
+    )
+    np.testing.assert_array_equal(
+        block_reduce(nans, (2, 3), "min"),
+        [[1, 2, 4], [12, 14, 16], [24, 26, np.nan]],
+    )
+
+
+def test_block_reduce_bands(monkeypatch):
+    import tracemalloc
+
+    import ctleelab_plothelper.imaging as imaging
+
+    rng = np.random.default_rng(0)
+    scalar = rng.random((53, 40))
+    scalar[3, 5] = scalar[40:, 7] = np.nan
+    rgb = rng.integers(0, 256, (53, 40, 3), dtype=np.uint8)
+    expected = [block_reduce(data, (10, 10)) for data in (scalar, rgb)]
+
+    # Bands of one block row, NaNs in only some of them
+    monkeypatch.setattr(imaging, "_BAND_ELEMENTS", 1)
+    for data, result in zip((scalar, rgb), expected):
+        np.testing.assert_array_equal(block_reduce(data, (10, 10)), result)
+    monkeypatch.undo()
+
+    # Temporaries are bounded by a band rather than the image
+    large = rng.random((2048, 2048), dtype=np.float32)
+    large[::3, ::5] = np.nan
+    tracemalloc.start()
+    block_reduce(large, (256, 256))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < large.nbytes
+
+
+def test_decimated_colorbar():
+    with plt.style.context(["ctleelab_plothelper.base", "ctleelab_plothelper.light"]):
+        fig, axs = ph.fixed_size_subplots(1, 2, subwidth=1.5, subheight=1.5)
+
+        x = np.linspace(-1, 1, 4000)
+        xx, yy = np.meshgrid(x, x)
+        r = np.sin(10 * (xx**2 + yy**2)) / 10
+        r[0, 0] = 5
+
+        for ax, reducer in zip(axs, ("mean", "max")):
+            im = decimated_imshow(ax, r, reducer=reducer, cmap="PRGn")
+            # 1.5 inches at 600 dpi is 900 pixels, so 4x4 blocks are pooled
+            assert im.get_array().shape == (1000, 1000)
+            assert im.get_clim() == (r.min(), 5)
+            assert im.get_extent() == [-0.5, 3999.5, 3999.5, -0.5]
+            ph.add_fixed_colorbar(im, ax=ax, aspect=20, pad=0.05)
+
+        fig.savefig("outputs/decimated-colorbar")
+        plt.close(fig)
+
+
+def test_decimated_line():
+    from ctleelab_plothelper.decimate import plot_decimated
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 100, 1_000_000)
+    y = np.cumsum(rng.normal(size=x.size))
+
+    def render(decimated):
+        fig, ax = ph.fixed_size_subplots(1, 1, subwidth=2, subheight=1, dpi=100)
+        if decimated:
+            line = plot_decimated(ax, x, y, dpi=100, antialiased=False).line
+            assert len(line.get_xdata()) <= 4 * 200 + 2
+        else:
+            ax.plot(x, y, antialiased=False)
+        ax.set_axis_off()
+        frames = []
+        for xlim in (None, (20, 30)):
+            if xlim is not None:
+                ax.set_xlim(xlim)
+            fig.canvas.draw()
+            frames.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+        plt.close(fig)
+        return frames
+
+    for full, decimated in zip(render(False), render(True)):
+        assert (full != decimated).any(axis=-1).mean() < 1e-3
+
+
+def test_decimated_line_empty():
+    from ctleelab_plothelper.decimate import plot_decimated
+
+    fig, ax = ph.fixed_size_subplots(1, 1, subwidth=2, subheight=1, dpi=100)
+    decimated = plot_decimated(ax, [], [])
+    assert len(decimated.line.get_xdata()) == 0
+    ax.set_xlim(1, 2)
+    assert len(decimated.line.get_xdata()) == 0
+    fig.canvas.draw()
+    plt.close(fig)
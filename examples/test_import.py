@@ -0,0 +1,60 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import subprocess
+import sys
+
+# Cumulative import time budget of the top level package in microseconds
+IMPORT_BUDGET_US = 50_000
+
+
+def import_times(statement):
+    """Run a statement with -X importtime and return the cumulative time per module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times, proc.stdout
+
+
+def test_import_time():
+    times, _ = import_times("import ctleelab_plothelper")
+    assert times["ctleelab_plothelper"] < IMPORT_BUDGET_US
+    assert "matplotlib" not in times
+
+
+def test_no_pyplot_on_import():
+    statement = (
+        "import sys, ctleelab_plothelper as cp;"
+        "[getattr(cp, name) for name in cp.__all__];"
+        "print('matplotlib.pyplot' in sys.modules)"
+    )
+    times, stdout = import_times(statement)
+    assert stdout.strip() == "False"
+    assert "matplotlib.pyplot" not in times
+
+
+def test_lazy_attributes():
+    import ctleelab_plothelper as cp
+
+    assert not set(cp._attributes) & set(cp._submodules)
+    assert callable(cp.draft_mode) and cp.draft_mode is cp.draft.draft
+    with cp.draft_mode():
+        pass
@@ -0,0 +1,318 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import ctleelab_plothelper.plothelpers as ph
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+
+def test_static_layout():
+    layout = dict(subwidth=1.5, subheight=1.2, colsep=0.3, rowsep=0.1)
+
+    fig, axs = ph.fixed_size_subplots(3, 4, **layout)
+    fig.canvas.draw()
+    expected = np.array([ax.get_position().bounds for ax in axs.flat])
+
+    fig_static, axs_static = ph.fixed_size_subplots(3, 4, static_layout=True, **layout)
+    assert all(ax.get_axes_locator() is None for ax in axs_static.flat)
+    placed = np.array([ax.get_position().bounds for ax in axs_static.flat])
+    np.testing.assert_allclose(placed, expected)
+
+    fig_static.canvas.draw()
+    placed = np.array([ax.get_position().bounds for ax in axs_static.flat])
+    np.testing.assert_allclose(placed, expected)
+
+    # Growing the figure keeps the panels at the same physical size
+    width, height = fig_static.get_size_inches()
+    fig_static.set_size_inches(2 * width, height)
+    fig_static.canvas.draw()
+    _, _, w, h = axs_static[0, 0].get_position().bounds
+    np.testing.assert_allclose((w * 2 * width, h * height), (1.5, 1.2))
+
+    fig_static.savefig("outputs/static-layout")
+    plt.close(fig)
+    plt.close(fig_static)
+
+
+def test_heterogeneous_grid():
+    from ctleelab_plothelper.layout import fixed_size_geometry
+
+    # Scalar arguments keep the legacy figure size
+    width, height, geometry = fixed_size_geometry(2, 3, colsep=0.2, rowsep=0.1)
+    assert np.isclose(width, 3 * (0.7 + 0.2 + 2) + 0.7 * 0.6)
+    assert np.isclose(height, 2 * (0.7 + 0.1 + 2) + 0.7 * 0.6)
+    assert geometry.shape == (2, 3, 4)
+
+    widths = [1.0, 2.0, 0.5]
+    heights = [0.8, 1.6]
+    colsep = [0.1, 0.4]
+    fig, axs = ph.fixed_size_subplots(
+        2,
+        3,
+        subwidth=widths,
+        subheight=heights,
+        colsep=colsep,
+        rowsep=[0.3],
+        static_layout=True,
+    )
+    geometry = fig.get_layout_engine().geometry
+    np.testing.assert_allclose(geometry[1, :, 2], widths)
+    np.testing.assert_allclose(geometry[:, 2, 3], heights)
+    np.testing.assert_allclose(
+        geometry[0, :, 0], [0.7, 0.7 + 1.0 + 0.7 + 0.1, 0.7 + 1.0 + 0.8 + 2.0 + 1.1]
+    )
+    np.testing.assert_allclose(geometry[:, 0, 1], [0.7, 0.7 + 0.8 + 0.7 + 0.3])
+    np.testing.assert_allclose(
+        fig.get_size_inches(),
+        (geometry[0, -1, 0] + 0.5 + 0.42, geometry[-1, 0, 1] + 1.6 + 0.42),
+    )
+
+    # Both layout paths agree
+    fig_div, axs_div = ph.fixed_size_subplots(
+        2, 3, subwidth=widths, subheight=heights, colsep=colsep, rowsep=[0.3]
+    )
+    fig_div.canvas.draw()
+    np.testing.assert_allclose(
+        [ax.get_position().bounds for ax in axs_div.flat],
+        [ax.get_position().bounds for ax in axs.flat],
+    )
+    assert fig.fixed_size_geometry is geometry
+    np.testing.assert_allclose(fig_div.fixed_size_geometry, geometry)
+    plt.close(fig)
+    plt.close(fig_div)
+
+
+def test_separators():
+    fig_scalar, axs_scalar = ph.fixed_size_subplots(1, 2, colsep=0.5, rowsep=0.2)
+    fig_seq, axs_seq = ph.fixed_size_subplots(1, 2, colsep=[0.5], rowsep=[])
+
+    # A scalar separator also reserves one on the right and top of the figure
+    np.testing.assert_allclose(
+        fig_scalar.get_size_inches() - fig_seq.get_size_inches(), (0.5, 0.2)
+    )
+    np.testing.assert_allclose(
+        fig_scalar.fixed_size_geometry, fig_seq.fixed_size_geometry
+    )
+    plt.close(fig_scalar)
+    plt.close(fig_seq)
+
+
+def test_side_panels():
+    from ctleelab_plothelper.dividers import FixedSizeDivider
+
+    for static_layout in (False, True):
+        fig, ax = ph.fixed_size_subplots(
+            1, 1, subwidth=2, subheight=1.5, static_layout=static_layout
+        )
+        divider = FixedSizeDivider(ax)
+        divider.set_locator(ax.get_axes_locator())
+
+        right = [divider.append_fixed_axes("right", 0.1, pad=0.05) for _ in range(2)]
+        top = divider.append_fixed_axes("top", 0.3, pad=0.1)
+        left = divider.append_fixed_axes("left", 0.2, pad=0.6)
+        bottom = divider.append_fixed_axes("bottom", 0.25, pad=0.5)
+
+        fig.canvas.draw()
+        fig_w, fig_h = fig.get_size_inches()
+
+        def inches(a):
+            return a.get_position().bounds * np.array([fig_w, fig_h, fig_w, fig_h])
+
+        x0, y0, w, h = inches(ax)
+        np.testing.assert_allclose(inches(right[0]), (x0 + w + 0.05, y0, 0.1, h))
+        np.testing.assert_allclose(inches(right[1]), (x0 + w + 0.2, y0, 0.1, h))
+        np.testing.assert_allclose(inches(top), (x0, y0 + h + 0.1, w, 0.3))
+        np.testing.assert_allclose(inches(left), (x0 - 0.8, y0, 0.2, h))
+        np.testing.assert_allclose(inches(bottom), (x0, y0 - 0.75, w, 0.25))
+        plt.close(fig)
+
+
+def test_side_panel_cache():
+    import matplotlib.transforms as mtransforms
+    from ctleelab_plothelper.dividers import fixed_size_divider
+    from ctleelab_plothelper.layout import get_panel_bounds
+
+    fig = plt.figure(figsize=(4, 3))
+    ax = fig.add_axes((0, 0, 1, 1))
+    bounds = [0.1, 0.2, 0.5, 0.4]
+    calls = [0]
+
+    def locate_parent(a, renderer):
+        calls[0] += 1
+        return mtransforms.Bbox.from_bounds(*bounds)
+
+    ax.set_axes_locator(locate_parent)
+    divider = fixed_size_divider(ax)
+    assert fixed_size_divider(ax) is divider
+    first = divider.append_fixed_axes("right", 0.2, pad=0.1)
+    second = divider.append_fixed_axes("right", 0.2, pad=0.1)
+    for side in ("left", "top"):
+        divider.append_fixed_axes(side, 0.2, pad=0.1)
+
+    def inches(a):
+        return np.array(a.get_position().bounds) * (4, 3, 4, 3)
+
+    # A draw locates every axes twice, the parent is located once more for all four
+    # panels together
+    for _ in range(2):
+        calls[0] = 0
+        fig.canvas.draw()
+        assert calls[0] == 3
+    np.testing.assert_allclose(inches(second), (2.8, 0.6, 0.2, 1.2))
+
+    # The panels follow the parent on the next draw
+    bounds[:] = [0.2, 0.1, 0.25, 0.5]
+    fig.canvas.draw()
+    np.testing.assert_allclose(inches(second), (2.2, 0.3, 0.2, 1.5))
+
+    # Outside of a draw the boxes are located once and cached until invalidated
+    bounds[:] = [0.1, 0.2, 0.5, 0.4]
+    np.testing.assert_allclose(get_panel_bounds(second), (0.7, 0.2, 0.05, 0.4))
+    bounds[:] = [0.2, 0.1, 0.25, 0.5]
+    np.testing.assert_allclose(get_panel_bounds(second), (0.7, 0.2, 0.05, 0.4))
+    divider.invalidate()
+    np.testing.assert_allclose(get_panel_bounds(second), (0.55, 0.1, 0.05, 0.5))
+
+    # A removed panel frees its place for the panels added afterwards
+    second.remove()
+    third = divider.append_fixed_axes("right", 0.3, pad=0.1)
+    fig.canvas.draw()
+    np.testing.assert_allclose(inches(first), (1.9, 0.3, 0.2, 1.5))
+    np.testing.assert_allclose(inches(third), (2.2, 0.3, 0.3, 1.5))
+    plt.close(fig)
+
+
+def test_fixed_colorbars():
+    for static_layout in (False, True):
+        fig, ax = ph.fixed_size_subplots(
+            1, 1, subwidth=2, subheight=1.5, static_layout=static_layout
+        )
+        im = ax.imshow(np.eye(4), aspect="auto")
+        first = ph.add_fixed_colorbar(im, ax, aspect=20, pad=0.05)
+        second = ph.add_fixed_colorbar(im, ax, aspect=10, pad=0.5)
+        fig.canvas.draw()
+        fig_w, fig_h = fig.get_size_inches()
+
+        def inches(a):
+            return np.array(a.get_position().bounds) * (fig_w, fig_h, fig_w, fig_h)
+
+        x0, y0, w, h = inches(ax)
+        np.testing.assert_allclose(inches(first.ax), (x0 + w + 0.05, y0, 0.1, h))
+        np.testing.assert_allclose(inches(second.ax), (x0 + w + 0.65, y0, 0.2, h))
+        plt.close(fig)
+
+
+def test_shared_colorbar():
+    for static_layout in (False, True):
+        fig, axs = ph.fixed_size_subplots(
+            3, 3, subwidth=1, subheight=1, colsep=0.2, static_layout=static_layout
+        )
+        for ax in axs.flat:
+            im = ax.imshow(np.eye(4), vmin=0, vmax=1)
+        fig.canvas.draw()
+
+        def inches(ax):
+            fig_w, fig_h = fig.get_size_inches()
+            return np.array(ax.get_position().bounds) * (fig_w, fig_h, fig_w, fig_h)
+
+        panels = np.array([inches(ax) for ax in axs.flat])
+        width = fig.get_size_inches()[0]
+
+        cb = ph.add_shared_colorbar(im, axs, width=0.15, pad=0.1)
+        row = ph.add_shared_colorbar(im, axs, row=1, width=0.15, pad=0.6)
+        fig.savefig(f"outputs/shared-colorbar-{static_layout}.png")
+
+        # Only the figure grows, panels keep their place and size in inches
+        assert fig.get_size_inches()[0] > width
+        np.testing.assert_allclose([inches(ax) for ax in axs.flat], panels)
+        right = panels[:, 0].max() + 1
+        bottom, top = panels[:, 1].min(), panels[:, 1].max() + 1
+        np.testing.assert_allclose(
+            inches(cb.ax), (right + 0.1, bottom, 0.15, top - bottom)
+        )
+        np.testing.assert_allclose(
+            inches(row.ax), (right + 0.6, inches(axs[1, 0])[1], 0.15, 1)
+        )
+        plt.close(fig)
+
+
+def test_batched_geometry():
+    from ctleelab_plothelper import util
+
+    fig, axs = ph.fixed_size_subplots(
+        2, 3, subwidth=[1, 2, 1.5], subheight=1, static_layout=True
+    )
+    for i, ax in enumerate(axs.flat):
+        ax.set_xlim(0, i + 1)
+        ax.set_ylim(0, 2)
+    axs[1, 2].invert_yaxis()
+
+    sizes = util.get_panel_sizes(axs)
+    assert sizes.shape == (2, 3, 2)
+    np.testing.assert_allclose(sizes[..., 0], [[1, 2, 1.5]] * 2)
+    expected = np.reshape([ph.get_aspect(ax) for ax in axs.flat], (2, 3))
+    np.testing.assert_allclose(util.get_aspects(axs), expected)
+
+    util.equalize_aspect(axs)
+    np.testing.assert_allclose(np.abs(util.get_aspects(axs)), 1)
+    assert axs[1, 2].yaxis_inverted()
+
+    util.equalize_aspect(axs, aspect=2, common=True)
+    scales = util.get_data_scales(axs)
+    np.testing.assert_allclose(scales[..., 0], scales[0, 0, 0])
+    np.testing.assert_allclose(scales[..., 1], 2 * scales[0, 0, 0])
+    plt.close(fig)
+
+
+def test_mosaic():
+    from ctleelab_plothelper.layout import fixed_size_mosaic_geometry
+    from ctleelab_plothelper.util import get_panel_rects
+
+    # A mosaic of distinct labels matches the grid of fixed_size_subplots
+    fig, axs = ph.fixed_size_subplots(
+        2, 3, subwidth=[1, 2, 1.5], subheight=[0.5, 1], rowsep=[0.2], static_layout=True
+    )
+    labels = [["a", "b", "c"], ["d", "e", "f"]]
+    width, height, order, rects = fixed_size_mosaic_geometry(
+        labels, subwidth=[1, 2, 1.5], subheight=[1, 0.5], rowsep=[0.2]
+    )
+    assert order == ["a", "b", "c", "d", "e", "f"]
+    np.testing.assert_allclose((width, height), fig.get_size_inches())
+    np.testing.assert_allclose(rects, get_panel_rects(axs[::-1]).reshape(-1, 4))
+    plt.close(fig)
+
+    fig, axd = ph.fixed_size_mosaic(
+        [["A", "A", "B"], ["C", ".", [["x", "y"], ["z", "."]]]],
+        subwidth=[1, 2, 2.5],
+        subheight=[1.5, 2],
+        hmargin=0.5,
+    )
+    assert list(axd) == ["A", "B", "C", "x", "y", "z"]
+    assert len(fig.axes) == 6
+    rects = {label: get_panel_rects(ax) for label, ax in axd.items()}
+    # A spans the first two columns and the gap between them
+    np.testing.assert_allclose(rects["A"], [0.7, 3.0, 1 + 0.7 + 2, 1.5])
+    # The nested mosaic splits the cell, separated by the margins
+    np.testing.assert_allclose(rects["x"][2:], [(2.5 - 0.7) / 2, (2 - 0.5) / 2])
+    np.testing.assert_allclose(rects["y"][0], rects["x"][0] + 0.9 + 0.7)
+    np.testing.assert_allclose(rects["z"][1], 0.5)
+    assert fig.get_layout_engine().get_rect(axd["z"]) is not None
+    axd["A"].plot([0, 1])
+    fig.savefig("outputs/mosaic")
+    plt.close(fig)
+
+    for bad in ["AB;BA", "A.A", [["A", "B"], ["C"]], [["A", [["A"]]]]]:
+        with pytest.raises(ValueError):
+            fixed_size_mosaic_geometry(bad)
+    with pytest.raises(ValueError):
+        fixed_size_mosaic_geometry([[[["a", "b", "c"]]]], subwidth=1)
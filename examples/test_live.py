@@ -0,0 +1,73 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.live import FrameSink, LiveFigure
+
+x = np.linspace(0, 10, 200)
+
+
+def build_grid():
+    fig, axs = ph.fixed_size_subplots(
+        2, 2, subwidth=1, subheight=1, static_layout=True, dpi=100
+    )
+    lines = []
+    for ax in axs.flat:
+        (line,) = ax.plot(x, np.sin(x))
+        ax.set_ylim(-1.5, 1.5)
+        lines.append(line)
+    return fig, lines
+
+
+def test_live_figure():
+    fig, lines = build_grid()
+    live = LiveFigure(fig)
+    assert all(line.get_animated() for line in lines)
+    for phase in range(3):
+        for line in lines:
+            line.set_ydata(np.sin(x + phase))
+        live.update()
+    blitted = np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    # A full redraw of the final state gives the same pixels
+    reference, reference_lines = build_grid()
+    for line in reference_lines:
+        line.set_ydata(np.sin(x + 2))
+    reference.canvas.draw()
+    np.testing.assert_array_equal(blitted, np.asarray(reference.canvas.buffer_rgba()))
+
+    live.disconnect()
+    assert not any(line.get_animated() for line in lines)
+    plt.close(fig)
+    plt.close(reference)
+
+
+def test_frame_sink():
+    fig, lines = build_grid()
+    sink = FrameSink(LiveFigure(fig), directory="outputs/live-frames")
+    paths = []
+    for phase in range(3):
+        for line in lines:
+            line.set_ydata(np.sin(x + phase))
+        paths.append(sink.write())
+
+    assert sink.frames == 3
+    frames = [plt.imread(path) for path in paths]
+    assert frames[0].shape[:2] == tuple(fig.canvas.get_width_height()[::-1])
+    assert not np.array_equal(frames[0], frames[1])
+    assert all(os.path.basename(p) == f"frame_{i:05d}.png" for i, p in enumerate(paths))
+    plt.close(fig)
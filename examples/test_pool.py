@@ -0,0 +1,106 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.pool import FigurePool
+
+LAYOUT = dict(subwidth=1, subheight=1, dpi=50)
+
+
+def draw(fig, axs, scale=1.0):
+    x = np.linspace(1, 10, 50)
+    axs[0, 0].plot(x, scale * np.sin(x), label="sin")
+    axs[0, 0].legend()
+    axs[0, 1].bar([1, 2, 3], [3, 1, 2])
+    axs[0, 1].set_yscale("log")
+    axs[1, 0].scatter(x, x, c=x)
+    axs[1, 0].invert_yaxis()
+    axs[1, 1].set_aspect(1)
+    axs[1, 1].twinx().plot(x)
+    im = axs[1, 1].imshow(np.outer(x, x))
+    ph.add_shared_colorbar(im, axs)
+    axs[1, 1].set_title("Image")
+    axs[0, 0].set_xlabel("x")
+    fig.suptitle("Pooled")
+
+
+def png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("static_layout", [False, True])
+def test_pool_reuse(static_layout):
+    pool = FigurePool()
+    layout = dict(LAYOUT, nrows=2, ncols=2, static_layout=static_layout)
+
+    fig, axs = ph.fixed_size_subplots(**layout)
+    draw(fig, axs)
+    expected = png(fig)
+    plt.close(fig)
+
+    outputs = []
+    for scale in (1.0, 5.0, 1.0):
+        with pool.figure(**layout) as (fig, axs):
+            axes = list(axs.flat)
+            draw(fig, axs, scale)
+            outputs.append(png(fig))
+        assert list(fig.axes) == axes
+    assert outputs[0] == outputs[2] == expected
+    assert outputs[1] != expected
+    assert (pool.stats.hits, pool.stats.misses, pool.stats.leaks) == (2, 1, 0)
+
+    # The reset figure matches a new one
+    fig, axs = pool.acquire(**layout)
+    assert fig.axes == list(axs.flat)
+    assert axs[0, 1].get_yscale() == "linear"
+    assert axs[1, 0].get_ylim() == (0, 1)
+    assert fig._suptitle is None and not fig.texts
+    pool.release(fig)
+    pool.clear()
+
+
+def test_pool_leaks_and_eviction():
+    pool = FigurePool(maxsize=2)
+    figs = [pool.acquire(nrows=1, ncols=n, **LAYOUT)[0] for n in (1, 2, 3)]
+    for fig in figs:
+        pool.release(fig)
+    assert len(pool) == 2 and pool.stats.evictions == 1
+    assert not plt.fignum_exists(figs[0].number)
+
+    # Style stacks are part of the key
+    fig, _ = pool.acquire(style="ctleelab_plothelper.dark", nrows=1, ncols=3, **LAYOUT)
+    assert fig is not figs[2]
+    pool.release(fig)
+
+    # Categorical units cannot be reset, so the figure is discarded
+    fig, ax = pool.acquire(nrows=1, ncols=1, **LAYOUT)
+    ax.plot(["a", "b"], [1, 2])
+    pool.release(fig)
+    assert pool.stats.leaks == 1 and not plt.fignum_exists(fig.number)
+
+    strict = FigurePool(strict=True)
+    fig, ax = strict.acquire(nrows=1, ncols=1, **LAYOUT)
+    ax.tick_params(labelsize=20)
+    with pytest.raises(RuntimeError):
+        strict.release(fig)
+    with pytest.raises(KeyError):
+        pool.release(fig)
+    pool.clear()
+    assert len(pool) == 0
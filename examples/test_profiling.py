@@ -0,0 +1,75 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import io
+import json
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.profiling import (
+    disable_profiling,
+    enable_profiling,
+    profile_render,
+)
+
+
+def test_profile_render():
+    draw = Figure.draw
+    fig, axs = ph.fixed_size_subplots(2, 2, subwidth=1, subheight=1)
+    for ax in axs.flat:
+        im = ax.imshow(np.eye(4))
+    ph.add_fixed_colorbar(im, axs[0, 0])
+    other, _ = ph.fixed_size_subplots(1, 1)
+
+    with profile_render(fig) as profile:
+        fig.savefig(io.BytesIO(), format="png")
+        other.savefig(io.BytesIO(), format="png")
+
+    # Instrumentation is removed on exit
+    assert Figure.draw is draw
+    assert "draw" not in Axes.__dict__
+
+    report = json.loads(profile.to_json())
+    phases = report["phases"]
+    assert phases["savefig"]["calls"] == 1
+    # Every panel and the colorbar are placed by a locator
+    assert phases["locate"]["calls"] >= 5
+    assert phases["savefig"]["seconds"] >= phases["draw"]["seconds"]
+    assert len(report["axes"]) == 5
+    assert all(
+        stats["axes"]["calls"] == 1 and "locate" in stats
+        for stats in report["axes"].values()
+    )
+    assert "locate" in profile.summary()
+
+    plt.close(fig)
+    plt.close(other)
+
+
+def test_global_profiling():
+    fig, _ = ph.fixed_size_subplots(2, 2, static_layout=True)
+    profile = enable_profiling()
+    try:
+        fig.canvas.draw()
+        fig.canvas.draw()
+    finally:
+        disable_profiling(profile)
+    fig.canvas.draw()
+
+    assert profile.phases["draw"].calls == 2
+    assert profile.phases["layout"].calls == 2
+    assert "locate" not in profile.phases
+    plt.close(fig)
@@ -0,0 +1,72 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import gc
+import io
+import os
+import resource
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import ctleelab_plothelper.plothelpers as ph
+
+# Set to 10000 for the full soak test
+CYCLES = int(os.environ.get("CTLEELAB_MEMORY_CYCLES", 200))
+
+
+def render(fmt="png", **kwargs):
+    fig, axs = ph.fixed_size_subplots(
+        1, 2, subwidth=1, subheight=1, dpi=50, pyplot=False, **kwargs
+    )
+    axs[0].plot(np.arange(10))
+    im = axs[1].imshow(np.eye(8))
+    ph.add_fixed_colorbar(im, axs[1])
+    ph.custom_cmap("Label", ["a", "b"], ax=axs[0])
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    return fig, buf.getvalue()
+
+
+@pytest.mark.parametrize("canvas", ["agg", "pdf", "svg"])
+def test_pyplot_free(canvas):
+    plt.close("all")
+    fig, data = render(canvas=canvas)
+    assert plt.get_fignums() == []
+    assert not ph.uses_pyplot(fig)
+    assert type(fig.canvas).__name__.lower().endswith(canvas)
+    assert data.startswith(b"\x89PNG")
+    fig, svg = render("svg", canvas=canvas)
+    assert b"<svg" in svg
+
+    fig, _ = ph.fixed_size_subplots()
+    assert ph.uses_pyplot(fig)
+    plt.close(fig)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="ru_maxrss is in KiB on Linux")
+def test_pyplot_free_memory():
+    open_figures = plt.get_fignums()
+    # Warm up font, glyph and colormap caches before the baseline
+    for _ in range(max(CYCLES // 10, 20)):
+        render()
+    gc.collect()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    for _ in range(CYCLES):
+        render()
+    gc.collect()
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    assert plt.get_fignums() == open_figures
+    # A leaked figure costs several hundred KiB, so this allows no systematic leak
+    assert growth < 16 * 1024, f"peak RSS grew by {growth} KiB over {CYCLES} cycles"
@@ -0,0 +1,93 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+
+from ctleelab_plothelper.styles import compile_style, style_context
+
+style_stacks = [
+    ["ctleelab_plothelper.base", "ctleelab_plothelper.light"],
+    ["ctleelab_plothelper.base", "ctleelab_plothelper.dark"],
+    [
+        "ctleelab_plothelper.base",
+        "ctleelab_plothelper.light",
+        "ctleelab_plothelper.transparent",
+    ],
+]
+
+
+def test_style_context():
+    before = dict(mpl.rcParams)
+    for stack in style_stacks:
+        with plt.style.context(stack):
+            expected = dict(mpl.rcParams)
+        with style_context(stack):
+            assert dict(mpl.rcParams) == expected
+            mpl.rcParams["lines.linewidth"] = 10
+        assert dict(mpl.rcParams) == before
+
+    # "default" resets to the default rcParams as in matplotlib.style.use
+    for stack in ("default", "mpl20", ["ctleelab_plothelper.dark", "default"]):
+        with style_context(style_stacks[1]):
+            with plt.style.context(stack):
+                expected = dict(mpl.rcParams)
+            with style_context(stack):
+                assert dict(mpl.rcParams) == expected
+
+    # Compiled stacks are cached
+    assert compile_style(style_stacks[0]) is compile_style(list(style_stacks[0]))
+    assert compile_style(style_stacks[0])["figure.dpi"] == 600
+
+
+def test_draft_publish():
+    import numpy as np
+    import ctleelab_plothelper.plothelpers as ph
+    from ctleelab_plothelper.draft import draft, publish
+
+    with style_context(style_stacks[0]):
+        with draft():
+            fig, ax = ph.fixed_size_subplots(1, 1, subwidth=1.5, subheight=1.5)
+            assert fig.dpi == 100
+            assert mpl.rcParams["path.simplify_threshold"] == 1.0
+
+            x = np.linspace(0, 100, 100_000)
+            ax.plot(x, np.sin(x))
+            fig.savefig("outputs/draft-plot.png")
+            width, height = fig.get_size_inches()
+            assert plt.imread("outputs/draft-plot.png").shape[:2] == (
+                round(height * 100),
+                round(width * 100),
+            )
+
+            results = publish(fig, "outputs/publish-plot", formats=["png"])
+            assert plt.imread(results["png"].path).shape[:2] == (
+                round(height * 600),
+                round(width * 600),
+            )
+            assert fig.dpi == 100
+
+            # The published figure keeps its layout and matches a direct savefig
+            publication = compile_style("ctleelab_plothelper.base")
+            rc = {
+                key: publication.get(key, mpl.rcParamsDefault[key])
+                for key in compile_style("ctleelab_plothelper.draft")
+            }
+            with style_context(rc):
+                for line in ax.get_lines():
+                    line.recache_always()
+                fig.savefig("outputs/publish-direct.png", dpi=600)
+            np.testing.assert_array_equal(
+                plt.imread(results["png"].path),
+                plt.imread("outputs/publish-direct.png"),
+            )
+        plt.close(fig)
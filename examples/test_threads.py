@@ -0,0 +1,123 @@
+#
+# ctleelab-mpl-utilities: A collection of utilities for plotting with matplotlib
+#
+# Copyright 2025- ctleelab
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# Please help us support development by citing the research
+# papers on the package. Check out https://github.com/ctleelab/ctleelab-mpl-utilities/
+# for more information.
+
+import io
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ctleelab_plothelper.plothelpers as ph
+from ctleelab_plothelper.export import save_all
+from ctleelab_plothelper.pool import FigurePool
+from ctleelab_plothelper.styles import style_context
+
+FIGURES = int(os.environ.get("CTLEELAB_THREAD_FIGURES", 120))
+STYLE = ["ctleelab_plothelper.base", "ctleelab_plothelper.light"]
+
+
+def draw(i, fig, axs):
+    rng = np.random.default_rng(i)
+    x = np.linspace(0, 10, 100)
+    axs[0].plot(x, np.sin(x + i), label=f"figure {i}")
+    axs[0].legend()
+    im = axs[1].imshow(rng.random((16, 16)), cmap="magma")
+    if i % 3 == 0:
+        ph.add_fixed_colorbar(im, axs[1])
+    elif i % 3 == 1:
+        ph.add_colorbar(im, axs[1])
+    else:
+        ph.custom_cmap("Category", ["a", "b", "c"], ax=axs[1])
+    axs[1].set_title(str(i))
+
+
+def render(i, tmp_path=None):
+    fig, axs = ph.fixed_size_subplots(
+        1, 2, subwidth=1, subheight=1, dpi=40, pyplot=False
+    )
+    draw(i, fig, axs)
+    if tmp_path is not None and i % 10 == 0:
+        results = save_all(fig, str(tmp_path / f"fig{i}"), ["svg"], deterministic=True)
+        with open(results["svg"].path, "rb") as f:
+            return f.read()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+
+def reference(i):
+    """Render a figure with a plain savefig in the format used by `render`."""
+    fig, axs = ph.fixed_size_subplots(
+        1, 2, subwidth=1, subheight=1, dpi=40, pyplot=False
+    )
+    draw(i, fig, axs)
+    buf = io.BytesIO()
+    if i % 10 == 0:
+        with plt.rc_context({"svg.hashsalt": "ctleelab_plothelper"}):
+            fig.savefig(buf, format="svg", metadata={"Date": None})
+    else:
+        fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+
+def test_threaded_rendering(tmp_path):
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "threaded").mkdir()
+    open_figures = plt.get_fignums()
+    with style_context(STYLE):
+        serial = [render(i, tmp_path / "serial") for i in range(FIGURES)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            threaded = list(
+                executor.map(lambda i: render(i, tmp_path / "threaded"), range(FIGURES))
+            )
+        expected = [reference(i) for i in range(FIGURES)]
+    assert plt.get_fignums() == open_figures
+    assert [i for i, (a, b) in enumerate(zip(serial, expected)) if a != b] == []
+    mismatched = [i for i, (a, b) in enumerate(zip(serial, threaded)) if a != b]
+    assert mismatched == []
+
+
+def test_colorbar_current_figure():
+    fig, axs = ph.fixed_size_subplots(1, 2, subwidth=1, subheight=1)
+    other, _ = ph.fixed_size_subplots()
+    im = axs[0].imshow(np.eye(4))
+    ph.add_colorbar(im, axs[0])
+    assert plt.gcf() is other and fig.gca() is axs[0]
+    cbar = ph.add_fixed_colorbar(axs[1].imshow(np.eye(4)), axs[1])
+    assert plt.gcf() is other and fig.gca() is cbar.ax
+    plt.close(fig)
+    plt.close(other)
+
+
+def test_threaded_pool():
+    pool = FigurePool(maxsize=8)
+    layout = dict(nrows=1, ncols=2, subwidth=1, subheight=1, dpi=40, pyplot=False)
+
+    def pooled(i):
+        fig, axs = pool.acquire(**layout)
+        try:
+            draw(i, fig, axs)
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png")
+            return buf.getvalue()
+        finally:
+            pool.release(fig)
+
+    count = FIGURES // 4
+    serial = [pooled(i) for i in range(count)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(pooled, range(count)))
+    assert serial == threaded
+    assert pool.stats.hits > 0 and pool.stats.leaks == 0
+    assert len(pool) <= pool.maxsize